@@ -90,8 +90,12 @@ class BaseAgent(Generic[InputT, OutputT], ABC):
     def _default_execution_mode(self) -> ExecutionMode:
         return ExecutionMode.SYNC
 
-    def validate_output(self, payload: dict[str, Any]) -> AgentOutput:
-        return self.execution_kernel.validate_output(payload, LifecyclePhase.RUN)
+    def validate_output(
+        self, payload: dict[str, Any], trusted: bool = False
+    ) -> AgentOutput:
+        return self.execution_kernel.validate_output(
+            payload, LifecyclePhase.RUN, trusted=trusted
+        )
 
     def _coerce_to_contract_output(self, validated: AgentOutput) -> AgentOutputSchema:
         """Convert internal AgentOutput to the shared contract schema."""
@@ -139,6 +143,23 @@ class BaseAgent(Generic[InputT, OutputT], ABC):
         updated["feedback"] = feedback
         return updated
 
+    def _revise_payload_input(
+        self, feedback: dict[str, Any], context: AgentInput
+    ) -> AgentInput | dict[str, Any]:
+        """Revise an AgentInput without round-tripping through a dict.
+
+        Agents that override ``_revise_payload`` keep their dict-based hook.
+        """
+        if type(self)._revise_payload is not BaseAgent._revise_payload:
+            return self._revise_payload(
+                feedback, self.execution_kernel.normalize_context_mutable(context)
+            )
+        if "feedback" in context.payload:
+            return context
+        return context.model_copy(
+            update={"payload": {**context.payload, "feedback": feedback}}
+        )
+
     def error_payload(
         self,
         msg: str,
@@ -229,4 +250,4 @@ class BaseAgent(Generic[InputT, OutputT], ABC):
 
         Subclasses can override to release resources.
         """
-        return None
+        await self.execution_kernel.flush_pending_logs()
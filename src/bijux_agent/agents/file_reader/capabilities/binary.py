@@ -8,6 +8,8 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any
 
+from bijux_agent.utilities.optional_deps import require_dependency
+
 pdfminer: ModuleType | None = None
 PyPDF2: ModuleType | None = None
 pytesseract: ModuleType | None = None
@@ -55,12 +57,6 @@ except ImportError:
     HAS_FITZ = False
 
 
-def _require_dependency(module: ModuleType | None, name: str) -> ModuleType:
-    if module is None:
-        raise RuntimeError(f"{name} dependency is required but not installed")
-    return module
-
-
 IMAGE_EXTENSIONS: set[str] = {
     ".jpg",
     ".jpeg",
@@ -98,7 +94,7 @@ class BinaryExtractor:
         if HAS_PDFMINER and not text.strip():
             try:
                 loop = asyncio.get_running_loop()
-                _require_dependency(pdfminer, "pdfminer")
+                require_dependency(pdfminer, "pdfminer")
                 text = await loop.run_in_executor(
                     None, lambda: pdfminer.high_level.extract_text(str(file_path))
                 )
@@ -108,7 +104,7 @@ class BinaryExtractor:
         if HAS_PYPDF2 and not text.strip():
             try:
                 with open(file_path, "rb") as file:
-                    _require_dependency(PyPDF2, "PyPDF2")
+                    require_dependency(PyPDF2, "PyPDF2")
                     reader = PyPDF2.PdfReader(file)
                     page_count = len(reader.pages)
                     pages_to_process = min(self.max_pdf_pages, page_count)
@@ -149,8 +145,8 @@ class BinaryExtractor:
             }
 
         try:
-            _require_dependency(fitz, "PyMuPDF")
-            _require_dependency(pytesseract, "pytesseract")
+            require_dependency(fitz, "PyMuPDF")
+            require_dependency(pytesseract, "pytesseract")
             loop = asyncio.get_running_loop()
             doc = await loop.run_in_executor(None, lambda: fitz.open(str(file_path)))
             ocr_chunks = []
@@ -203,7 +199,7 @@ class BinaryExtractor:
                 and isinstance(height, int)
                 and isinstance(samples, (bytes, bytearray))
             ):
-                _require_dependency(Image, "Pillow")
+                require_dependency(Image, "Pillow")
                 return Image.frombytes(mode, (width, height), samples)
             return None
         except (AttributeError, ValueError, TypeError):
@@ -220,8 +216,8 @@ class BinaryExtractor:
             }
 
         try:
-            _require_dependency(Image, "Pillow")
-            _require_dependency(pytesseract, "pytesseract")
+            require_dependency(Image, "Pillow")
+            require_dependency(pytesseract, "pytesseract")
             loop = asyncio.get_running_loop()
             img = await loop.run_in_executor(None, lambda: Image.open(file_path))
             ocr_text = await loop.run_in_executor(
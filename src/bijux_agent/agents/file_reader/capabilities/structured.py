@@ -9,6 +9,8 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any
 
+from bijux_agent.utilities.optional_deps import require_dependency
+
 pd: ModuleType | None = None
 yaml: ModuleType | None = None
 ET: ModuleType | None = None
@@ -38,16 +40,37 @@ except ImportError:
     HAS_XML = False
 
 
-def _require_dependency(module: ModuleType | None, name: str) -> ModuleType:
-    if module is None:
-        raise RuntimeError(f"{name} dependency is required but not installed")
-    return module
-
-
 YAML_EXTENSIONS: set[str] = {".yaml", ".yml"}
 XML_EXTENSIONS: set[str] = {".xml"}
 
 
+def analyze_json_structure(data: Any, max_depth: int = 3) -> dict[str, Any]:
+    """Describe the shape of parsed JSON-like data up to ``max_depth`` levels."""
+    if max_depth <= 0:
+        return {"type": type(data).__name__, "truncated": True}
+
+    if isinstance(data, dict):
+        return {
+            "type": "object",
+            "keys": list(data.keys())[:10],  # Limit to first 10 keys
+            "key_count": len(data),
+            "sample_values": {
+                key: analyze_json_structure(value, max_depth - 1)
+                for key, value in list(data.items())[:3]
+            },
+        }
+    elif isinstance(data, list):
+        return {
+            "type": "array",
+            "length": len(data),
+            "sample_items": [
+                analyze_json_structure(item, max_depth - 1) for item in data[:3]
+            ],
+        }
+    else:
+        return {"type": type(data).__name__, "value": str(data)[:100]}
+
+
 class StructuredExtractor:
     """Capability module for structured file extraction."""
 
@@ -67,6 +90,7 @@ class StructuredExtractor:
             return {
                 "parsed": parsed_data,
                 "data_type": type(parsed_data).__name__,
+                "structure": analyze_json_structure(parsed_data),
                 "file_info": file_info,
             }
         except json.JSONDecodeError as e:
@@ -97,7 +121,7 @@ class StructuredExtractor:
                 for encoding in ["utf-8", "latin1", "cp1252"]:
                     try:
                         loop = asyncio.get_running_loop()
-                        _require_dependency(pd, "pandas")
+                        require_dependency(pd, "pandas")
                         df = await loop.run_in_executor(
                             None,
                             pd.read_csv(
@@ -149,11 +173,12 @@ class StructuredExtractor:
 
         try:
             with open(file_path, encoding="utf-8") as f:
-                _require_dependency(yaml, "PyYAML")
+                require_dependency(yaml, "PyYAML")
                 parsed_data = yaml.safe_load(f)
             return {
                 "parsed": parsed_data,
                 "data_type": type(parsed_data).__name__,
+                "structure": analyze_json_structure(parsed_data),
                 "file_info": file_info,
             }
         except yaml.YAMLError as e:
@@ -185,13 +210,14 @@ class StructuredExtractor:
             }
 
         try:
-            _require_dependency(ET, "xml.etree.ElementTree")
+            require_dependency(ET, "xml.etree.ElementTree")
             tree = ET.parse(file_path)  # nosec B314
             root = tree.getroot()
             xml_dict = self._xml_to_dict(root)
             return {
                 "parsed": xml_dict,
                 "root_tag": root.tag,
+                "structure": analyze_json_structure(xml_dict),
                 "file_info": file_info,
             }
         except ET.ParseError as e:
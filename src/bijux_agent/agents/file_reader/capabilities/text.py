@@ -8,6 +8,8 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any
 
+from bijux_agent.utilities.optional_deps import require_dependency
+
 docx: ModuleType | None = None
 try:
     import docx as _docx
@@ -18,12 +20,6 @@ except ImportError:
     HAS_DOCX = False
 
 
-def _require_dependency(module: ModuleType | None, name: str) -> ModuleType:
-    if module is None:
-        raise RuntimeError(f"{name} dependency is required but not installed")
-    return module
-
-
 TEXT_EXTENSIONS: set[str] = {".txt", ".md", ".rst", ".log"}
 DOCX_EXTENSIONS: set[str] = {".docx"}
 
@@ -85,7 +81,7 @@ class TextExtractor:
 
         try:
             loop = asyncio.get_running_loop()
-            _require_dependency(docx, "python-docx")
+            require_dependency(docx, "python-docx")
             doc = await loop.run_in_executor(None, lambda: docx.Document(file_path))
             paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
             text = "\n".join(paragraphs)
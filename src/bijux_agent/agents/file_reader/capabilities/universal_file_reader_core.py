@@ -10,9 +10,13 @@ designed to be used by FileReaderAgent.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 import hashlib
+import io
+import mmap
+import os
 from pathlib import Path
+import stat
 import time
 from typing import Any, ClassVar
 import unicodedata
@@ -33,6 +37,7 @@ from .structured import (
     HAS_XML,
     HAS_YAML,
     StructuredExtractor,
+    analyze_json_structure,
 )
 from .structured import (
     XML_EXTENSIONS as STRUCTURED_XML_EXTENSIONS,
@@ -68,13 +73,18 @@ class UniversalFileReader:
     DEFAULT_MAX_PDF_PAGES = 1000
     DEFAULT_MAX_FILE_BYTES = 100 * 1024 * 1024  # 100 MB
     DEFAULT_CHUNK_SIZE = 65536  # 64 KB
+    # Hashing buffers of 256 KiB - 1 MiB are close to optimal on NVMe/large files.
+    MIN_HASH_BUFFER_SIZE = 256 * 1024  # 256 KiB
+    WINDOWS_HASH_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+    DEFAULT_MMAP_THRESHOLD = 64 * 1024 * 1024  # 64 MB
+    DEFAULT_READ_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
 
     # Supported file extensions
-    TEXT_EXTENSIONS: ClassVar[set[str]] = set(TEXT_FILE_EXTENSIONS)
-    IMAGE_EXTENSIONS: ClassVar[set[str]] = set(BINARY_IMAGE_EXTENSIONS)
-    YAML_EXTENSIONS: ClassVar[set[str]] = set(STRUCTURED_YAML_EXTENSIONS)
-    XML_EXTENSIONS: ClassVar[set[str]] = set(STRUCTURED_XML_EXTENSIONS)
-    DOCX_EXTENSIONS: ClassVar[set[str]] = set(TEXT_DOCX_EXTENSIONS)
+    TEXT_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(TEXT_FILE_EXTENSIONS)
+    IMAGE_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(BINARY_IMAGE_EXTENSIONS)
+    YAML_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(STRUCTURED_YAML_EXTENSIONS)
+    XML_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(STRUCTURED_XML_EXTENSIONS)
+    DOCX_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(TEXT_DOCX_EXTENSIONS)
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the UniversalFileReader with configuration.
@@ -91,6 +101,9 @@ class UniversalFileReader:
             "max_file_bytes", self.DEFAULT_MAX_FILE_BYTES
         )
         self.chunk_size = self._get_config_int("chunk_size", self.DEFAULT_CHUNK_SIZE)
+        self.mmap_threshold = self._get_config_int(
+            "mmap_threshold", self.DEFAULT_MMAP_THRESHOLD
+        )
         self.ocr_enabled = self._get_config_bool("ocr_enabled", False)
         self._custom_extractors: dict[
             str, Callable[[str], Awaitable[dict[str, Any]]]
@@ -144,6 +157,9 @@ class UniversalFileReader:
     async def _compute_file_hash(self, path: str | Path) -> str:
         """Compute SHA256 hash of a file asynchronously.
 
+        Files up to ``mmap_threshold`` bytes are memory-mapped and hashed in a
+        worker thread in a single update; larger files are read in chunks.
+
         Args:
             path: Path to the file.
 
@@ -152,18 +168,57 @@ class UniversalFileReader:
         """
         hash_obj = hashlib.sha256()
         try:
-            with open(path, "rb") as f:
+            with open(path, "rb", buffering=0) as f:
+                file_stat = os.fstat(f.fileno())
+                if file_stat.st_size <= self.mmap_threshold:
+                    return await asyncio.to_thread(
+                        self._hash_mapped_file, f.fileno(), file_stat.st_size
+                    )
+                buffer = bytearray(self._hash_buffer_size(file_stat))
+                view = memoryview(buffer)
                 while True:
-                    chunk = f.read(self.chunk_size)
-                    if not chunk:
+                    read = f.readinto(buffer)
+                    if not read:
                         break
-                    hash_obj.update(chunk)
+                    hash_obj.update(view[:read])
                     # Yield control to the event loop for large files
                     await asyncio.sleep(0)
             return hash_obj.hexdigest()
         except Exception:
             return ""
 
+    @staticmethod
+    def _hash_mapped_file(fileno: int, size: int) -> str:
+        """Hash an open file through a read-only memory map.
+
+        Args:
+            fileno: Descriptor of the open file.
+            size: File size in bytes.
+
+        Returns:
+            Hexadecimal hash string.
+        """
+        if size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha256(mapped).hexdigest()
+
+    def _hash_buffer_size(self, file_stat: os.stat_result) -> int:
+        """Pick a read buffer size for hashing based on the filesystem block size.
+
+        Args:
+            file_stat: Stat result of the file being hashed.
+
+        Returns:
+            Buffer size in bytes, never smaller than the configured chunk size.
+        """
+        if os.name == "nt":
+            return max(self.chunk_size, self.WINDOWS_HASH_BUFFER_SIZE)
+        block_size = getattr(file_stat, "st_blksize", 0) or io.DEFAULT_BUFFER_SIZE
+        return max(self.chunk_size, block_size * 16, self.MIN_HASH_BUFFER_SIZE)
+
     @staticmethod
     def _normalize_text(text: str) -> str:
         """Clean and normalize text content.
@@ -183,25 +238,28 @@ class UniversalFileReader:
         # Clean up whitespace
         return " ".join(normalized.split())
 
-    async def _create_file_audit(self, file_path: str | Path) -> dict[str, Any]:
+    async def _create_file_audit(
+        self, file_path: str | Path, stat_result: os.stat_result | None = None
+    ) -> dict[str, Any]:
         """Create audit information for a file asynchronously.
 
         Args:
             file_path: Path to the file.
+            stat_result: Stat result already obtained by the caller, if any.
 
         Returns:
             Dictionary containing file metadata.
         """
         path_obj = Path(file_path)
         try:
-            stat = path_obj.stat()
+            st = stat_result if stat_result is not None else path_obj.stat()
             file_hash = await self._compute_file_hash(path_obj)
             return {
                 "file_name": path_obj.name,
-                "file_size_bytes": stat.st_size,
+                "file_size_bytes": st.st_size,
                 "file_hash": file_hash,
                 "last_modified": time.strftime(
-                    "%Y-%m-%dT%H:%M:%SZ", time.gmtime(stat.st_mtime)
+                    "%Y-%m-%dT%H:%M:%SZ", time.gmtime(st.st_mtime)
                 ),
             }
         except Exception as e:
@@ -286,19 +344,19 @@ class UniversalFileReader:
             }
 
     def _create_structure_preview(
-        self, extension: str, result: dict[str, Any]
+        self, ext: str, fmt: str, result: dict[str, Any]
     ) -> dict[str, Any]:
         """Create a structural preview of the file content.
 
         Args:
-            extension: File extension.
+            ext: Lowercased file extension, including the leading dot.
+            fmt: Format name (the extension without the leading dot).
             result: Extraction result.
 
         Returns:
             Dictionary containing structural information.
         """
-        ext = extension.lower()
-        preview: dict[str, Any] = {"format": ext.lstrip(".")}
+        preview: dict[str, Any] = {"format": fmt}
 
         if ext in self.TEXT_EXTENSIONS and "text" in result:
             lines = result["text"].splitlines()
@@ -323,7 +381,7 @@ class UniversalFileReader:
             preview.update(
                 {
                     "data_type": result.get("data_type", "unknown"),
-                    "structure": self._analyze_json_structure(result["parsed"]),
+                    "structure": self._parsed_structure(result),
                     "sections": [],
                     "tables": [],
                     "images": [],
@@ -349,7 +407,7 @@ class UniversalFileReader:
             preview.update(
                 {
                     "data_type": result.get("data_type", "unknown"),
-                    "structure": self._analyze_json_structure(result["parsed"]),
+                    "structure": self._parsed_structure(result),
                     "sections": [],
                     "tables": [],
                     "images": [],
@@ -359,7 +417,7 @@ class UniversalFileReader:
             preview.update(
                 {
                     "root_tag": result.get("root_tag"),
-                    "structure": self._analyze_json_structure(result["parsed"]),
+                    "structure": self._parsed_structure(result),
                     "sections": [],
                     "tables": [],
                     "images": [],
@@ -420,76 +478,63 @@ class UniversalFileReader:
         Returns:
             Dictionary describing the structure.
         """
-        if max_depth <= 0:
-            return {"type": type(data).__name__, "truncated": True}
+        return analyze_json_structure(data, max_depth)
 
-        if isinstance(data, dict):
-            return {
-                "type": "object",
-                "keys": list(data.keys())[:10],  # Limit to first 10 keys
-                "key_count": len(data),
-                "sample_values": {
-                    key: UniversalFileReader._analyze_json_structure(
-                        value, max_depth - 1
-                    )
-                    for key, value in list(data.items())[:3]
-                },
-            }
-        elif isinstance(data, list):
-            return {
-                "type": "array",
-                "length": len(data),
-                "sample_items": [
-                    UniversalFileReader._analyze_json_structure(item, max_depth - 1)
-                    for item in data[:3]
-                ],
-            }
-        else:
-            return {"type": type(data).__name__, "value": str(data)[:100]}
+    def _parsed_structure(self, result: dict[str, Any]) -> dict[str, Any]:
+        """Return the structure computed at extraction time, if any.
 
-    async def read_file(self, file_path: str | Path) -> dict[str, Any]:
+        Built-in extractors attach ``structure`` while parsing; custom extractors
+        that only return ``parsed`` fall back to a fresh analysis.
+        """
+        structure: dict[str, Any] | None = result.get("structure")
+        if structure is not None:
+            return structure
+        return self._analyze_json_structure(result["parsed"])
+
+    async def read_file(
+        self, file_path: str | Path, include_preview: bool = True
+    ) -> dict[str, Any]:
         """Main method to process a file and extract its content asynchronously.
 
         Args:
             file_path: Path to the file to read.
+            include_preview: Build the full ``structure_preview``. When False only
+                the format is reported, skipping the preview pass over the content.
 
         Returns:
             Dictionary containing extraction results, metadata, and audit information.
         """
         file_path = Path(file_path)
 
-        # Validate file exists
-        if not file_path.exists():
+        # Validate the path with a single stat call
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return {
                 "error": f"File not found: {file_path}",
                 "action_plan": ["Verify the file path and ensure the file exists"],
             }
+        except Exception as e:
+            return {
+                "error": f"Could not access file: {e}",
+                "action_plan": ["Verify file permissions and accessibility"],
+            }
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {
                 "error": f"Path is not a file: {file_path}",
                 "action_plan": ["Provide a path to a file, not a directory"],
             }
 
         # Check file size
-        try:
-            file_size = file_path.stat().st_size
-            if file_size > self.max_file_bytes:
-                file_info = await self._create_file_audit(file_path)
-                return {
-                    "error": (
-                        f"File too large: {file_size} bytes "
-                        f"(limit: {self.max_file_bytes})"
-                    ),
-                    "file_info": file_info,
-                    "action_plan": [
-                        "Reduce file size or increase max_file_bytes limit"
-                    ],
-                }
-        except Exception as e:
+        if st.st_size > self.max_file_bytes:
+            file_info = await self._create_file_audit(file_path, st)
             return {
-                "error": f"Could not access file: {e}",
-                "action_plan": ["Verify file permissions and accessibility"],
+                "error": (
+                    f"File too large: {st.st_size} bytes (limit: {self.max_file_bytes})"
+                ),
+                "file_info": file_info,
+                "action_plan": ["Reduce file size or increase max_file_bytes limit"],
             }
 
         # Start processing
@@ -545,7 +590,11 @@ class UniversalFileReader:
                         extension, custom_extractor
                     ),
                 },
-                "structure_preview": self._create_structure_preview(extension, result),
+                "structure_preview": (
+                    self._create_structure_preview(extension, file_type, result)
+                    if include_preview
+                    else {"format": file_type}
+                ),
                 "audit_trail": {
                     "file_path": str(file_path),
                     "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
@@ -562,13 +611,44 @@ class UniversalFileReader:
 
         return result
 
+    async def read_files(
+        self,
+        paths: Iterable[str | Path],
+        concurrency: int | None = None,
+        include_preview: bool = True,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Read several files concurrently with bounded parallelism.
+
+        Args:
+            paths: Paths of the files to read.
+            concurrency: Maximum number of files processed at once. Defaults to
+                ``DEFAULT_READ_CONCURRENCY``.
+            include_preview: Forwarded to ``read_file``.
+
+        Returns:
+            One entry per path, in input order: the ``read_file`` result, or the
+            exception raised while reading that path.
+        """
+        limit = (
+            concurrency if concurrency is not None else self.DEFAULT_READ_CONCURRENCY
+        )
+        semaphore = asyncio.Semaphore(max(1, limit))
+
+        async def _read_one(path: str | Path) -> dict[str, Any]:
+            async with semaphore:
+                return await self.read_file(path, include_preview=include_preview)
+
+        return await asyncio.gather(
+            *(_read_one(path) for path in paths), return_exceptions=True
+        )
+
     def _get_processing_method(
         self, extension: str, custom_extractor: Callable | None
     ) -> str:
         """Get the processing method used for a given file extension.
 
         Args:
-            extension: File extension.
+            extension: Lowercased file extension, including the leading dot.
             custom_extractor: Custom extractor function, if any.
 
         Returns:
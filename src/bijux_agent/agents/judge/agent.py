@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from statistics import mean
+from types import ModuleType
 from typing import Any
 
 from bijux_agent.agents.base import BaseAgent
@@ -11,6 +11,19 @@ from bijux_agent.constants import CONTRACT_VERSION
 from bijux_agent.enums import DecisionOutcome, FailureMode
 from bijux_agent.models.contract import AgentOutputSchema
 from bijux_agent.schema import AgentOutput
+from bijux_agent.schema.models import AGENT_OUTPUTS_ADAPTER
+from bijux_agent.utilities.optional_deps import require_dependency
+
+np: ModuleType | None = None
+try:
+    import numpy as _np
+
+    np = _np
+except ImportError:
+    pass
+
+# Below this many (output, label) cells the plain loop beats array setup costs.
+VECTORIZE_MIN_CELLS = 4096
 
 
 class JudgeAgent(BaseAgent):
@@ -26,8 +39,8 @@ class JudgeAgent(BaseAgent):
                 "No candidate outputs provided",
                 None,
             )
-        outputs = [AgentOutput(**entry) for entry in raw_outputs]
-        aggregated = self._aggregate_scores(outputs)
+        outputs = AGENT_OUTPUTS_ADAPTER.validate_python(raw_outputs)
+        aggregated, total_weight = self._aggregate_scores(outputs)
         decision = (
             DecisionOutcome.VETO
             if aggregated.get("risk", 0.0) >= 0.5
@@ -37,7 +50,7 @@ class JudgeAgent(BaseAgent):
             "text": "JUDGMENT_COMPLETE",
             "artifacts": {"aggregated_scores": aggregated},
             "scores": aggregated,
-            "confidence": min(1.0, mean(o.confidence for o in outputs)),
+            "confidence": min(1.0, total_weight / len(outputs)),
             "metadata": {
                 "decision": decision.value,
                 "normalized": True,
@@ -49,8 +62,17 @@ class JudgeAgent(BaseAgent):
         validated = self.validate_output(output)
         return self._coerce_to_contract_output(validated)
 
-    def _aggregate_scores(self, outputs: list[AgentOutput]) -> dict[str, float]:
-        """Compute a weighted average of each score label."""
+    def _aggregate_scores(
+        self, outputs: list[AgentOutput]
+    ) -> tuple[dict[str, float], float]:
+        """Compute a weighted average of each score label.
+
+        Returns the averaged scores together with the summed confidence weight so
+        callers can derive the mean confidence without another pass.
+        """
+        labels = list(dict.fromkeys(label for o in outputs for label in o.scores))
+        if np is not None and len(outputs) * len(labels) >= VECTORIZE_MIN_CELLS:
+            return self._aggregate_scores_vectorized(outputs, labels)
         weighted = defaultdict(float)
         total_weight = 0.0
         for entry in outputs:
@@ -64,4 +86,32 @@ class JudgeAgent(BaseAgent):
                 "All scores lack confidence",
                 None,
             )
-        return {label: min(1.0, weighted[label] / total_weight) for label in weighted}
+        aggregated = {
+            label: min(1.0, weighted[label] / total_weight) for label in weighted
+        }
+        return aggregated, total_weight
+
+    def _aggregate_scores_vectorized(
+        self, outputs: list[AgentOutput], labels: list[str]
+    ) -> tuple[dict[str, float], float]:
+        """NumPy variant of ``_aggregate_scores`` for large output/label grids."""
+        numpy = require_dependency(np, "numpy")
+        weights = numpy.fromiter(
+            (o.confidence for o in outputs), dtype=numpy.float64, count=len(outputs)
+        )
+        total_weight = float(weights.sum())
+        if total_weight == 0:
+            self.execution_kernel.fail(
+                FailureMode.VALIDATION_ERROR,
+                "All scores lack confidence",
+                None,
+            )
+        column = {label: index for index, label in enumerate(labels)}
+        matrix = numpy.zeros((len(outputs), len(labels)), dtype=numpy.float64)
+        for row, entry in enumerate(outputs):
+            if entry.scores:
+                matrix[row, [column[label] for label in entry.scores]] = list(
+                    entry.scores.values()
+                )
+        averaged = numpy.minimum(1.0, (weights @ matrix) / total_weight)
+        return dict(zip(labels, averaged.tolist(), strict=True)), total_weight
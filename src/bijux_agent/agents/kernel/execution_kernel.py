@@ -2,14 +2,54 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+import asyncio
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from bijux_agent.agents.kernel.lifecycle import LifecyclePhase
 from bijux_agent.enums import AgentStatus, FailureMode
 from bijux_agent.schema import AgentInput, AgentOutput
+from bijux_agent.schema.models import AGENT_OUTPUTS_ADAPTER
 
 OutputT = TypeVar("OutputT")
 
+# Module-level bindings for the default phases used on every kernel entry.
+_RUN = LifecyclePhase.RUN
+_FAIL = LifecyclePhase.FAIL
+_REVISE = LifecyclePhase.REVISE
+
+# Context keys that map onto AgentInput fields rather than payload entries.
+_RESERVED_KEYS: frozenset[str] = frozenset(
+    (
+        "task_goal",
+        "payload",
+        "context_id",
+        "metadata",
+        "agent_type",
+        "execution_mode",
+    )
+)
+
+# Exact-type wrappers turning shorthand revise feedback into a feedback dict.
+_FEEDBACK_WRAPPERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    str: lambda feedback: {"message": feedback},
+    list: lambda feedback: {"messages": feedback},
+}
+
+# Lifecycle state bits tracked by the kernel.
+_SEEN_RUN = 0b01
+_SEEN_FAIL = 0b10
+
+# (forbidden_mask, required_mask, set_mask, violation) indexed by LifecyclePhase.
+_FSM_TABLE: tuple[tuple[int, int, int, str | None], ...] = (
+    (0, 0, 0, None),  # INIT
+    (_SEEN_FAIL, 0, _SEEN_RUN, "RUN cannot occur after FAIL"),  # RUN
+    (0, _SEEN_RUN, 0, "REVISE requires prior RUN"),  # REVISE
+    (0, 0, _SEEN_FAIL, None),  # FAIL
+    (0, 0, 0, None),  # SHUTDOWN
+)
+
 if TYPE_CHECKING:
     from bijux_agent.agents.base import BaseAgent
 
@@ -17,26 +57,23 @@ if TYPE_CHECKING:
 class AgentExecutionKernel(Generic[OutputT]):
     """Shared execution helpers (validation, error handling) for agents."""
 
+    __slots__ = ("_agent", "_pending_logs", "_state")
+
+    _FAIL_PREFIX: ClassVar[dict[FailureMode, str]] = {
+        mode: f"{mode.value}: " for mode in FailureMode
+    }
+
     def __init__(self, agent: BaseAgent[Any, OutputT]) -> None:
         self._agent = agent
-        self._seen_run = False
-        self._seen_fail = False
+        self._state = 0
+        self._pending_logs: set[asyncio.Task[None]] = set()
 
     def _record_phase(self, phase: LifecyclePhase) -> None:
-        if phase is LifecyclePhase.RUN and self._seen_fail:
-            raise RuntimeError("Lifecycle violation: RUN cannot occur after FAIL")
-        if phase is LifecyclePhase.REVISE and not self._seen_run:
-            raise RuntimeError("Lifecycle violation: REVISE requires prior RUN")
-        if phase is LifecyclePhase.RUN:
-            self._seen_run = True
-        if phase is LifecyclePhase.FAIL:
-            self._seen_fail = True
-
-    @staticmethod
-    def _resolve_phase(
-        phase: LifecyclePhase | None, default: LifecyclePhase
-    ) -> LifecyclePhase:
-        return phase or default
+        forbidden, required, set_mask, violation = _FSM_TABLE[phase]
+        state = self._state
+        if state & forbidden or (state & required) != required:
+            raise RuntimeError(f"Lifecycle violation: {violation}")
+        self._state = state | set_mask
 
     def normalize_context(
         self,
@@ -46,43 +83,50 @@ class AgentExecutionKernel(Generic[OutputT]):
         """Normalize input to the prior dict shape used by agents."""
         _ = phase
         if isinstance(context, AgentInput):
-            normalized = {
+            payload = dict(context.payload)
+            return {
                 "task_goal": context.task_goal,
-                "payload": dict(context.payload),
+                "payload": payload,
                 "context_id": context.context_id,
                 "metadata": dict(context.metadata),
                 "agent_type": context.agent_type,
                 "execution_mode": context.execution_mode,
+                **payload,
             }
-            normalized.update(dict(context.payload))
-            return normalized
         return dict(context)
 
+    def normalize_context_mutable(
+        self, context: AgentInput | dict[str, Any]
+    ) -> dict[str, Any]:
+        """Normalize input into a dict owned by the caller.
+
+        ``normalize_context`` already builds fresh ``payload`` and ``metadata``
+        dicts for an AgentInput, so edits never reach the instance.
+        """
+        return self.normalize_context(context)
+
     def validate_context(
         self,
         context: AgentInput | dict[str, Any],
         phase: LifecyclePhase | None = None,
     ) -> AgentInput:
         """Ensure the context satisfies minimal requirements."""
-        self._record_phase(self._resolve_phase(phase, LifecyclePhase.RUN))
+        self._record_phase(_RUN if phase is None else phase)
+        return self._coerce_context(context)
+
+    def _coerce_context(self, context: AgentInput | dict[str, Any]) -> AgentInput:
         if isinstance(context, AgentInput):
             return context
-        try:
-            task_goal = context["task_goal"]
-            context_id = context["context_id"]
-        except KeyError as exc:
-            raise exc
+        task_goal = context["task_goal"]
+        context_id = context["context_id"]
         payload = dict(context.get("payload", {}))
-        for key, value in context.items():
-            if key not in {
-                "task_goal",
-                "payload",
-                "context_id",
-                "metadata",
-                "agent_type",
-                "execution_mode",
-            }:
-                payload.setdefault(key, value)
+        extras = {
+            key: value
+            for key, value in context.items()
+            if key not in _RESERVED_KEYS and key not in payload
+        }
+        if extras:
+            payload.update(extras)
         return AgentInput(
             task_goal=str(task_goal),
             payload=payload,
@@ -95,16 +139,55 @@ class AgentExecutionKernel(Generic[OutputT]):
         )
 
     def validate_output(
-        self, payload: dict[str, Any], phase: LifecyclePhase | None = None
+        self,
+        payload: dict[str, Any],
+        phase: LifecyclePhase | None = None,
+        trusted: bool = False,
     ) -> AgentOutput:
-        """Validate output payload confidences and set agent status."""
-        self._record_phase(self._resolve_phase(phase, LifecyclePhase.RUN))
-        output = AgentOutput(**payload)
+        """Validate output payload confidences and set agent status.
+
+        ``trusted`` payloads are built by the agent itself from known-good values;
+        they skip field validation and only keep the confidence range guard.
+        """
+        self._record_phase(_RUN if phase is None else phase)
+        return self._build_output(payload, trusted)
+
+    def _build_output(self, payload: dict[str, Any], trusted: bool) -> AgentOutput:
+        if trusted:
+            output = AgentOutput.model_construct(**payload)
+        else:
+            output = AgentOutput(**payload)
         if not (0.0 <= output.confidence <= 1.0):
             raise ValueError("Confidence must be between 0 and 1")
         self._agent.status = AgentStatus.SUCCESS
         return output
 
+    @contextmanager
+    def run_scope(self) -> Iterator[_ScopedKernel]:
+        """Record a single RUN transition for a block of validation calls.
+
+        Example:
+            with kernel.run_scope() as scope:
+                validated = scope.validate_context_nocheck(raw)
+                output = scope.validate_output_nocheck(payload)
+        """
+        self._record_phase(_RUN)
+        yield _ScopedKernel(self)
+
+    def bulk_validate_outputs(
+        self,
+        payloads: Sequence[dict[str, Any]],
+        phase: LifecyclePhase | None = None,
+    ) -> list[AgentOutput]:
+        """Validate a batch of output payloads with a single lifecycle update."""
+        self._record_phase(_RUN if phase is None else phase)
+        outputs = AGENT_OUTPUTS_ADAPTER.validate_python(payloads)
+        for index, output in enumerate(outputs):
+            if not (0.0 <= output.confidence <= 1.0):
+                raise ValueError(f"Confidence must be between 0 and 1 (output {index})")
+        self._agent.status = AgentStatus.SUCCESS
+        return outputs
+
     def fail(
         self,
         reason: FailureMode,
@@ -113,10 +196,10 @@ class AgentExecutionKernel(Generic[OutputT]):
         phase: LifecyclePhase | None = None,
     ) -> None:
         """Centralized failure path for agents."""
-        self._record_phase(self._resolve_phase(phase, LifecyclePhase.FAIL))
+        self._record_phase(_FAIL if phase is None else phase)
         self._agent.status = AgentStatus.FAILED
         detail_text = f" {details}" if details else ""
-        raise RuntimeError(f"{reason.value}: {message}{detail_text}")
+        raise RuntimeError(self._FAIL_PREFIX[reason] + message + detail_text)
 
     async def revise(
         self,
@@ -125,17 +208,22 @@ class AgentExecutionKernel(Generic[OutputT]):
         phase: LifecyclePhase | None = None,
     ) -> OutputT:
         """Centralized revise path that preserves control flow."""
-        self._record_phase(self._resolve_phase(phase, LifecyclePhase.REVISE))
+        self._record_phase(_REVISE if phase is None else phase)
         if feedback is None:
             return await self._agent.run(context)
-        if isinstance(feedback, str):
-            feedback_dict = {"message": feedback}
-        elif isinstance(feedback, list):
-            feedback_dict = {"messages": feedback}
+        wrapper = _FEEDBACK_WRAPPERS.get(type(feedback))
+        if wrapper is None:
+            # Exact-type lookup misses subclasses; fall back to the base wrappers.
+            if isinstance(feedback, str):
+                wrapper = _FEEDBACK_WRAPPERS[str]
+            elif isinstance(feedback, list):
+                wrapper = _FEEDBACK_WRAPPERS[list]
+        feedback_dict = wrapper(feedback) if wrapper is not None else feedback
+        updated_context: AgentInput | dict[str, Any]
+        if isinstance(context, AgentInput):
+            updated_context = self._agent._revise_payload_input(feedback_dict, context)
         else:
-            feedback_dict = feedback
-        context_dict = self.normalize_context(context)
-        updated_context = self._agent._revise_payload(feedback_dict, context_dict)
+            updated_context = self._agent._revise_payload(feedback_dict, dict(context))
         return await self._agent.run(updated_context)
 
     async def error_result(
@@ -146,23 +234,61 @@ class AgentExecutionKernel(Generic[OutputT]):
         extra: dict[str, Any] | None = None,
         phase: LifecyclePhase | None = None,
     ) -> dict[str, Any]:
-        """Build a standardized error result and emit async logs."""
-        self._record_phase(self._resolve_phase(phase, LifecyclePhase.FAIL))
-        context_dict = self.normalize_context(context or {})
-        payload = self._agent.error_payload(msg, context_dict, stage, extra)
+        """Build a standardized error result and emit async logs.
+
+        The error log is scheduled as a background task so the payload is
+        returned without waiting on log I/O; log records may therefore land
+        shortly after the caller receives the payload. Use
+        ``flush_pending_logs`` to wait for outstanding records.
+        """
+        self._record_phase(_FAIL if phase is None else phase)
+        normalized = self.normalize_context_mutable(context or {})
+        context_id = normalized.get("context_id", "error")
+        payload = self._agent.error_payload(msg, normalized, stage, extra)
         log_context = {
             "stage": stage,
-            "context_id": context_dict.get("context_id", "error"),
+            "context_id": context_id,
         }
         if extra:
             log_context.update(extra)
-        await self._agent.logger.async_log(
-            "ERROR",
-            msg,
-            log_context,
+        task = asyncio.create_task(
+            self._agent.logger.async_log("ERROR", msg, log_context)
         )
+        self._pending_logs.add(task)
+        task.add_done_callback(self._log_task_done)
         return payload
 
+    def _log_task_done(self, task: asyncio.Task[None]) -> None:
+        self._pending_logs.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def flush_pending_logs(self) -> None:
+        """Wait for error logs scheduled by ``error_result`` to complete."""
+        if self._pending_logs:
+            await asyncio.gather(*self._pending_logs, return_exceptions=True)
+
     async def get_telemetry(self) -> dict[str, Any]:
         """Kernel-owned telemetry access with minimal indirection."""
         return await self._agent.get_telemetry()
+
+
+class _ScopedKernel:
+    """Validation helpers for a ``run_scope`` block that skip the lifecycle FSM."""
+
+    __slots__ = ("_kernel",)
+
+    def __init__(self, kernel: AgentExecutionKernel[Any]) -> None:
+        self._kernel = kernel
+
+    def validate_context_nocheck(
+        self, context: AgentInput | dict[str, Any]
+    ) -> AgentInput:
+        """Validate the context without recording a lifecycle phase."""
+        return self._kernel._coerce_context(context)
+
+    def validate_output_nocheck(
+        self, payload: dict[str, Any], trusted: bool = False
+    ) -> AgentOutput:
+        """Validate an output payload without recording a lifecycle phase."""
+        return self._kernel._build_output(payload, trusted)
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import IntEnum
 
 
-class LifecyclePhase(str, Enum):
-    """Discrete agent lifecycle checkpoints used for ordering assertions."""
+class LifecyclePhase(IntEnum):
+    """Discrete agent lifecycle checkpoints used for ordering assertions.
 
-    INIT = "init"
-    RUN = "run"
-    REVISE = "revise"
-    FAIL = "fail"
-    SHUTDOWN = "shutdown"
+    Values are dense ordinals so phases can index lookup tables directly; use
+    ``label`` where the lowercase name is needed for serialization.
+    """
+
+    INIT = 0
+    RUN = 1
+    REVISE = 2
+    FAIL = 3
+    SHUTDOWN = 4
+
+    @property
+    def label(self) -> str:
+        """Return the lowercase phase name (e.g. ``"run"``)."""
+        return self.name.lower()
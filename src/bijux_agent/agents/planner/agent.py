@@ -11,43 +11,48 @@ from bijux_agent.models.contract import AgentOutputSchema
 from bijux_agent.retrieval.interfaces import RetrievalRequest
 from bijux_agent.schema import ExecutionPlan
 
+_STATIC_DAG: tuple[tuple[str, str], ...] = (
+    (AgentType.READER.value, AgentType.SUMMARIZER.value),
+    (AgentType.SUMMARIZER.value, AgentType.CRITIQUE.value),
+    (AgentType.CRITIQUE.value, AgentType.VERIFIER.value),
+)
+_STATIC_SEQUENCE: tuple[AgentType, ...] = (
+    AgentType.READER,
+    AgentType.SUMMARIZER,
+    AgentType.CRITIQUE,
+    AgentType.VERIFIER,
+)
+_STATIC_RETRIEVAL = RetrievalRequest(
+    query="Extract core requirements",
+    top_k=3,
+    filters=["regulation", "summaries"],
+)
+# The plan never varies between runs, so it is validated once at import time.
+_STATIC_PLAN = ExecutionPlan(
+    dag=list(_STATIC_DAG),
+    sequence=list(_STATIC_SEQUENCE),
+    retrieval_steps=[_STATIC_RETRIEVAL],
+)
+_STATIC_PLAN_DUMP: dict[str, Any] = _STATIC_PLAN.model_dump()
+# Output payload shared by every run; validate_output only reads it.
+_STATIC_OUTPUT_DICT: dict[str, Any] = {
+    "text": "PLAN_READY",
+    "artifacts": {"plan": _STATIC_PLAN_DUMP},
+    "scores": {"planning_confidence": 0.95},
+    "confidence": 0.92,
+    "metadata": {
+        "plan_version": "1.0",
+        "contract_version": CONTRACT_VERSION,
+    },
+    "decision": DecisionOutcome.PASS.value,
+}
+
 
 class PlannerAgent(BaseAgent):
     """Creates execution DAGs, sequences, and required retrieval actions."""
 
     async def _run_payload(self, context: dict[str, Any]) -> AgentOutputSchema:
-        """Build a deterministic plan and serialize it."""
-        plan = self._build_plan()
-        output = {
-            "text": "PLAN_READY",
-            "artifacts": {"plan": plan.model_dump()},
-            "scores": {"planning_confidence": 0.95},
-            "confidence": 0.92,
-            "metadata": {
-                "plan_version": "1.0",
-                "contract_version": CONTRACT_VERSION,
-            },
-            "decision": DecisionOutcome.PASS.value,
-        }
-        validated = self.validate_output(output)
+        """Return the deterministic plan, serialized once at import time."""
+        _ = context
+        validated = self.validate_output(_STATIC_OUTPUT_DICT, trusted=True)
         return self._coerce_to_contract_output(validated)
-
-    def _build_plan(self) -> ExecutionPlan:
-        """Construct the static DAG, sequence, and retrieval dependencies."""
-        dag = [
-            (AgentType.READER.value, AgentType.SUMMARIZER.value),
-            (AgentType.SUMMARIZER.value, AgentType.CRITIQUE.value),
-            (AgentType.CRITIQUE.value, AgentType.VERIFIER.value),
-        ]
-        sequence = [
-            AgentType.READER,
-            AgentType.SUMMARIZER,
-            AgentType.CRITIQUE,
-            AgentType.VERIFIER,
-        ]
-        retrieval = RetrievalRequest(
-            query="Extract core requirements",
-            top_k=3,
-            filters=["regulation", "summaries"],
-        )
-        return ExecutionPlan(dag=dag, sequence=sequence, retrieval_steps=[retrieval])
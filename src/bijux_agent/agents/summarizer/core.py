@@ -8,14 +8,18 @@ structured summaries.
 
 from __future__ import annotations
 
-from collections import Counter
+import asyncio
+from collections import Counter, OrderedDict
 from collections.abc import Callable
 import hashlib
+import logging
 import re
+import threading
 import time
 from typing import Any, TypedDict, cast
 
 from bijux_agent.agents.base import BaseAgent
+from bijux_agent.utilities.digest import stable_digest
 from bijux_agent.utilities.llm_utils import LLMUtils
 from bijux_agent.utilities.logger_manager import LoggerManager, MetricType
 
@@ -25,6 +29,44 @@ from .rules import (
     postprocessing,
 )
 
+# Inputs at least this long extract keywords and hash the cache key in parallel.
+PARALLEL_PREP_MIN_CHARS = 64 * 1024
+
+# Maximum number of (text, task_goal) keyword results kept per agent.
+KEYWORD_CACHE_SIZE = 128
+
+# Compiled keyword patterns shared across agents, keyed by min_keyword_length.
+_WORD_RE_CACHE: dict[int, re.Pattern[str]] = {}
+
+
+def _keyword_pattern(min_length: int) -> re.Pattern[str]:
+    """Return the pattern matching whole alphabetic words of ``min_length``+ chars."""
+    pattern = _WORD_RE_CACHE.get(min_length)
+    if pattern is None:
+        pattern = re.compile(rf"\b[^\W\d_]{{{max(1, min_length)},}}\b")
+        _WORD_RE_CACHE[min_length] = pattern
+    return pattern
+
+
+def _result_cache_key(text: str, task_goal: str) -> str:
+    """Return the result-cache key for ``text`` under ``task_goal``."""
+    key_hash = hashlib.blake2b(digest_size=32)
+    key_hash.update(text.encode())
+    key_hash.update(b"\x1f")
+    key_hash.update(task_goal.encode())
+    return key_hash.hexdigest()
+
+
+def _approx_word_count(text: str) -> int:
+    """Estimate word count from space/newline separators without splitting.
+
+    Consecutive separators are counted individually, so the estimate can exceed
+    ``len(text.split())`` for irregularly spaced text.
+    """
+    if not text:
+        return 0
+    return text.count(" ") + text.count("\n") + 1
+
 
 class SummarizerSummary(TypedDict):
     """Structured summary payload."""
@@ -110,12 +152,19 @@ class SummarizerAgent(BaseAgent):
             "strategy_weights",
             {self.STRATEGY_EXTRACTIVE: 0.6, self.STRATEGY_ABSTRACTIVE: 0.4},
         )
-        self._cache: dict[str, SummarizerResult] | None = (
-            {} if self.config.get("enable_cache", True) else None
+        self._cache: OrderedDict[str, SummarizerResult] | None = (
+            OrderedDict() if self.config.get("enable_cache", True) else None
         )
+        self._cache_max = self.config.get("cache_max_entries", 512)
         self.max_retries = self.config.get("max_retries", 2)
         self.min_keyword_length = self.config.get("min_keyword_length", 3)
         self.top_keywords_count = self.config.get("top_keywords_count", 10)
+        self._keyword_pattern = _keyword_pattern(self.min_keyword_length)
+        self._keyword_cache: OrderedDict[bytes, tuple[str, ...]] = OrderedDict()
+        # Large inputs extract keywords in worker threads, so the LRU's
+        # lookup-then-reorder and insert-then-evict steps must not interleave.
+        self._keyword_lock = threading.Lock()
+        self._abstractive_cache: OrderedDict[bytes, str] = OrderedDict()
 
         # Validate strategy and weights
         if self.strategy not in [
@@ -167,6 +216,9 @@ class SummarizerAgent(BaseAgent):
 
     def _cleanup(self) -> None:
         """Clean up resources used by the agent."""
+        with self._keyword_lock:
+            self._keyword_cache.clear()
+        self._abstractive_cache.clear()
         if self._cache is not None:
             self._cache.clear()
             self.logger.debug(
@@ -197,9 +249,9 @@ class SummarizerAgent(BaseAgent):
         Returns:
             Dict with structured summary and metadata.
         """
-        context_id = context.get(
-            "context_id", str(hashlib.sha256(str(context).encode()).hexdigest())
-        )
+        context_id = context.get("context_id")
+        if context_id is None:
+            context_id = stable_digest(context)
         with self.logger.context(agent="SummarizerAgent", context_id=context_id):
             self.logger.info(
                 "Starting summarization operation",
@@ -261,18 +313,28 @@ class SummarizerAgent(BaseAgent):
                 )
 
             task_goal = context.get("task_goal", "summarize the text")
-            keywords = self._extract_keywords(text, task_goal)
+            if len(text) >= PARALLEL_PREP_MIN_CHARS:
+                # hashlib releases the GIL on large buffers, so hashing overlaps
+                # keyword extraction instead of running after it.
+                keywords, cache_key = await asyncio.gather(
+                    asyncio.to_thread(self._extract_keywords, text, task_goal),
+                    asyncio.to_thread(_result_cache_key, text, task_goal),
+                )
+            else:
+                keywords = self._extract_keywords(text, task_goal)
+                cache_key = _result_cache_key(text, task_goal)
 
             # Check cache
-            cache_key = hashlib.sha256((text + task_goal).encode()).hexdigest()
             if self._cache is not None and cache_key in self._cache:
-                self.logger.debug(
-                    "Returning cached summarization result",
-                    extra={"context": {"cache_key": cache_key}},
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Returning cached summarization result",
+                        extra={"context": {"cache_key": cache_key}},
+                    )
                 self.logger_manager.log_metric(
                     "cache_hits", 1, MetricType.COUNTER, tags={"stage": "cache_check"}
                 )
+                self._cache.move_to_end(cache_key)
                 return cast(SummarizerResult, self._cache[cache_key])
 
             # Handle feedback for revision
@@ -359,8 +421,8 @@ class SummarizerAgent(BaseAgent):
                 "audit": {
                     "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
                     "duration_sec": round(duration, 2),
-                    "input_tokens": len(text.split()),
-                    "output_tokens": len(summary_text.split()),
+                    "input_tokens": _approx_word_count(text),
+                    "output_tokens": _approx_word_count(summary_text),
                     "chunks_processed": (len(text) + self.chunk_size - 1)
                     // self.chunk_size,
                 },
@@ -396,24 +458,27 @@ class SummarizerAgent(BaseAgent):
             # Cache the result
             if self._cache is not None:
                 self._cache[cache_key] = result
+                if len(self._cache) > self._cache_max:
+                    self._cache.popitem(last=False)
                 self.logger_manager.log_metric(
                     "cache_stores", 1, MetricType.COUNTER, tags={"stage": "cache_store"}
                 )
 
-            self.logger.info(
-                "Summarization completed successfully",
-                extra={
-                    "context": {
-                        "stage": "completion",
-                        "output_keys": list(result.keys()),
-                        "summary_length": sum(
-                            len(str(v))
-                            for v in result["summary"].values()
-                            if isinstance(v, (str, list))
-                        ),
-                    }
-                },
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Summarization completed successfully",
+                    extra={
+                        "context": {
+                            "stage": "completion",
+                            "output_keys": list(result.keys()),
+                            "summary_length": sum(
+                                len(str(v))
+                                for v in result["summary"].values()
+                                if isinstance(v, (str, list))
+                            ),
+                        }
+                    },
+                )
             return cast(SummarizerResult, result)
 
     @staticmethod
@@ -436,6 +501,16 @@ class SummarizerAgent(BaseAgent):
         Returns:
             List of keywords relevant to the task.
         """
+        cache_key = (
+            hashlib.blake2b(text.encode(), digest_size=16).digest() + task_goal.encode()
+        )
+        with self._keyword_lock:
+            cached = self._keyword_cache.get(cache_key)
+            if cached is not None:
+                self._keyword_cache.move_to_end(cache_key)
+        if cached is not None:
+            return list(cached)
+
         # Extract words from task goal
         task_words = task_goal.lower().split()
         task_keywords = [
@@ -443,15 +518,12 @@ class SummarizerAgent(BaseAgent):
         ]
 
         # Extract frequent words from text
-        words = re.findall(r"\b\w+\b", text.lower())
-        words = [
-            word
-            for word in words
-            if len(word) >= self.min_keyword_length and word.isalpha()
-        ]
-        word_counts = Counter(words)
+        lowered = text.lower()
+        # The pattern enforces the length/alphabetic filter, so findall feeds the
+        # counter in a single C-level pass without per-token match objects.
+        word_counts = Counter(self._keyword_pattern.findall(lowered))
         common_words = [
-            word for word, count in word_counts.most_common(self.top_keywords_count)
+            word for word, _ in word_counts.most_common(self.top_keywords_count)
         ]
 
         # Combine and prioritize task goal keywords
@@ -459,10 +531,16 @@ class SummarizerAgent(BaseAgent):
         keywords = list(dict.fromkeys(keywords))  # Remove duplicates
         keywords = keywords[: self.top_keywords_count]  # Limit number of keywords
 
-        self.logger.debug(
-            "Extracted keywords",
-            extra={"context": {"keywords": keywords}},
-        )
+        with self._keyword_lock:
+            self._keyword_cache[cache_key] = tuple(keywords)
+            if len(self._keyword_cache) > KEYWORD_CACHE_SIZE:
+                self._keyword_cache.popitem(last=False)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Extracted keywords",
+                extra={"context": {"keywords": keywords}},
+            )
         return keywords
 
     async def _summarize(
@@ -483,10 +561,13 @@ class SummarizerAgent(BaseAgent):
 
         # Parse sections for section-aware summarization
         sections = extractive.parse_sections(self, text, keywords)
-        self.logger.debug(
-            f"Parsed {len(sections)} sections",
-            extra={"context": {"sections": [s["heading"] for s in sections]}},
-        )
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(
+                "Parsed %d sections",
+                len(sections),
+                extra={"context": {"sections": [s["heading"] for s in sections]}},
+            )
 
         # Summarize based on strategy
         if self.strategy == self.STRATEGY_EXTRACTIVE:
@@ -495,27 +576,30 @@ class SummarizerAgent(BaseAgent):
             summary = await abstractive.generate_abstractive_summary(
                 self, sections, prompt_prefix, task_goal, keywords
             )
-        else:  # Hybrid
-            extractive_summary = extractive.generate_extractive_summary(
-                self, sections, keywords
-            )
-            abstractive_summary = await abstractive.generate_abstractive_summary(
-                self, sections, prompt_prefix, task_goal, keywords
+        else:  # Hybrid: extractive CPU work overlaps the abstractive LLM calls
+            extractive_summary, abstractive_summary = await asyncio.gather(
+                asyncio.to_thread(
+                    extractive.generate_extractive_summary, self, sections, keywords
+                ),
+                abstractive.generate_abstractive_summary(
+                    self, sections, prompt_prefix, task_goal, keywords
+                ),
             )
             summary = postprocessing.combine_summaries(
                 self, extractive_summary, abstractive_summary
             )
 
-        self.logger.debug(
-            "Summarization strategy applied",
-            extra={
-                "context": {
-                    "strategy": self.strategy,
-                    "method": method,
-                    "summary_length": len(summary),
-                }
-            },
-        )
+        if debug:
+            self.logger.debug(
+                "Summarization strategy applied",
+                extra={
+                    "context": {
+                        "strategy": self.strategy,
+                        "method": method,
+                        "summary_length": len(summary),
+                    }
+                },
+            )
         return summary, method
 
     def _revise_payload(
@@ -2,10 +2,85 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+import hashlib
 from typing import Any
 
 from bijux_agent.utilities.logger_manager import MetricType
 
+# Upper bound on in-flight LLM calls per summary unless ``llm_concurrency`` is set.
+DEFAULT_LLM_CONCURRENCY = 8
+
+# Maximum number of chunk summaries kept in an agent's abstractive cache.
+ABSTRACTIVE_CACHE_SIZE = 1024
+
+# Characters a chunk may end on so that chunks break between sentences/lines.
+CHUNK_DELIMITERS = (".", "?", "\n")
+
+
+def _cut_point(text: str, start: int, end: int) -> int:
+    """Return where a chunk over ``text[start:end]`` should end."""
+    cut = max(text.rfind(delim, start, end) for delim in CHUNK_DELIMITERS)
+    return cut + 1 if cut >= start else end
+
+
+def chunk_spans(text: str, chunk_size: int) -> list[tuple[int, int]]:
+    """Split ``text`` into ``(start, end)`` spans of at most ``chunk_size`` chars.
+
+    Each span is cut just after the last delimiter inside its window; windows
+    without a delimiter fall back to a hard cut at ``chunk_size``.
+    """
+    total_length = len(text)
+    if total_length <= chunk_size:
+        return [(0, total_length)]
+    spans: list[tuple[int, int]] = []
+    start = 0
+    while start < total_length:
+        end = min(start + chunk_size, total_length)
+        if end < total_length:
+            end = _cut_point(text, start, end)
+        spans.append((start, end))
+        start = end
+    return spans
+
+
+def iter_chunks(pieces: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """Yield the chunks ``chunk_spans`` would give for ``"".join(pieces)``.
+
+    Only windows straddling two pieces are copied into a temporary string, so
+    the concatenated text is never materialized.
+    """
+    carry = ""
+    emitted = False
+    for piece in pieces:
+        pos = 0
+        remaining = len(piece)
+        while carry and len(carry) + remaining > chunk_size:
+            window = carry + piece[pos : pos + chunk_size - len(carry)]
+            end = _cut_point(window, 0, len(window))
+            yield window[:end]
+            emitted = True
+            if end >= len(carry):
+                pos += end - len(carry)
+                remaining = len(piece) - pos
+                carry = ""
+            else:
+                carry = carry[end:]
+        if carry:
+            carry += piece[pos:]
+            continue
+        while remaining > chunk_size:
+            end = _cut_point(piece, pos, pos + chunk_size)
+            yield piece[pos:end]
+            emitted = True
+            pos = end
+            remaining = len(piece) - pos
+        carry = piece[pos:]
+    if carry or not emitted:
+        yield carry
+
 
 async def generate_abstractive_summary(
     agent: Any,
@@ -14,41 +89,203 @@ async def generate_abstractive_summary(
     task_goal: str,
     keywords: list[str],
 ) -> str:
-    """Compose an abstractive summary using LLM-generated chunks."""
+    """Compose an abstractive summary using LLM-generated chunks.
+
+    Chunk summaries that together exceed ``max_length`` are reduced level by
+    level: neighbouring summaries are grouped up to ``chunk_size`` characters
+    and each group is summarized concurrently until the result fits.
+    """
     if not agent.llm:
         raise ValueError("LLM backend not initialized for abstractive summarization")
 
-    section_texts = [
-        f"{section['heading']}\n{section['content']}" for section in sections
-    ]
-    combined_text = "\n\n".join(section_texts)
-    if len(combined_text) <= agent.chunk_size:
-        chunks = [combined_text]
+    # Section text is streamed piecewise; the whole document is only joined
+    # when it fits in a single chunk anyway.
+    pieces: list[str] = []
+    for section in sections:
+        if pieces:
+            pieces.append("\n\n")
+        pieces.extend((section["heading"], "\n", section["content"]))
+    total_length = sum(len(piece) for piece in pieces)
+    chunk_size = agent.chunk_size
+    chunks: Iterable[str]
+    if total_length <= chunk_size:
+        chunks = ["".join(pieces)]
     else:
-        chunks = [
-            combined_text[i : i + agent.chunk_size]
-            for i in range(0, len(combined_text), agent.chunk_size)
-        ]
+        chunks = iter_chunks(pieces, chunk_size)
     agent.logger.debug(
-        f"Split text into {len(chunks)} chunks for abstractive summarization",
-        extra={"context": {"chunk_size": agent.chunk_size}},
+        f"Splitting {total_length} characters for abstractive summarization",
+        extra={"context": {"chunk_size": chunk_size}},
     )
 
-    summaries: list[str] = []
-    keyword_str = ", ".join(keywords)
-    for chunk in chunks:
-        prompt = (
-            f"{prompt_prefix}Given the task: {task_goal}, "
-            f"focus on the following keywords: {keyword_str}. "
-            "Summarize the following text in a concise and coherent manner:"
-            f"\n\n{chunk}"
+    summaries = await _summarize_chunks(
+        agent, chunks, prompt_prefix, task_goal, keywords
+    )
+    summaries = [summary for summary in summaries if summary]
+    combined = " ".join(summaries)
+    while len(combined) > agent.max_length:
+        agent.logger.debug(
+            "Combined summary exceeds max_length, summarizing again",
+            extra={"context": {"combined_length": len(combined)}},
+        )
+        if len(summaries) == 1:
+            # A lone over-long summary gets one final pass so the loop always
+            # terminates, even if the backend does not shorten its input.
+            reduced = await _summarize_chunks(
+                agent,
+                (
+                    combined[start:end]
+                    for start, end in chunk_spans(combined, chunk_size)
+                ),
+                prompt_prefix,
+                task_goal,
+                keywords,
+            )
+            return " ".join(summary for summary in reduced if summary)
+        groups = _group_summaries(summaries, chunk_size)
+        reduced = await _summarize_chunks(
+            agent,
+            (" ".join(group) for group in groups),
+            prompt_prefix,
+            task_goal,
+            keywords,
         )
+        summaries = [summary for summary in reduced if summary]
+        combined = " ".join(summaries)
+    return combined
+
+
+def _group_summaries(summaries: list[str], budget: int) -> list[list[str]]:
+    """Pack consecutive summaries into groups of about ``budget`` characters.
+
+    Every group holds at least two summaries (given two or more inputs) so each
+    reduce level strictly shrinks the number of summaries.
+    """
+    groups: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+    for summary in summaries:
+        if len(current) >= 2 and size + len(summary) > budget:
+            groups.append(current)
+            current, size = [], 0
+        current.append(summary)
+        size += len(summary) + 1
+    if len(current) == 1 and groups:
+        groups[-1].extend(current)
+    elif current:
+        groups.append(current)
+    return groups
+
+
+async def _summarize_chunks(
+    agent: Any,
+    chunks: Iterable[str],
+    prompt_prefix: str,
+    task_goal: str,
+    keywords: list[str],
+) -> list[str]:
+    """Summarize each chunk concurrently; failed chunks yield empty strings."""
+    # Only distinct chunks are kept; identical chunks (repeated boilerplate)
+    # share a single LLM call.
+    route: list[int] = []
+    unique_chunks: list[str] = []
+    unique_digests: list[bytes] = []
+    chunk_index: dict[bytes, int] = {}
+    for chunk in chunks:
+        digest = hashlib.blake2b(chunk.encode(), digest_size=16).digest()
+        index = chunk_index.get(digest)
+        if index is None:
+            index = chunk_index[digest] = len(unique_chunks)
+            unique_chunks.append(chunk)
+            unique_digests.append(digest)
+        route.append(index)
+
+    keyword_str = ", ".join(keywords)
+    # Chunk summaries are cached across calls under the prompt ingredients, so
+    # revisions only reach the LLM for chunks whose effective prompt changed.
+    cache: OrderedDict[bytes, str] = agent._abstractive_cache
+    prompt_digest = hashlib.blake2b(
+        "\x1f".join(
+            (prompt_prefix, task_goal, keyword_str, str(agent.max_tokens))
+        ).encode(),
+        digest_size=16,
+    ).digest()
+
+    header = (
+        f"{prompt_prefix}Given the task: {task_goal}, "
+        f"focus on the following keywords: {keyword_str}. "
+        "Summarize the following text in a concise and coherent manner:\n\n"
+    )
+
+    def build_prompt(chunk: str) -> str:
+        return header + chunk
+
+    results: list[str | BaseException] = [""] * len(unique_chunks)
+    pending: list[int] = []
+    for index, digest in enumerate(unique_digests):
+        cached = cache.get(prompt_digest + digest)
+        if cached is None:
+            pending.append(index)
+        else:
+            cache.move_to_end(prompt_digest + digest)
+            results[index] = cached
+
+    generated: Sequence[str | BaseException] = []
+    if pending and getattr(agent.llm, "supports_batch", False):
+        # Batching backends take every uncached prompt in one submission; a
+        # failed submission fails each of its prompts, not the whole summary.
         try:
-            summary = await agent.llm.generate(prompt, max_tokens=agent.max_tokens)
-            summaries.append(summary.strip())
+            generated = await agent.llm.generate_batch(
+                [build_prompt(unique_chunks[index]) for index in pending],
+                max_tokens=agent.max_tokens,
+            )
+            if len(generated) != len(pending):
+                raise ValueError(
+                    f"Batch returned {len(generated)} results "
+                    f"for {len(pending)} prompts"
+                )
         except Exception as e:
+            generated = [e] * len(pending)
+    elif pending:
+        semaphore = asyncio.Semaphore(
+            agent.config.get("llm_concurrency", DEFAULT_LLM_CONCURRENCY)
+        )
+
+        generate_safe = getattr(agent.llm, "generate_safe", None)
+
+        async def summarize_chunk(chunk: str) -> str | BaseException:
+            # Prompts are built only once a slot is free, so at most
+            # ``llm_concurrency`` of them are alive at any time.
+            async with semaphore:
+                prompt = build_prompt(chunk)
+                if generate_safe is None:
+                    result: str = await agent.llm.generate(
+                        prompt, max_tokens=agent.max_tokens
+                    )
+                    return result
+                # Backend failures come back as values; no exception per chunk.
+                ok, text, error = await generate_safe(
+                    prompt, max_tokens=agent.max_tokens
+                )
+                return text if ok else RuntimeError(error)
+
+        generated = await asyncio.gather(
+            *(summarize_chunk(unique_chunks[index]) for index in pending),
+            return_exceptions=True,
+        )
+
+    for index, result in zip(pending, generated, strict=True):
+        if not isinstance(result, BaseException):
+            result = result.strip()
+            cache[prompt_digest + unique_digests[index]] = result
+            if len(cache) > ABSTRACTIVE_CACHE_SIZE:
+                cache.popitem(last=False)
+        results[index] = result
+
+    unique_summaries: list[str] = []
+    for chunk, result in zip(unique_chunks, results, strict=True):
+        if isinstance(result, BaseException):
             agent.logger.warning(
-                f"Failed to summarize chunk: {e!s}",
+                f"Failed to summarize chunk: {result!s}",
                 extra={"context": {"chunk": chunk[:100]}},
             )
             agent.logger_manager.log_metric(
@@ -57,19 +294,7 @@ async def generate_abstractive_summary(
                 MetricType.COUNTER,
                 tags={"stage": "abstractive_summary"},
             )
-            summaries.append("")
-
-    combined = " ".join(s for s in summaries if s)
-    if len(combined) > agent.max_length:
-        agent.logger.debug(
-            "Combined summary exceeds max_length, summarizing again",
-            extra={"context": {"combined_length": len(combined)}},
-        )
-        return await generate_abstractive_summary(
-            agent,
-            [{"heading": "Summary", "content": combined, "relevance_score": 1.0}],
-            prompt_prefix,
-            task_goal,
-            keywords,
-        )
-    return combined
+            unique_summaries.append("")
+        else:
+            unique_summaries.append(result)
+    return [unique_summaries[index] for index in route]
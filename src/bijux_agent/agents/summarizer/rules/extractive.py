@@ -2,30 +2,52 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import Counter
+import heapq
+from itertools import accumulate
 import re
 from typing import Any
 
+_SECTION_SPLIT_RE = re.compile(
+    r"(?m)^(?:\d+\.\s+|[A-Z][A-Za-z\s]+(?=\n\s*\n))"
+    r"(?=.*?(?=\n\d+\.\s+|\n[A-Z][A-Za-z\s]+(?=\n\s*\n)|\Z))"
+)
+_SECTION_HEADING_RE = re.compile(
+    r"^(?:\d+\.\s+.*|[A-Z][A-Za-z\s]+(?=\n\s*\n))", re.MULTILINE
+)
+_SENTENCE_RE = re.compile(r"[^.]+")
+
+
+def _matched_keywords(keywords_lower: list[str], *texts_lower: str) -> list[int]:
+    """Return indices of lowercased keywords found in any lowercased text."""
+    return [
+        i
+        for i, kw in enumerate(keywords_lower)
+        if any(kw in text for text in texts_lower)
+    ]
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text on periods, returning the stripped non-empty sentences."""
+    return [
+        sentence
+        for match in _SENTENCE_RE.finditer(text)
+        if (sentence := match.group(0).strip())
+    ]
+
 
 def parse_sections(agent: Any, text: str, keywords: list[str]) -> list[dict[str, Any]]:
     """Parse text headings and sort by keyword relevance."""
-    section_pattern = (
-        r"(?m)^(?:\d+\.\s+|[A-Z][A-Za-z\s]+(?=\n\s*\n))"
-        r"(?=.*?(?=\n\d+\.\s+|\n[A-Z][A-Za-z\s]+(?=\n\s*\n)|\Z))"
-    )
-    sections_raw = re.split(section_pattern, text)
-    section_headings = re.findall(
-        r"^(?:\d+\.\s+.*|[A-Z][A-Za-z\s]+(?=\n\s*\n))",
-        text,
-        re.MULTILINE,
-    )
+    sections_raw = _SECTION_SPLIT_RE.split(text)
+    section_headings = _SECTION_HEADING_RE.findall(text)
 
+    keywords_lower = [kw.lower() for kw in keywords]
     sections: list[dict[str, Any]] = []
     for i, heading in enumerate(section_headings):
         content = sections_raw[i + 1].strip() if i + 1 < len(sections_raw) else ""
-        relevance_score = sum(
-            1
-            for kw in keywords
-            if kw.lower() in heading.lower() or kw.lower() in content.lower()
+        relevance_score = len(
+            _matched_keywords(keywords_lower, heading.lower(), content.lower())
         )
         sections.append(
             {
@@ -53,43 +75,50 @@ def generate_extractive_summary(
 ) -> str:
     """Select sentences that align best with keywords and section relevance."""
     keyword_weights = {kw.lower(): 1.0 for kw in keywords}
-    for kw in list(keyword_weights):
-        section_count = sum(
-            1
-            for section in sections
-            if kw in section["content"].lower() or kw in section["heading"].lower()
-        )
+    keywords_lower = list(keyword_weights)
+    section_counts: Counter[str] = Counter()
+    for section in sections:
+        for i in _matched_keywords(
+            keywords_lower,
+            section["heading"].lower(),
+            section["content"].lower(),
+        ):
+            section_counts[keywords_lower[i]] += 1
+    for kw, section_count in section_counts.items():
         if section_count > 1:
             keyword_weights[kw] += section_count * 0.5
 
+    weighted_keywords = tuple(keyword_weights.items())
     scored_sentences: list[tuple[str, float]] = []
     for section in sections:
         section_text = f"{section['heading']}. {section['content']}"
-        sentences = [s.strip() for s in section_text.replace("\n", " ").split(".")]
-        sentences = [s for s in sentences if s]
+        sentences = split_sentences(section_text.replace("\n", " "))
+        section_bonus = section["relevance_score"] * 0.5
 
         for idx, sentence in enumerate(sentences):
             score = 0.0
-            sentence_lower = sentence.lower()
-            for kw, weight in keyword_weights.items():
-                if kw in sentence_lower:
-                    score += weight
-            score += section["relevance_score"] * 0.5
-            positional_factor = 1.0 / (idx + 1) * 0.5
-            score += positional_factor
+            if weighted_keywords:
+                sentence_lower = sentence.lower()
+                for kw, weight in weighted_keywords:
+                    if kw in sentence_lower:
+                        score += weight
+            score += section_bonus
+            score += 0.5 / (idx + 1)
             score += len(sentence) / 100
             scored_sentences.append((sentence, score))
 
-    scored_sentences.sort(key=lambda x: x[1], reverse=True)
+    # Every sentence is non-empty, so no more than max_length // shortest + 1
+    # of the best-scored sentences can be visited before the budget breaks.
+    shortest = min((len(sentence) for sentence, _ in scored_sentences), default=1)
+    top_sentences = heapq.nlargest(
+        agent.max_length // shortest + 1, scored_sentences, key=lambda x: x[1]
+    )
 
-    summary_sentences: list[str] = []
-    current_length = 0
-    for sentence, _ in scored_sentences:
-        sentence_length = len(sentence)
-        if current_length + sentence_length > agent.max_length:
-            break
-        summary_sentences.append(sentence)
-        current_length += sentence_length
+    # Lengths are positive, so the running totals are strictly increasing and
+    # the budget cutoff is a single bisection over them.
+    running_lengths = list(accumulate(len(sentence) for sentence, _ in top_sentences))
+    cutoff = bisect_right(running_lengths, agent.max_length)
+    summary_sentences = [sentence for sentence, _ in top_sentences[:cutoff]]
 
     summary = ". ".join(summary_sentences)
     if summary:
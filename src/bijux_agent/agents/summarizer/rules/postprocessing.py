@@ -3,8 +3,50 @@
 from __future__ import annotations
 
 from collections import Counter
+import heapq
+import re
+from types import ModuleType
 from typing import Any
 
+from .extractive import split_sentences
+
+np: ModuleType | None = None
+try:
+    import numpy as _np
+
+    np = _np
+except ImportError:
+    pass
+
+# Below this many characters Counter beats the byte-buffer setup costs.
+VECTORIZE_MIN_CHARS = 4096
+REPEATED_CHAR_THRESHOLD = 10
+MAX_KEY_POINTS = 5
+_ACTION_WORDS_RE = re.compile("should|recommend|suggest|monitor|invest")
+
+
+def _alternation(keywords: list[str]) -> re.Pattern[str] | None:
+    """Compile keywords into one alternation, longest first."""
+    if not keywords:
+        return None
+    return re.compile(
+        "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    )
+
+
+def _repeated_chars(text: str) -> list[str]:
+    """Return characters seen more than the threshold, in first-seen order."""
+    if np is not None and len(text) >= VECTORIZE_MIN_CHARS and text.isascii():
+        buffer = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        counts = np.bincount(buffer, minlength=128)
+        repeated = [
+            chr(code) for code in np.flatnonzero(counts > REPEATED_CHAR_THRESHOLD)
+        ]
+        return sorted(repeated, key=text.index)
+    return [
+        char for char, count in Counter(text).items() if count > REPEATED_CHAR_THRESHOLD
+    ]
+
 
 def combine_summaries(
     agent: Any, extractive_summary: str, abstractive_summary: str
@@ -20,15 +62,16 @@ def combine_summaries(
     extractive_weight = agent.strategy_weights.get(agent.STRATEGY_EXTRACTIVE, 0.6)
     abstractive_weight = agent.strategy_weights.get(agent.STRATEGY_ABSTRACTIVE, 0.4)
 
-    extractive_sentences = [s.strip() for s in extractive_summary.split(".")]
-    abstractive_sentences = [s.strip() for s in abstractive_summary.split(".")]
-    extractive_sentences = [s for s in extractive_sentences if s]
-    abstractive_sentences = [s for s in abstractive_sentences if s]
+    extractive_sentences = split_sentences(extractive_summary)
+    abstractive_sentences = split_sentences(abstractive_summary)
 
     summary_sentences: list[str] = []
     current_length = 0
     extractive_idx, abstractive_idx = 0, 0
-    total_sentences = len(extractive_sentences) + len(abstractive_sentences)
+    extractive_count = len(extractive_sentences)
+    abstractive_count = len(abstractive_sentences)
+    max_length = agent.max_length
+    total_sentences = extractive_count + abstractive_count
     if total_sentences == 0:
         return ""
 
@@ -36,23 +79,20 @@ def combine_summaries(
     target_abstractive = int(total_sentences * abstractive_weight)
 
     while (
-        extractive_idx < len(extractive_sentences)
-        or abstractive_idx < len(abstractive_sentences)
-    ) and current_length < agent.max_length:
-        if extractive_idx < len(extractive_sentences) and (
-            extractive_idx < target_extractive
-            or abstractive_idx >= len(abstractive_sentences)
+        extractive_idx < extractive_count or abstractive_idx < abstractive_count
+    ) and current_length < max_length:
+        if extractive_idx < extractive_count and (
+            extractive_idx < target_extractive or abstractive_idx >= abstractive_count
         ):
             sentence = extractive_sentences[extractive_idx]
             extractive_idx += 1
-        elif abstractive_idx < len(abstractive_sentences) and (
-            abstractive_idx < target_abstractive
-            or extractive_idx >= len(extractive_sentences)
+        elif abstractive_idx < abstractive_count and (
+            abstractive_idx < target_abstractive or extractive_idx >= extractive_count
         ):
             sentence = abstractive_sentences[abstractive_idx]
             abstractive_idx += 1
         else:
-            if extractive_idx < len(extractive_sentences):
+            if extractive_idx < extractive_count:
                 sentence = extractive_sentences[extractive_idx]
                 extractive_idx += 1
             else:
@@ -60,7 +100,7 @@ def combine_summaries(
                 abstractive_idx += 1
 
         sentence_length = len(sentence)
-        if current_length + sentence_length > agent.max_length:
+        if current_length + sentence_length > max_length:
             break
         summary_sentences.append(sentence)
         current_length += sentence_length
@@ -96,37 +136,41 @@ def format_structured_summary(
             "missing_info": "Summary generation failed.",
         }
 
-    sentences = [s.strip() for s in summary_text.split(".")]
-    sentences = [s for s in sentences if s]
+    sentences = split_sentences(summary_text)
+    sentences_lower = [s.lower() for s in sentences]
+    keywords_lower = [kw.lower() for kw in keywords]
 
     scored_sentences: list[tuple[str, float]] = []
     for idx, sentence in enumerate(sentences):
-        score = sum(1 for kw in keywords if kw.lower() in sentence.lower())
+        sentence_lower = sentences_lower[idx]
+        score = sum(1 for kw in keywords_lower if kw in sentence_lower)
         positional_factor = 1.0 / (idx + 1) * 0.5
         score += positional_factor
         scored_sentences.append((sentence, score))
-    scored_sentences.sort(key=lambda x: x[1], reverse=True)
+    top_sentences = heapq.nlargest(2, scored_sentences, key=lambda x: x[1])
 
-    executive_summary_sentences = [s[0] for s in scored_sentences[:2]]
+    executive_summary_sentences = [s[0] for s in top_sentences]
     executive_summary = ". ".join(executive_summary_sentences)
     if executive_summary:
         executive_summary += "."
 
-    key_points = [
-        f"- {sentence}"
-        for sentence in sentences
-        if any(kw in sentence.lower() for kw in keywords)
-    ]
-    key_points = list(dict.fromkeys(key_points))[:5]
+    keyword_re = _alternation(keywords)
+    key_points: list[str] = []
+    if keyword_re is not None:
+        seen: set[str] = set()
+        for sentence, sentence_lower in zip(sentences, sentences_lower, strict=True):
+            if sentence in seen or not keyword_re.search(sentence_lower):
+                continue
+            seen.add(sentence)
+            key_points.append(f"- {sentence}")
+            if len(key_points) == MAX_KEY_POINTS:
+                break
     if not key_points:
         key_points = ["- No specific key points identified."]
 
     actionable_insights = "No actionable insights identified."
-    for sentence in sentences:
-        if any(
-            word in sentence.lower()
-            for word in ["should", "recommend", "suggest", "monitor", "invest"]
-        ):
+    for sentence, sentence_lower in zip(sentences, sentences_lower, strict=True):
+        if _ACTION_WORDS_RE.search(sentence_lower):
             actionable_insights = sentence
             break
 
@@ -136,18 +180,19 @@ def format_structured_summary(
     elif len(summary_text) > agent.max_length * 0.9:
         critical_risks = "Summary may be too long and include unnecessary details."
 
-    char_counts = Counter(original_text)
-    repeated_chars = [char for char, count in char_counts.items() if count > 10]
+    repeated_chars = _repeated_chars(original_text)
     if repeated_chars:
         critical_risks = (
             "Possible OCR errors (e.g., repeated characters: "
             f"{', '.join(repeated_chars)}) may lead to incomplete insights."
         )
 
+    # NUL never occurs in a keyword, so matches cannot straddle two points.
+    points_lower = "\0".join(point.lower() for point in key_points)
     missing_keywords = [
         kw
-        for kw in keywords
-        if not any(kw.lower() in point.lower() for point in key_points)
+        for kw, kw_lower in zip(keywords, keywords_lower, strict=True)
+        if kw_lower not in points_lower
     ]
     missing_info = (
         f"Missing details related to: {', '.join(missing_keywords)}."
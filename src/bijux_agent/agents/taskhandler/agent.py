@@ -7,12 +7,90 @@ without orchestration, providing detailed logging and telemetry.
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
+import copy
+import logging
 import time
+from types import MappingProxyType
 from typing import Any, NotRequired, TypedDict, cast
 
 from bijux_agent.agents.base import BaseAgent
-from bijux_agent.utilities.logger_manager import LoggerManager, MetricType
+from bijux_agent.utilities.digest import strict_digest
+from bijux_agent.utilities.logger_manager import (
+    LoggerManager,
+    MetricRecord,
+    MetricType,
+)
+from bijux_agent.utilities.timestamps import utc_now_str
+
+
+def _always_true(_context: Mapping[str, Any]) -> bool:
+    """Default stage condition shared by every stage without one."""
+    return True
+
+
+def _freeze_stage(stage: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only view of a stage with its dependencies as a tuple."""
+    if isinstance(stage, MappingProxyType) and isinstance(
+        stage.get("dependencies"), tuple
+    ):
+        return stage
+    return MappingProxyType(
+        {**stage, "dependencies": tuple(stage.get("dependencies", ()))}
+    )
+
+
+def _stage_cache_key(
+    stage: Mapping[str, Any], context: Mapping[str, Any]
+) -> str | None:
+    """Return the memoization key for a stage over its declared ``cache_keys``.
+
+    ``None`` when a keyed value is not plain JSON data: such values cannot be
+    keyed without risking collisions, so the stage runs uncached.
+    """
+    relevant = {key: context.get(key) for key in stage["cache_keys"]}
+    digest = strict_digest(relevant, digest_size=16)
+    return None if digest is None else f"{stage['name']}\x1f{digest}"
+
+
+def _dependency_levels(
+    stages: Sequence[Mapping[str, Any]],
+) -> list[tuple[Mapping[str, Any], ...]]:
+    """Group stages into topological levels of their declared dependencies.
+
+    Stages keep their declaration order within a level. Dependencies on
+    unknown stage names are ignored, as in the sequential run.
+
+    Raises:
+        ValueError: If the stage dependencies form a cycle.
+    """
+    by_name = {stage["name"]: stage for stage in stages}
+    level_of: dict[str, int] = {}
+    pending: set[str] = set()
+
+    def resolve(name: str) -> int:
+        if name in level_of:
+            return level_of[name]
+        if name in pending:
+            raise ValueError(f"Stage dependency cycle through '{name}'")
+        pending.add(name)
+        level = 1 + max(
+            (resolve(dep) for dep in by_name[name]["dependencies"] if dep in by_name),
+            default=-1,
+        )
+        pending.discard(name)
+        level_of[name] = level
+        return level
+
+    levels: list[list[Mapping[str, Any]]] = []
+    for stage in stages:
+        level = resolve(stage["name"])
+        while len(levels) <= level:
+            levels.append([])
+        levels[level].append(stage)
+    return [tuple(level) for level in levels]
 
 
 class TaskHandlerAuditEntry(TypedDict, total=False):
@@ -62,10 +140,13 @@ class TaskHandlerAgent(BaseAgent):
             logger_manager: The LoggerManager instance for logging and telemetry.
         """
         super().__init__(config, logger_manager)
-        self._cache: dict[str, dict[str, Any]] | None = (
-            {} if self.config.get("enable_cache", True) else None
+        self._cache: OrderedDict[str, dict[str, Any]] | None = (
+            OrderedDict() if self.config.get("enable_cache", True) else None
         )
-        self._stages: list[dict[str, Any]] = []  # Store stages to be executed
+        self._cache_max = self.config.get("cache_max_entries", 512)
+        self._stages: tuple[Mapping[str, Any], ...] = ()  # Stages to be executed
+        self._stage_levels: list[tuple[Mapping[str, Any], ...]] = []
+        self._concurrent_stages = bool(self.config.get("concurrent_stages", False))
 
         self.logger.info(
             "TaskHandlerAgent initialized",
@@ -81,19 +162,26 @@ class TaskHandlerAgent(BaseAgent):
         pass
 
     def _cleanup(self) -> None:
-        """Clean up resources used by the agent.
-
-        Currently, no additional cleanup is required.
-        """
-        pass
+        """Clean up resources used by the agent by clearing the stage cache."""
+        if self._cache is not None:
+            self._cache.clear()
 
     def set_stages(self, stages: Sequence[Mapping[str, Any]]) -> None:
         """Set the list of stages to be executed by the TaskHandlerAgent.
 
         Args:
             stages: List of stage configurations to execute.
+
+        Raises:
+            ValueError: If ``concurrent_stages`` is enabled and the stage
+                dependencies form a cycle.
         """
-        self._stages = [dict(stage) for stage in stages]
+        self._stages = tuple(_freeze_stage(stage) for stage in stages)
+        self._stage_levels = (
+            _dependency_levels(self._stages)
+            if self._concurrent_stages
+            else [(stage,) for stage in self._stages]
+        )
         self.logger.info(
             "Stages set for TaskHandlerAgent",
             extra={"context": {"stages": [stage["name"] for stage in self._stages]}},
@@ -165,91 +253,42 @@ class TaskHandlerAgent(BaseAgent):
                 ),
             )
 
-        # Execute each stage in sequence
+        # Execute each level of stages; levels hold one stage unless the
+        # concurrent_stages option groups independent stages together.
         current_context = context.copy()
-        for stage in self._stages:
-            stage_name = stage["name"]
-            self.logger.debug(
-                f"Executing stage: {stage_name}",
-                extra={"context": {"stage": stage_name}},
-            )
-
-            # Check stage condition
-            condition = stage.get("condition", lambda _: True)
-            if not condition(current_context):
-                warning_msg = f"Stage '{stage_name}' skipped due to unmet condition"
-                self.logger.warning(
-                    warning_msg, extra={"context": {"stage": stage_name}}
-                )
-                result["warnings"].append(warning_msg)
-                continue
-
-            # Prepare inputs for the stage
-            inputs = {}
-            for dependency in stage.get("dependencies", []):
-                if dependency in result["stages"]:
-                    inputs.update(result["stages"][dependency])
-            inputs.update(current_context)
-
-            # Execute the stage
-            try:
-                stage_start_time = time.perf_counter()
-                stage_output = await self._execute_stage(stage, inputs)
-                stage_duration = time.perf_counter() - stage_start_time
-
-                # Update result with stage output
-                result["stages"][stage_name] = stage_output
-                result["final_status"]["stages_processed"].append(stage_name)
-                result["audit_trail"].append(
-                    {
-                        "stage_name": stage_name,
-                        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                        "duration_sec": round(stage_duration, 2),
-                    }
-                )
-                self.logger_manager.log_metric(
-                    "stage_duration",
-                    stage_duration,
-                    MetricType.HISTOGRAM,
-                    tags={"stage": stage_name},
-                )
-
-                # Check for errors in stage output
-                if "error" in stage_output:
-                    error_msg = f"Stage '{stage_name}' failed: {stage_output['error']}"
-                    self.logger.error(
-                        error_msg, extra={"context": {"stage": stage_name}}
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        for level in self._stage_levels:
+            ready: list[Mapping[str, Any]] = []
+            for stage in level:
+                stage_name = stage["name"]
+                condition = stage.get("condition", _always_true)
+                if debug_enabled:
+                    self.logger.debug(
+                        "Executing stage: %s",
+                        stage_name,
+                        extra={"context": {"stage": stage_name}},
                     )
-                    self.logger_manager.log_metric(
-                        "stage_errors",
-                        1,
-                        MetricType.COUNTER,
-                        tags={"stage": stage_name},
+
+                # Check stage condition
+                if not condition(current_context):
+                    warning_msg = f"Stage '{stage_name}' skipped due to unmet condition"
+                    self.logger.warning(
+                        warning_msg, extra={"context": {"stage": stage_name}}
                     )
-                    result["warnings"].append(error_msg)
+                    result["warnings"].append(warning_msg)
                     continue
+                ready.append(stage)
 
-                # Update context with stage output
-                output_key = stage.get("output_key", stage_name)
-                current_context[output_key] = stage_output
-
-            except Exception as e:
-                error_msg = f"Stage '{stage_name}' execution failed: {e!s}"
-                self.logger.error(
-                    error_msg, extra={"context": {"stage": stage_name, "error": str(e)}}
-                )
-                self.logger_manager.log_metric(
-                    "stage_errors", 1, MetricType.COUNTER, tags={"stage": stage_name}
-                )
-                result["warnings"].append(error_msg)
-                continue
+            outcomes = await self._run_level(ready, current_context, result)
+            for stage, outcome in zip(ready, outcomes, strict=True):
+                self._record_stage(stage, outcome, current_context, result)
 
         # Finalize result
         duration = time.perf_counter() - start_time
         result["audit_trail"].append(
             {
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "duration_sec": round(duration, 2),
+                "timestamp": utc_now_str(),
+                "duration_sec": duration,
                 "stages_processed": result["final_status"]["stages_processed"],
             }
         )
@@ -273,11 +312,122 @@ class TaskHandlerAgent(BaseAgent):
 
         return result
 
+    async def _run_level(
+        self,
+        stages: list[Mapping[str, Any]],
+        current_context: dict[str, Any],
+        result: TaskHandlerResult,
+    ) -> list[tuple[dict[str, Any], float] | BaseException]:
+        """Run the ready stages of one level, concurrently when there are several.
+
+        Args:
+            stages: Stages whose conditions passed, in declaration order.
+            current_context: Running context shared by every stage in the level.
+            result: Result under construction, holding earlier stage outputs.
+
+        Returns:
+            One ``(output, duration)`` pair or raised exception per stage.
+        """
+        calls = [
+            self._timed_stage(stage, self._stage_inputs(stage, current_context, result))
+            for stage in stages
+        ]
+        if len(calls) == 1:
+            try:
+                return [await calls[0]]
+            except Exception as e:
+                return [e]
+        return list(await asyncio.gather(*calls, return_exceptions=True))
+
+    @staticmethod
+    def _stage_inputs(
+        stage: Mapping[str, Any],
+        current_context: dict[str, Any],
+        result: TaskHandlerResult,
+    ) -> dict[str, Any]:
+        """Merge dependency outputs under the context; later dependencies win.
+
+        Each stage gets its own dict, so writes to its input never reach the
+        shared context or sibling stages.
+        """
+        inputs: dict[str, Any] = {}
+        stages = result["stages"]
+        for dependency in stage["dependencies"]:
+            if dependency in stages:
+                inputs.update(stages[dependency])
+        inputs.update(current_context)
+        return inputs
+
+    async def _timed_stage(
+        self, stage: Mapping[str, Any], inputs: Mapping[str, Any]
+    ) -> tuple[dict[str, Any], float]:
+        """Execute a stage and return its output with the elapsed seconds."""
+        stage_start_time = time.perf_counter()
+        stage_output = await self._execute_stage(stage, inputs)
+        return stage_output, time.perf_counter() - stage_start_time
+
+    def _record_stage(
+        self,
+        stage: Mapping[str, Any],
+        outcome: tuple[dict[str, Any], float] | BaseException,
+        current_context: dict[str, Any],
+        result: TaskHandlerResult,
+    ) -> None:
+        """Fold a stage outcome into the result, audit trail and context."""
+        stage_name = stage["name"]
+        stage_tags = {"stage": stage_name}
+        pending_metrics: list[MetricRecord] = []
+        try:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            stage_output, stage_duration = outcome
+
+            # Update result with stage output
+            result["stages"][stage_name] = stage_output
+            result["final_status"]["stages_processed"].append(stage_name)
+            result["audit_trail"].append(
+                {
+                    "stage_name": stage_name,
+                    "timestamp": utc_now_str(),
+                    "duration_sec": stage_duration,
+                }
+            )
+            pending_metrics.append(
+                ("stage_duration", stage_duration, MetricType.HISTOGRAM, stage_tags)
+            )
+
+            # Check for errors in stage output
+            if "error" in stage_output:
+                error_msg = f"Stage '{stage_name}' failed: {stage_output['error']}"
+                self.logger.error(error_msg, extra={"context": {"stage": stage_name}})
+                pending_metrics.append(
+                    ("stage_errors", 1, MetricType.COUNTER, stage_tags)
+                )
+                result["warnings"].append(error_msg)
+                return
+
+            # Update context with stage output
+            current_context[stage.get("output_key", stage_name)] = stage_output
+
+        except Exception as e:
+            error_msg = f"Stage '{stage_name}' execution failed: {e!s}"
+            self.logger.error(
+                error_msg, extra={"context": {"stage": stage_name, "error": str(e)}}
+            )
+            pending_metrics.append(("stage_errors", 1, MetricType.COUNTER, stage_tags))
+            result["warnings"].append(error_msg)
+        finally:
+            self.logger_manager.log_metrics_batch(pending_metrics)
+
     async def _execute_stage(
-        self, stage: dict[str, Any], context: dict[str, Any]
+        self, stage: Mapping[str, Any], context: Mapping[str, Any]
     ) -> dict[str, Any]:
         """Execute a single stage with the given context.
 
+        Stages that declare ``cache_keys`` are memoized on the values of those
+        context keys while caching is enabled, in an LRU bounded by
+        ``cache_max_entries``; error outputs are never cached.
+
         Args:
             stage: Stage configuration containing agent(s) and settings.
             context: Input context for the stage.
@@ -286,11 +436,45 @@ class TaskHandlerAgent(BaseAgent):
             Stage output dictionary.
         """
         stage_name = stage["name"]
-        self.logger.debug(
-            f"Executing stage {stage_name} with context: {context}",
-            extra={"context": {"stage": stage_name}},
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Executing stage %s with context: %s",
+                stage_name,
+                context,
+                extra={"context": {"stage": stage_name}},
+            )
+
+        cache = self._cache
+        cache_key = (
+            _stage_cache_key(stage, context)
+            if cache is not None and "cache_keys" in stage
+            else None
         )
+        if cache is not None and cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                cache.move_to_end(cache_key)
+                self.logger_manager.log_metric(
+                    "cache_hits", 1, MetricType.COUNTER, tags={"stage": stage_name}
+                )
+                # Every run gets its own copy, so callers cannot edit the cache.
+                return copy.deepcopy(cached)
 
+        stage_output = await self._run_stage_agents(stage, context)
+        if cache is not None and cache_key is not None and "error" not in stage_output:
+            try:
+                cache[cache_key] = copy.deepcopy(stage_output)
+            except Exception:  # uncopyable outputs are simply not memoized
+                return stage_output
+            if len(cache) > self._cache_max:
+                cache.popitem(last=False)
+        return stage_output
+
+    async def _run_stage_agents(
+        self, stage: Mapping[str, Any], context: Mapping[str, Any]
+    ) -> dict[str, Any]:
+        """Run the agent or weighted agents configured for a stage."""
+        stage_name = stage["name"]
         if "agents" in stage:
             # Ensemble mode: multiple agents with weights
             results = []
@@ -343,7 +527,7 @@ class TaskHandlerAgent(BaseAgent):
             "final_status": {"stages_processed": [], "iterations": 0},
             "audit_trail": [
                 {
-                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "timestamp": utc_now_str(),
                     "duration_sec": 0.0,
                     "error": msg,
                 }
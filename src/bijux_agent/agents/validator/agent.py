@@ -9,13 +9,20 @@ audit trails, and telemetry.
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
-import hashlib
+import logging
 import time
-from typing import Any, cast
+from typing import Any
 
 from bijux_agent.agents.base import BaseAgent
-from bijux_agent.utilities.logger_manager import LoggerManager, MetricType
+from bijux_agent.utilities.digest import stable_digest
+from bijux_agent.utilities.logger_manager import (
+    LoggerManager,
+    MetricRecord,
+    MetricType,
+)
 
 from .rules import (
     reporting,
@@ -25,6 +32,15 @@ from .rules import (
     schema as schema_walker,
 )
 
+# Invariant log extras, shared instead of rebuilt on every validation.
+_LOG_PRE_HOOK = {"context": {"stage": "pre_hook"}}
+_LOG_CUSTOM_VALIDATOR = {"context": {"stage": "custom_validator"}}
+_LOG_EXTRA_KEYS_CHECK = {"context": {"stage": "extra_keys_check"}}
+_LOG_POST_HOOK = {"context": {"stage": "post_hook"}}
+
+# Upper bound on distinct schemas remembered by the schema cache.
+_MAX_SCHEMA_CACHE = 128
+
 
 class ValidationError(Exception):
     """Exception for validation failures, used for strict mode."""
@@ -72,6 +88,9 @@ class ValidatorAgent(BaseAgent):
                 Optional function called after validation (e.g., add audit info).
         """
         super().__init__(config, logger_manager)
+        self._schema_hash: str | None = None
+        self._schema_keys_cache: frozenset[str] | None = None
+        self._compiled_schema: schema_walker.CompiledSchema | None = None
         self.schema = schema or self.config.get("schema", {})
         self.custom_validator = custom_validator or self.config.get("custom_validator")
         self.pre_hook = pre_hook
@@ -80,7 +99,16 @@ class ValidatorAgent(BaseAgent):
         self.strict = bool(self.config.get("strict", False))
         self.allow_extra = bool(self.config.get("allow_extra", not self.strict))
         self.soft_failure = bool(self.config.get("soft_failure", False))
-        self._schema_cache: dict[str, dict[str, Any]] = {}
+        self.custom_validator_inline = bool(
+            self.config.get("custom_validator_inline", False)
+        )
+        self.parallel_validators = bool(self.config.get("parallel_validators", False))
+        # (validator, is_coroutine_function), refreshed if custom_validator is rebound
+        self._custom_validator_kind: tuple[Any, bool] = (
+            self.custom_validator,
+            asyncio.iscoroutinefunction(self.custom_validator),
+        )
+        self._schema_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self._validation_plugins: list[
             Callable[[Any, dict[str, Any], str], tuple[list[str], dict[str, Any]]]
         ] = []
@@ -113,11 +141,41 @@ class ValidatorAgent(BaseAgent):
         """List of capabilities this agent supports."""
         return ["validation"]
 
+    def get_schema(self) -> dict[str, Any]:
+        """Return the schema that results fingerprint via ``schema_hash``."""
+        return self.schema
+
+    @property
+    def schema(self) -> dict[str, Any]:
+        """The validation schema; rebinding it drops the derived schema caches."""
+        return self._schema
+
+    @schema.setter
+    def schema(self, schema: dict[str, Any]) -> None:
+        self._schema = schema
+        self.invalidate_schema_cache()
+
+    def invalidate_schema_cache(self) -> None:
+        """Drop the schema hash, key set and compiled rules.
+
+        Call this after editing ``schema`` in place; rebinding ``schema`` does it
+        automatically.
+        """
+        self._schema_hash = None
+        self._schema_keys_cache = None
+        self._compiled_schema = None
+
+    def get_schema_hash(self) -> str:
+        """Return the schema fingerprint, hashing once per schema."""
+        if self._schema_hash is None:
+            self._schema_hash = stable_digest(self._schema, digest_size=16)
+        return self._schema_hash
+
     async def _run_payload(self, context: dict[str, Any]) -> dict[str, Any]:
         """Entry point for validation (async).
 
         Validates data against the schema, applies custom validators and plugins,
-        and returns detailed status, errors, warnings, audit info, and schema snapshot.
+        and returns detailed status, errors, warnings, audit info, and schema hash.
 
         Args:
             context: Input context containing the data to validate under 'data'.
@@ -125,14 +183,15 @@ class ValidatorAgent(BaseAgent):
         Returns:
             Dictionary containing validation results.
         """
-        context_id = context.get(
-            "context_id", str(hashlib.sha256(str(context).encode()).hexdigest())
-        )
+        context_id = context.get("context_id")
+        if context_id is None:
+            context_id = stable_digest(context)
         with self.logger.context(agent="ValidatorAgent", context_id=context_id):
-            self.logger.info(
-                "Starting validation operation",
-                extra={"context": {"stage": "init", "context_id": context_id}},
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Starting validation operation",
+                    extra={"context": {"stage": "init", "context_id": context_id}},
+                )
 
         # Extract data to validate
         data: Any = (
@@ -141,94 +200,128 @@ class ValidatorAgent(BaseAgent):
             else context
         )
 
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        # Counters are flushed in one batch so the metrics lock is taken once.
+        metrics: list[MetricRecord] = []
         start_time = time.perf_counter()
         errors: list[str] = []
         warnings: list[str] = []
-        audit: dict[str, Any] = {
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
-        }
+        timestamp = reporting.utc_timestamp()
 
         # Pre-hook
         if self.pre_hook:
             try:
                 data = self.pre_hook(data)
-                self.logger.debug(
-                    "Pre-hook applied successfully",
-                    extra={"context": {"stage": "pre_hook"}},
-                )
-                self.logger_manager.log_metric(
-                    "pre_hook_success",
-                    1,
-                    MetricType.COUNTER,
-                    tags={"stage": "pre_hook"},
+                if debug_enabled:
+                    self.logger.debug(
+                        "Pre-hook applied successfully", extra=_LOG_PRE_HOOK
+                    )
+                metrics.append(
+                    ("pre_hook_success", 1, MetricType.COUNTER, {"stage": "pre_hook"})
                 )
             except Exception as e:
                 error_msg = f"Pre-hook failed: {e!s}"
                 self.logger.error(
                     error_msg, extra={"context": {"stage": "pre_hook", "error": str(e)}}
                 )
-                self.logger_manager.log_metric(
-                    "pre_hook_errors", 1, MetricType.COUNTER, tags={"stage": "pre_hook"}
+                metrics.append(
+                    ("pre_hook_errors", 1, MetricType.COUNTER, {"stage": "pre_hook"})
                 )
+                self.logger_manager.log_metrics_batch(metrics)
                 return await reporting.error_result(
                     self, error_msg, context, "pre_hook"
                 )
+        data_dict: dict[str, Any] | None = data if isinstance(data, dict) else None
 
-        # Cache schema hash for optimization
-        schema_hash = hashlib.sha256(str(self.schema).encode()).hexdigest()
+        schema_hash = self.get_schema_hash()
         if schema_hash not in self._schema_cache:
             self._schema_cache[schema_hash] = self.schema
-            self.logger.debug(
-                "Schema cached",
-                extra={
-                    "context": {"stage": "schema_cache", "schema_hash": schema_hash}
-                },
-            )
-            self.logger_manager.log_metric(
-                "schema_cache_miss",
-                1,
-                MetricType.COUNTER,
-                tags={"stage": "schema_cache"},
+            if len(self._schema_cache) > _MAX_SCHEMA_CACHE:
+                self._schema_cache.popitem(last=False)
+            if debug_enabled:
+                self.logger.debug(
+                    "Schema cached",
+                    extra={
+                        "context": {"stage": "schema_cache", "schema_hash": schema_hash}
+                    },
+                )
+            metrics.append(
+                ("schema_cache_miss", 1, MetricType.COUNTER, {"stage": "schema_cache"})
             )
         else:
-            self.logger.debug(
-                "Schema cache hit",
-                extra={
-                    "context": {"stage": "schema_cache", "schema_hash": schema_hash}
-                },
-            )
-            self.logger_manager.log_metric(
-                "schema_cache_hit",
-                1,
-                MetricType.COUNTER,
-                tags={"stage": "schema_cache"},
+            self._schema_cache.move_to_end(schema_hash)
+            if debug_enabled:
+                self.logger.debug(
+                    "Schema cache hit",
+                    extra={
+                        "context": {"stage": "schema_cache", "schema_hash": schema_hash}
+                    },
+                )
+            metrics.append(
+                ("schema_cache_hit", 1, MetricType.COUNTER, {"stage": "schema_cache"})
             )
 
-        # Core validation
-        validation_errors, validation_audit = schema_walker.validate_recursive(
-            self, data, self.schema, path=""
-        )
+        # Core validation; dict schemas are compiled once until rebound
+        if isinstance(self.schema, dict):
+            if self._compiled_schema is None:
+                self._compiled_schema = schema_walker.compile_schema(self.schema)
+            validation_errors, validation_audit = schema_walker.validate_compiled(
+                self, data, self._compiled_schema
+            )
+        else:
+            validation_errors, validation_audit = schema_walker.validate_recursive(
+                self, data, self.schema, path=""
+            )
         errors.extend(validation_errors)
-        audit.update(validation_audit)
+        audit: dict[str, Any] = {"timestamp": timestamp, **validation_audit}
+
+        # With parallel_validators, plugins run while the custom validator is
+        # in flight; their output is merged afterwards in the sequential order.
+        custom_task: asyncio.Task[dict[str, Any]] | None = None
+        plugin_errors: list[str] = []
+        plugin_audit: dict[str, Any] = {}
+        if (
+            self.parallel_validators
+            and self.custom_validator
+            and data_dict is not None
+            and self._validation_plugins
+        ):
+            custom_task = asyncio.create_task(
+                rule_execution.run_custom_validator(self, data_dict, self.config)
+            )
+            await asyncio.sleep(0)
+            plugin_errors = rule_execution.run_validation_plugins(
+                self, data, plugin_audit, metrics
+            )
 
         # Custom validator
-        if self.custom_validator:
+        if self.custom_validator and data_dict is None:
+            warning_msg = "Custom validator skipped: data is not a dict"
+            warnings.append(warning_msg)
+            self.logger.warning(warning_msg, extra=_LOG_CUSTOM_VALIDATOR)
+        elif self.custom_validator:
             try:
-                user_result = await rule_execution.run_custom_validator(
-                    self, cast(dict[str, Any], data), self.config
+                user_result = await (
+                    custom_task
+                    if custom_task is not None
+                    else rule_execution.run_custom_validator(
+                        self, data_dict, self.config
+                    )
                 )
                 errors.extend(user_result.get("errors", []))
                 warnings.extend(user_result.get("warnings", []))
                 audit["custom_validator"] = user_result.get("details", {})
-                self.logger.debug(
-                    "Custom validator applied",
-                    extra={"context": {"stage": "custom_validator"}},
-                )
-                self.logger_manager.log_metric(
-                    "custom_validator_success",
-                    1,
-                    MetricType.COUNTER,
-                    tags={"stage": "custom_validator"},
+                if debug_enabled:
+                    self.logger.debug(
+                        "Custom validator applied", extra=_LOG_CUSTOM_VALIDATOR
+                    )
+                metrics.append(
+                    (
+                        "custom_validator_success",
+                        1,
+                        MetricType.COUNTER,
+                        {"stage": "custom_validator"},
+                    )
                 )
             except Exception as e:
                 error_msg = f"Custom validator failed: {e!s}"
@@ -236,46 +329,55 @@ class ValidatorAgent(BaseAgent):
                     error_msg,
                     extra={"context": {"stage": "custom_validator", "error": str(e)}},
                 )
-                self.logger_manager.log_metric(
-                    "custom_validator_errors",
-                    1,
-                    MetricType.COUNTER,
-                    tags={"stage": "custom_validator"},
+                metrics.append(
+                    (
+                        "custom_validator_errors",
+                        1,
+                        MetricType.COUNTER,
+                        {"stage": "custom_validator"},
+                    )
                 )
                 errors.append(error_msg)
 
         # Extra keys check
-        if self.strict and isinstance(data, dict):
-            schema_keys = set(schema_walker.get_all_schema_keys(self.schema))
-            data_keys = set(schema_walker.get_all_data_keys(data))
-            extra_keys = data_keys - schema_keys
+        if self.strict and data_dict is not None:
+            if self._schema_keys_cache is None:
+                self._schema_keys_cache = frozenset(
+                    schema_walker.get_all_schema_keys(self.schema)
+                )
+            # Flat payloads need no key-path walk; the dict view diffs in C.
+            if any(isinstance(value, dict) for value in data_dict.values()):
+                data_keys = schema_walker.get_all_data_keys(data_dict)
+                extra_keys = data_keys - self._schema_keys_cache
+            else:
+                extra_keys = data_dict.keys() - self._schema_keys_cache
             if extra_keys and not self.allow_extra:
                 warning_msg = f"Unexpected extra keys: {sorted(extra_keys)}"
                 warnings.append(warning_msg)
-                self.logger.warning(
-                    warning_msg, extra={"context": {"stage": "extra_keys_check"}}
-                )
-
-        plugin_errors = rule_execution.run_validation_plugins(self, data, audit)
-        errors.extend(plugin_errors)
+                self.logger.warning(warning_msg, extra=_LOG_EXTRA_KEYS_CHECK)
+
+        if custom_task is not None:
+            errors.extend(plugin_errors)
+            audit.update(plugin_audit)
+        elif self._validation_plugins:
+            errors.extend(
+                rule_execution.run_validation_plugins(self, data, audit, metrics)
+            )
 
         duration = time.perf_counter() - start_time
         result, status = reporting.build_validation_result(
-            self, data, errors, warnings, audit, duration
+            schema_hash, errors, warnings, audit, duration
         )
 
         if self.post_hook:
             try:
-                result = self.post_hook(cast(dict[str, Any], data), result)
-                self.logger.debug(
-                    "Post-hook applied successfully",
-                    extra={"context": {"stage": "post_hook"}},
-                )
-                self.logger_manager.log_metric(
-                    "post_hook_success",
-                    1,
-                    MetricType.COUNTER,
-                    tags={"stage": "post_hook"},
+                result = self.post_hook(data, result)
+                if debug_enabled:
+                    self.logger.debug(
+                        "Post-hook applied successfully", extra=_LOG_POST_HOOK
+                    )
+                metrics.append(
+                    ("post_hook_success", 1, MetricType.COUNTER, {"stage": "post_hook"})
                 )
             except Exception as e:
                 error_msg = f"Post-hook failed: {e!s}"
@@ -283,25 +385,24 @@ class ValidatorAgent(BaseAgent):
                     error_msg,
                     extra={"context": {"stage": "post_hook", "error": str(e)}},
                 )
-                self.logger_manager.log_metric(
-                    "post_hook_errors",
-                    1,
-                    MetricType.COUNTER,
-                    tags={"stage": "post_hook"},
+                metrics.append(
+                    ("post_hook_errors", 1, MetricType.COUNTER, {"stage": "post_hook"})
                 )
                 warnings.append(error_msg)
 
-        reporting.log_validation_completion(self, result, status, duration)
-
-        await self.logger.async_log(
-            "INFO",
-            "Validation operation completed",
-            {
-                "status": status,
-                "duration_sec": result["duration_sec"],
-                "context_id": context_id,
-            },
-        )
+        reporting.log_validation_completion(self, result, status, duration, metrics)
+        self.logger_manager.log_metrics_batch(metrics)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            await self.logger.async_log(
+                "INFO",
+                "Validation operation completed",
+                {
+                    "status": status,
+                    "duration_sec": result["duration_sec"],
+                    "context_id": context_id,
+                },
+            )
 
         if self.strict and not result["valid"] and not self.soft_failure:
             raise ValidationError(f"Validation failed: {errors}")
@@ -2,34 +2,42 @@
 
 from __future__ import annotations
 
-import time
+import logging
 from typing import Any
 
-from bijux_agent.utilities.logger_manager import MetricType
+from bijux_agent.utilities.logger_manager import MetricRecord, MetricType
+from bijux_agent.utilities.timestamps import AUDIT_UTC_FORMAT, utc_now_str
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time for audit entries, at second precision."""
+    return utc_now_str(AUDIT_UTC_FORMAT)
 
 
 def build_validation_result(
-    agent: Any,
-    data: Any,
+    schema_hash: str,
     errors: list[str],
     warnings: list[str],
     audit: dict[str, Any],
     duration: float,
 ) -> tuple[dict[str, Any], str]:
     """Construct the structured validation result."""
-    status = "valid" if not errors else "invalid"
     valid = not errors
+    status = "valid" if valid else "invalid"
+    action_plan: list[str] = []
+    if errors:
+        plan_append = action_plan.append
+        for error in errors:
+            plan_append("Fix validation error: " + str(error))
     result = {
         "validation_status": status,
         "valid": valid,
         "errors": errors,
         "warnings": warnings,
         "audit": audit,
-        "schema": agent.schema,
+        "schema_hash": schema_hash,
         "duration_sec": round(duration, 4),
-        "action_plan": (
-            [f"Fix validation error: {error}" for error in errors] if errors else []
-        ),
+        "action_plan": action_plan,
     }
     return result, status
 
@@ -39,40 +47,47 @@ def log_validation_completion(
     result: dict[str, Any],
     status: str,
     duration: float,
+    metrics: list[MetricRecord] | None = None,
 ) -> None:
-    """Log completion metrics and async info."""
+    """Log completion metrics and async info.
+
+    Metrics are appended to ``metrics`` for the caller to flush in one batch;
+    without it they are flushed here.
+    """
     errors = result["errors"]
     warnings = result["warnings"]
-    agent.logger.info(
-        "Validation completed",
-        extra={
-            "context": {
-                "stage": "completion",
-                "status": status,
-                "duration_sec": result["duration_sec"],
-                "error_count": len(errors),
-                "warning_count": len(warnings),
-            }
-        },
-    )
-    agent.logger_manager.log_metric(
-        "validation_duration",
-        duration,
-        MetricType.HISTOGRAM,
-        tags={"stage": "completion", "status": status},
-    )
-    agent.logger_manager.log_metric(
-        "validation_errors",
-        len(errors),
-        MetricType.COUNTER,
-        tags={"stage": "completion"},
-    )
-    agent.logger_manager.log_metric(
-        "validation_warnings",
-        len(warnings),
-        MetricType.COUNTER,
-        tags={"stage": "completion"},
-    )
+    if agent.logger.isEnabledFor(logging.INFO):
+        agent.logger.info(
+            "Validation completed",
+            extra={
+                "context": {
+                    "stage": "completion",
+                    "status": status,
+                    "duration_sec": result["duration_sec"],
+                    "error_count": len(errors),
+                    "warning_count": len(warnings),
+                }
+            },
+        )
+    completion: list[MetricRecord] = [
+        (
+            "validation_duration",
+            duration,
+            MetricType.HISTOGRAM,
+            {"stage": "completion", "status": status},
+        ),
+        ("validation_errors", len(errors), MetricType.COUNTER, {"stage": "completion"}),
+        (
+            "validation_warnings",
+            len(warnings),
+            MetricType.COUNTER,
+            {"stage": "completion"},
+        ),
+    ]
+    if metrics is None:
+        agent.logger_manager.log_metrics_batch(completion)
+    else:
+        metrics.extend(completion)
 
 
 def persistence_error(
@@ -86,9 +101,9 @@ def persistence_error(
         "warnings": [],
         "audit": {
             "stage": stage,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
+            "timestamp": utc_timestamp(),
         },
-        "schema": agent.schema,
+        "schema_hash": agent.get_schema_hash(),
         "duration_sec": 0.0,
         "action_plan": [f"Fix error: {msg}"],
     }
@@ -3,30 +3,45 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Any
 
-from bijux_agent.utilities.logger_manager import MetricType
+from bijux_agent.utilities.logger_manager import MetricRecord, MetricType
 
 
 def run_validation_plugins(
-    agent: Any, data: dict[str, Any], audit: dict[str, Any]
+    agent: Any,
+    data: dict[str, Any],
+    audit: dict[str, Any],
+    metrics: list[MetricRecord] | None = None,
 ) -> list[str]:
-    """Run registered validation plugins and update audit."""
+    """Run registered validation plugins and update audit.
+
+    Counters are appended to ``metrics`` for the caller to flush in one batch;
+    without it they are flushed here once all plugins have run.
+    """
+    pending: list[MetricRecord] = [] if metrics is None else metrics
     errors: list[str] = []
+    debug_enabled = agent.logger.isEnabledFor(logging.DEBUG)
     for plugin in agent._validation_plugins:
         try:
+            name = plugin.__name__
             plugin_errors, plugin_audit = plugin(data, agent.schema, "plugin")
             errors.extend(plugin_errors)
-            audit[f"plugin_{plugin.__name__}"] = plugin_audit
-            agent.logger.debug(
-                f"Validation plugin {plugin.__name__} applied",
-                extra={"context": {"stage": "validation_plugin"}},
-            )
-            agent.logger_manager.log_metric(
-                "validation_plugin_runs",
-                1,
-                MetricType.COUNTER,
-                tags={"stage": "validation_plugin", "plugin": plugin.__name__},
+            audit["plugin_" + name] = plugin_audit
+            if debug_enabled:
+                agent.logger.debug(
+                    "Validation plugin %s applied",
+                    name,
+                    extra={"context": {"stage": "validation_plugin"}},
+                )
+            pending.append(
+                (
+                    "validation_plugin_runs",
+                    1,
+                    MetricType.COUNTER,
+                    {"stage": "validation_plugin", "plugin": name},
+                )
             )
         except Exception as e:
             error_msg = f"Validation plugin {plugin.__name__} failed: {e!s}"
@@ -35,21 +50,38 @@ def run_validation_plugins(
                 error_msg,
                 extra={"context": {"stage": "validation_plugin", "error": str(e)}},
             )
-            agent.logger_manager.log_metric(
-                "validation_plugin_errors",
-                1,
-                MetricType.COUNTER,
-                tags={"stage": "validation_plugin", "plugin": plugin.__name__},
+            pending.append(
+                (
+                    "validation_plugin_errors",
+                    1,
+                    MetricType.COUNTER,
+                    {"stage": "validation_plugin", "plugin": plugin.__name__},
+                )
             )
+    if metrics is None:
+        agent.logger_manager.log_metrics_batch(pending)
     return errors
 
 
 async def run_custom_validator(
     agent: Any, data: dict[str, Any], config: dict[str, Any]
 ) -> dict[str, Any]:
-    """Invoke the custom validator, supporting both sync and async variants."""
-    if asyncio.iscoroutinefunction(agent.custom_validator):
-        result = await agent.custom_validator(data, config)
+    """Invoke the custom validator, supporting both sync and async variants.
+
+    Sync validators run in a worker thread unless the agent is configured with
+    ``custom_validator_inline`` or the validator sets ``_sync_inline``, in which
+    case they are cheap enough to call directly on the event loop.
+    """
+    validator = agent.custom_validator
+    if agent._custom_validator_kind[0] is not validator:
+        agent._custom_validator_kind = (
+            validator,
+            asyncio.iscoroutinefunction(validator),
+        )
+    if agent._custom_validator_kind[1]:
+        result = await validator(data, config)
         return result  # type: ignore[return-value]
-    result = await asyncio.to_thread(agent.custom_validator, data, config)
+    if agent.custom_validator_inline or getattr(validator, "_sync_inline", False):
+        return validator(data, config)  # type: ignore[no-any-return]
+    result = await asyncio.to_thread(validator, data, config)
     return result  # type: ignore[return-value]
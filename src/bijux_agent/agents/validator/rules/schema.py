@@ -2,327 +2,522 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 import re
 from typing import Any
 
 from bijux_agent.utilities.logger_manager import MetricType
 
+# Distinct regex patterns kept compiled across schemas and compile passes.
+_MAX_PATTERN_CACHE = 1024
 
-def validate_recursive(
-    agent: Any, data: Any, schema: Any, path: str
+
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """A schema rule with its options resolved ahead of validation."""
+
+    key: str
+    path: str
+    tags: dict[str, str]
+    expected_type: Any
+    allowed: Any = None
+    allowed_set: frozenset[Any] | None = None
+    required: Any = True
+    nested: Any = None
+    default: Any = None
+    pattern: Any = None
+    matcher: re.Pattern[str] | None = None
+    check_pattern: bool = False
+    condition: Any = None
+    min_val: Any = None
+    max_val: Any = None
+    predicate: Any = None
+    check_range: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSchema:
+    """A dict schema resolved into rules, reusable while the schema is unchanged."""
+
+    path: str
+    tags: dict[str, str]
+    rules: tuple[CompiledRule, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledListSchema:
+    """A single-element list schema whose element schema is compiled once.
+
+    The element is compiled relative to the list item, so one compiled element
+    serves every index; item paths are joined on at validation time.
+    """
+
+    path: str
+    element: Any
+
+
+@lru_cache(maxsize=_MAX_PATTERN_CACHE)
+def _cached_pattern(pattern: str | re.Pattern[str]) -> re.Pattern[str] | None:
+    """Compile ``pattern`` once per process; ``None`` if it is not a valid regex."""
+    try:
+        return re.compile(pattern)
+    except (re.error, TypeError):
+        return None
+
+
+def _validation_tags(path: str) -> dict[str, str]:
+    """Build the log/metric tags for a failure at ``path``."""
+    return {"stage": "validation", "path": path}
+
+
+def _allowed_set(allowed: Any) -> frozenset[Any] | None:
+    """Return ``allowed`` as a frozenset for O(1) membership, if it converts."""
+    if not allowed or not isinstance(allowed, (list, tuple, set, frozenset)):
+        return None
+    try:
+        return frozenset(allowed)
+    except TypeError:  # unhashable members keep the sequence scan
+        return None
+
+
+def _compile_pattern(pattern: Any) -> re.Pattern[str] | None:
+    """Compile ``pattern`` up front, leaving invalid ones to fail at match time."""
+    if not pattern:
+        return None
+    try:
+        return _cached_pattern(pattern)
+    except TypeError:  # unhashable pattern
+        return None
+
+
+def _join_path(prefix: str, path: str) -> str:
+    """Join a runtime path prefix (e.g. a list item) onto a compiled path."""
+    if not prefix:
+        return path
+    return f"{prefix}.{path}" if path else prefix
+
+
+def _compile_nested(schema: Any, path: str) -> Any:
+    """Compile dict and single-element list schemas; return anything else as-is."""
+    if isinstance(schema, dict):
+        return compile_schema(schema, path)
+    if isinstance(schema, list) and len(schema) == 1:
+        return CompiledListSchema(path, _compile_nested(schema[0], ""))
+    return schema
+
+
+def compile_schema(schema: dict[str, Any], path: str = "") -> CompiledSchema:
+    """Resolve a dict schema into rules so repeated validation skips the lookups.
+
+    Nested dict and single-element list schemas are compiled recursively; any
+    other nested schema is kept as-is and handed to ``validate_recursive``.
+    """
+    rules: list[CompiledRule] = []
+    for key, rule in schema.items():
+        key_path = f"{path}.{key}" if path else key
+        tags = _validation_tags(key_path)
+        if not isinstance(rule, dict):
+            rules.append(CompiledRule(key, key_path, tags, rule))
+            continue
+        nested = rule.get("schema")
+        pattern = rule.get("pattern")
+        allowed = rule.get("allowed")
+        expected_type = rule.get("type")
+        min_val = rule.get("min")
+        max_val = rule.get("max")
+        rules.append(
+            CompiledRule(
+                key,
+                key_path,
+                tags,
+                expected_type,
+                allowed=allowed,
+                allowed_set=_allowed_set(allowed),
+                required=rule.get("required", True),
+                nested=_compile_nested(nested, key_path) if nested else nested,
+                default=rule.get("default"),
+                pattern=pattern,
+                matcher=_compile_pattern(pattern),
+                check_pattern=bool(pattern) and expected_type is str,
+                condition=rule.get("condition"),
+                min_val=min_val,
+                max_val=max_val,
+                predicate=rule.get("predicate"),
+                check_range=(
+                    (min_val is not None or max_val is not None)
+                    and isinstance(expected_type, type)
+                    and expected_type in (int, float)
+                ),
+            )
+        )
+    return CompiledSchema(path, _validation_tags(path or "root"), tuple(rules))
+
+
+def _is_allowed(val: Any, allowed: Any, allowed_set: frozenset[Any] | None) -> bool:
+    """Check membership through the precomputed set when ``val`` is hashable."""
+    if allowed_set is not None:
+        try:
+            return val in allowed_set
+        except TypeError:
+            pass
+    return val in allowed
+
+
+def validate_compiled(
+    agent: Any, data: Any, compiled: CompiledSchema, prefix: str = ""
 ) -> tuple[list[str], dict[str, Any]]:
-    """Walk the schema and validate data recursively."""
+    """Validate ``data`` against a schema prepared by ``compile_schema``.
+
+    ``prefix`` is prepended to the compiled paths; it is set for list items,
+    whose element schema is compiled once without an index.
+    """
     errors: list[str] = []
     audit: dict[str, Any] = {}
-    tags = {"stage": "validation", "path": path or "root"}
+    path = _join_path(prefix, compiled.path)
 
-    if isinstance(schema, dict):
-        if not isinstance(data, dict):
-            error_msg = f"{path or 'root'}: Expected dict, got {type(data).__name__}"
+    if not isinstance(data, dict):
+        tags = _validation_tags(path or "root") if prefix else compiled.tags
+        error_msg = f"{path or 'root'}: Expected dict, got {type(data).__name__}"
+        errors.append(error_msg)
+        audit[path or "root"] = {
+            "error": "type_mismatch",
+            "expected": "dict",
+            "actual": type(data).__name__,
+        }
+        agent.logger.error(error_msg, extra={"context": tags})
+        agent.logger_manager.log_metric(
+            "type_mismatch_errors", 1, MetricType.COUNTER, tags=tags
+        )
+        return errors, audit
+
+    for rule in compiled.rules:
+        key = rule.key
+        if prefix:
+            key_path = _join_path(prefix, rule.path)
+            key_tags = _validation_tags(key_path)
+        else:
+            key_path = rule.path
+            key_tags = rule.tags
+        expected_type = rule.expected_type
+        allowed = rule.allowed
+        allowed_set = rule.allowed_set
+        required = rule.required
+        nested = rule.nested
+        default = rule.default
+        pattern = rule.pattern
+        matcher = rule.matcher
+        condition = rule.condition
+        min_val = rule.min_val
+        max_val = rule.max_val
+        predicate = rule.predicate
+        val = data.get(key, None)
+
+        if required and key not in data and default is not None:
+            val = data[key] = default
+            agent.logger.debug(
+                f"Applied default value for {key_path}",
+                extra={"context": key_tags},
+            )
+            agent.logger_manager.log_metric(
+                "default_values_applied", 1, MetricType.COUNTER, tags=key_tags
+            )
+
+        if required and key not in data:
+            error_msg = f"{key_path}: Missing required key."
             errors.append(error_msg)
-            audit[path or "root"] = {
-                "error": "type_mismatch",
-                "expected": "dict",
-                "actual": type(data).__name__,
-            }
-            agent.logger.error(error_msg, extra={"context": tags})
+            audit[key_path] = {"error": "missing"}
+            agent.logger.error(error_msg, extra={"context": key_tags})
             agent.logger_manager.log_metric(
-                "type_mismatch_errors", 1, MetricType.COUNTER, tags=tags
+                "missing_key_errors", 1, MetricType.COUNTER, tags=key_tags
             )
-            return errors, audit
-
-        for key, rule in schema.items():
-            val = data.get(key, None)
-            key_path = f"{path}.{key}" if path else key
-            key_tags = {"stage": "validation", "path": key_path}
-
-            if isinstance(rule, dict):
-                expected_type = rule.get("type")
-                allowed = rule.get("allowed")
-                required = rule.get("required", True)
-                nested = rule.get("schema")
-                default = rule.get("default")
-                pattern = rule.get("pattern")
-                condition = rule.get("condition")
-                min_val = rule.get("min")
-                max_val = rule.get("max")
-                predicate = rule.get("predicate")
-            else:
-                expected_type = rule
-                allowed = None
-                required = True
-                nested = None
-                default = None
-                pattern = None
-                condition = None
-                min_val = None
-                max_val = None
-                predicate = None
-
-            if required and key not in data and default is not None:
-                val = data[key] = default
-                agent.logger.debug(
-                    f"Applied default value for {key_path}",
-                    extra={"context": key_tags},
-                )
-                agent.logger_manager.log_metric(
-                    "default_values_applied", 1, MetricType.COUNTER, tags=key_tags
-                )
+            continue
 
-            if required and key not in data:
-                error_msg = f"{key_path}: Missing required key."
+        if key not in data:
+            continue
+
+        if condition and key in data:
+            condition_key = condition.get("key")
+            condition_type = condition.get("type")
+            if condition_key in data and not isinstance(
+                data[condition_key], condition_type
+            ):
+                error_msg = (
+                    f"{key_path}: Condition failed - {condition_key} "
+                    f"must be {condition_type.__name__}"
+                )
                 errors.append(error_msg)
-                audit[key_path] = {"error": "missing"}
+                audit[key_path] = {
+                    "error": "condition_failed",
+                    "condition": condition,
+                }
                 agent.logger.error(error_msg, extra={"context": key_tags})
                 agent.logger_manager.log_metric(
-                    "missing_key_errors", 1, MetricType.COUNTER, tags=key_tags
+                    "condition_errors", 1, MetricType.COUNTER, tags=key_tags
                 )
                 continue
 
-            if key not in data:
-                continue
+        if expected_type:
+            val_checked = val
+            try:
+                if agent.type_cast and not isinstance(val, expected_type):
+                    if expected_type is int and isinstance(val, (str, float)):
+                        val_checked = int(float(val))
+                    elif expected_type is float and isinstance(val, str):
+                        val_checked = float(val)
+                    elif expected_type is str:
+                        val_checked = str(val)
+                    else:
+                        raise ValueError(
+                            f"Cannot cast {type(val).__name__} to "
+                            f"{expected_type.__name__}"
+                        )
+                    data[key] = val_checked
+                    agent.logger.debug(
+                        f"Type cast successful for {key_path}",
+                        extra={"context": key_tags},
+                    )
+                    agent.logger_manager.log_metric(
+                        "type_cast_success",
+                        1,
+                        MetricType.COUNTER,
+                        tags=key_tags,
+                    )
+                elif not isinstance(val, expected_type):
+                    error_msg = (
+                        f"{key_path}: Expected {expected_type.__name__}, "
+                        f"got {type(val).__name__}"
+                    )
+                    errors.append(error_msg)
+                    audit[key_path] = {
+                        "error": "type_mismatch",
+                        "expected": expected_type.__name__,
+                        "actual": type(val).__name__,
+                    }
+                    agent.logger.error(error_msg, extra={"context": key_tags})
+                    agent.logger_manager.log_metric(
+                        "type_mismatch_errors",
+                        1,
+                        MetricType.COUNTER,
+                        tags=key_tags,
+                    )
+                    continue
 
-            if condition and key in data:
-                condition_key = condition.get("key")
-                condition_type = condition.get("type")
-                if condition_key in data and not isinstance(
-                    data[condition_key], condition_type
+                if rule.check_pattern and not (
+                    matcher.match(val_checked)
+                    if matcher is not None
+                    else re.match(pattern, val_checked)
                 ):
                     error_msg = (
-                        f"{key_path}: Condition failed - {condition_key} "
-                        f"must be {condition_type.__name__}"
+                        f"{key_path}: Value '{val_checked}' does not match "
+                        f"pattern {pattern}"
                     )
                     errors.append(error_msg)
                     audit[key_path] = {
-                        "error": "condition_failed",
-                        "condition": condition,
+                        "error": "pattern_mismatch",
+                        "pattern": str(pattern),
+                        "value": val_checked,
                     }
                     agent.logger.error(error_msg, extra={"context": key_tags})
                     agent.logger_manager.log_metric(
-                        "condition_errors", 1, MetricType.COUNTER, tags=key_tags
+                        "pattern_mismatch_errors",
+                        1,
+                        MetricType.COUNTER,
+                        tags=key_tags,
                     )
                     continue
 
-            if expected_type:
-                val_checked = val
-                try:
-                    if agent.type_cast and not isinstance(val, expected_type):
-                        if expected_type is int and isinstance(val, (str, float)):
-                            val_checked = int(float(val))
-                        elif expected_type is float and isinstance(val, str):
-                            val_checked = float(val)
-                        elif expected_type is str:
-                            val_checked = str(val)
-                        else:
-                            raise ValueError(
-                                f"Cannot cast {type(val).__name__} to "
-                                f"{expected_type.__name__}"
-                            )
-                        data[key] = val_checked
-                        agent.logger.debug(
-                            f"Type cast successful for {key_path}",
-                            extra={"context": key_tags},
-                        )
-                        agent.logger_manager.log_metric(
-                            "type_cast_success",
-                            1,
-                            MetricType.COUNTER,
-                            tags=key_tags,
-                        )
-                    elif not isinstance(val, expected_type):
-                        error_msg = (
-                            f"{key_path}: Expected {expected_type.__name__}, "
-                            f"got {type(val).__name__}"
-                        )
-                        errors.append(error_msg)
-                        audit[key_path] = {
-                            "error": "type_mismatch",
-                            "expected": expected_type.__name__,
-                            "actual": type(val).__name__,
-                        }
-                        agent.logger.error(error_msg, extra={"context": key_tags})
-                        agent.logger_manager.log_metric(
-                            "type_mismatch_errors",
-                            1,
-                            MetricType.COUNTER,
-                            tags=key_tags,
-                        )
-                        continue
-
-                    if (
-                        pattern
-                        and isinstance(expected_type, type)
-                        and expected_type is str
-                        and not re.match(pattern, val_checked)
-                    ):
+                if rule.check_range:
+                    if min_val is not None and val_checked < min_val:
                         error_msg = (
-                            f"{key_path}: Value '{val_checked}' does not match "
-                            f"pattern {pattern}"
+                            f"{key_path}: Value {val_checked} is below "
+                            f"minimum {min_val}"
                         )
                         errors.append(error_msg)
                         audit[key_path] = {
-                            "error": "pattern_mismatch",
-                            "pattern": str(pattern),
+                            "error": "range_violation",
+                            "min": min_val,
                             "value": val_checked,
                         }
                         agent.logger.error(error_msg, extra={"context": key_tags})
                         agent.logger_manager.log_metric(
-                            "pattern_mismatch_errors",
+                            "range_violation_errors",
                             1,
                             MetricType.COUNTER,
                             tags=key_tags,
                         )
                         continue
-
-                    if (
-                        (min_val is not None or max_val is not None)
-                        and isinstance(expected_type, type)
-                        and expected_type in (int, float)
-                    ):
-                        if min_val is not None and val_checked < min_val:
-                            error_msg = (
-                                f"{key_path}: Value {val_checked} is below "
-                                f"minimum {min_val}"
-                            )
-                            errors.append(error_msg)
-                            audit[key_path] = {
-                                "error": "range_violation",
-                                "min": min_val,
-                                "value": val_checked,
-                            }
-                            agent.logger.error(error_msg, extra={"context": key_tags})
-                            agent.logger_manager.log_metric(
-                                "range_violation_errors",
-                                1,
-                                MetricType.COUNTER,
-                                tags=key_tags,
-                            )
-                            continue
-                        if max_val is not None and val_checked > max_val:
-                            error_msg = (
-                                f"{key_path}: Value {val_checked} exceeds "
-                                f"maximum {max_val}"
-                            )
-                            errors.append(error_msg)
-                            audit[key_path] = {
-                                "error": "range_violation",
-                                "max": max_val,
-                                "value": val_checked,
-                            }
-                            agent.logger.error(error_msg, extra={"context": key_tags})
-                            agent.logger_manager.log_metric(
-                                "range_violation_errors",
-                                1,
-                                MetricType.COUNTER,
-                                tags=key_tags,
-                            )
-                            continue
-
-                    if predicate and not predicate(val_checked):
+                    if max_val is not None and val_checked > max_val:
                         error_msg = (
-                            f"{key_path}: Value {val_checked} failed custom "
-                            f"predicate check"
+                            f"{key_path}: Value {val_checked} exceeds maximum {max_val}"
                         )
                         errors.append(error_msg)
                         audit[key_path] = {
-                            "error": "predicate_failed",
+                            "error": "range_violation",
+                            "max": max_val,
                             "value": val_checked,
                         }
                         agent.logger.error(error_msg, extra={"context": key_tags})
                         agent.logger_manager.log_metric(
-                            "predicate_errors",
+                            "range_violation_errors",
                             1,
                             MetricType.COUNTER,
                             tags=key_tags,
                         )
                         continue
 
-                    if nested:
-                        child_errors, child_audit = validate_recursive(
-                            agent, val_checked, nested, key_path
-                        )
-                        errors.extend(child_errors)
-                        audit[key_path] = child_audit
-                    else:
-                        audit[key_path] = {
-                            "value": val_checked,
-                            "type": type(val_checked).__name__,
-                            "expected": expected_type.__name__,
-                            "allowed": allowed,
-                            "required": required,
-                        }
-                except Exception as e:
-                    error_msg = f"{key_path}: Type cast failed ({e!s})"
-                    errors.append(error_msg)
-                    audit[key_path] = {
-                        "error": "type_cast_failed",
-                        "exception": str(e),
-                    }
-                    agent.logger.error(error_msg, extra={"context": key_tags})
-                    agent.logger_manager.log_metric(
-                        "type_cast_errors", 1, MetricType.COUNTER, tags=key_tags
-                    )
-                    continue
-
-                if allowed and val not in allowed:
+                if predicate and not predicate(val_checked):
                     error_msg = (
-                        f"{key_path}: Value '{val}' not in allowed set {allowed}"
+                        f"{key_path}: Value {val_checked} failed custom predicate check"
                     )
                     errors.append(error_msg)
                     audit[key_path] = {
-                        "error": "invalid_value",
-                        "allowed": allowed,
-                        "value": val,
+                        "error": "predicate_failed",
+                        "value": val_checked,
                     }
                     agent.logger.error(error_msg, extra={"context": key_tags})
                     agent.logger_manager.log_metric(
-                        "invalid_value_errors",
+                        "predicate_errors",
                         1,
                         MetricType.COUNTER,
                         tags=key_tags,
                     )
+                    continue
 
-    elif isinstance(schema, list) and len(schema) == 1:
-        expected_type = schema[0]
-        if not isinstance(data, list):
-            error_msg = f"{path}: Expected list, got {type(data).__name__}"
-            errors.append(error_msg)
-            audit[path] = {
-                "error": "type_mismatch",
-                "expected": "list",
-                "actual": type(data).__name__,
-            }
-            agent.logger.error(error_msg, extra={"context": tags})
-            agent.logger_manager.log_metric(
-                "type_mismatch_errors", 1, MetricType.COUNTER, tags=tags
+                if nested:
+                    if isinstance(nested, CompiledSchema):
+                        child_errors, child_audit = validate_compiled(
+                            agent, val_checked, nested, prefix
+                        )
+                    elif isinstance(nested, CompiledListSchema):
+                        child_errors, child_audit = validate_compiled_list(
+                            agent, val_checked, nested, prefix
+                        )
+                    else:
+                        child_errors, child_audit = validate_recursive(
+                            agent, val_checked, nested, key_path
+                        )
+                    errors.extend(child_errors)
+                    audit[key_path] = child_audit
+                else:
+                    audit[key_path] = {
+                        "value": val_checked,
+                        "type": type(val_checked).__name__,
+                        "expected": expected_type.__name__,
+                        "allowed": allowed,
+                        "required": required,
+                    }
+            except Exception as e:
+                error_msg = f"{key_path}: Type cast failed ({e!s})"
+                errors.append(error_msg)
+                audit[key_path] = {
+                    "error": "type_cast_failed",
+                    "exception": str(e),
+                }
+                agent.logger.error(error_msg, extra={"context": key_tags})
+                agent.logger_manager.log_metric(
+                    "type_cast_errors", 1, MetricType.COUNTER, tags=key_tags
+                )
+                continue
+
+            if allowed and not _is_allowed(val, allowed, allowed_set):
+                error_msg = f"{key_path}: Value '{val}' not in allowed set {allowed}"
+                errors.append(error_msg)
+                audit[key_path] = {
+                    "error": "invalid_value",
+                    "allowed": allowed,
+                    "value": val,
+                }
+                agent.logger.error(error_msg, extra={"context": key_tags})
+                agent.logger_manager.log_metric(
+                    "invalid_value_errors",
+                    1,
+                    MetricType.COUNTER,
+                    tags=key_tags,
+                )
+
+    return errors, audit
+
+
+def validate_compiled_list(
+    agent: Any, data: Any, compiled: CompiledListSchema, prefix: str = ""
+) -> tuple[list[str], dict[str, Any]]:
+    """Validate every item of ``data`` against the precompiled element schema."""
+    errors: list[str] = []
+    audit: dict[str, Any] = {}
+    path = _join_path(prefix, compiled.path)
+
+    if not isinstance(data, list):
+        error_msg = f"{path}: Expected list, got {type(data).__name__}"
+        errors.append(error_msg)
+        audit[path] = {
+            "error": "type_mismatch",
+            "expected": "list",
+            "actual": type(data).__name__,
+        }
+        tags = _validation_tags(path or "root")
+        agent.logger.error(error_msg, extra={"context": tags})
+        agent.logger_manager.log_metric(
+            "type_mismatch_errors", 1, MetricType.COUNTER, tags=tags
+        )
+        return errors, audit
+
+    element = compiled.element
+    for idx, item in enumerate(data):
+        item_path = f"{path}[{idx}]"
+        if isinstance(element, CompiledSchema):
+            child_errors, child_audit = validate_compiled(
+                agent, item, element, item_path
+            )
+        elif isinstance(element, CompiledListSchema):
+            child_errors, child_audit = validate_compiled_list(
+                agent, item, element, item_path
             )
-            return errors, audit
-        for idx, item in enumerate(data):
-            item_path = f"{path}[{idx}]"
+        else:
             child_errors, child_audit = validate_recursive(
-                agent, item, expected_type, item_path
+                agent, item, element, item_path
             )
-            errors.extend(child_errors)
-            audit[item_path] = child_audit
+        errors.extend(child_errors)
+        audit[item_path] = child_audit
+
+    return errors, audit
+
+
+def validate_recursive(
+    agent: Any, data: Any, schema: Any, path: str
+) -> tuple[list[str], dict[str, Any]]:
+    """Walk the schema and validate data recursively.
+
+    Dict and single-element list schemas are compiled once per call, so list
+    items share one compiled element schema instead of recompiling it per item.
+    """
+    if isinstance(schema, dict) or (isinstance(schema, list) and len(schema) == 1):
+        compiled = _compile_nested(schema, path)
+        if isinstance(compiled, CompiledSchema):
+            return validate_compiled(agent, data, compiled)
+        return validate_compiled_list(agent, data, compiled)
+
+    errors: list[str] = []
+    audit: dict[str, Any] = {}
+    if not isinstance(data, schema):
+        error_msg = f"{path}: Expected {schema.__name__}, got {type(data).__name__}"
+        errors.append(error_msg)
+        audit[path] = {
+            "error": "type_mismatch",
+            "expected": schema.__name__,
+            "actual": type(data).__name__,
+        }
+        tags = _validation_tags(path or "root")
+        agent.logger.error(error_msg, extra={"context": tags})
+        agent.logger_manager.log_metric(
+            "type_mismatch_errors", 1, MetricType.COUNTER, tags=tags
+        )
     else:
-        if not isinstance(data, schema):
-            error_msg = f"{path}: Expected {schema.__name__}, got {type(data).__name__}"
-            errors.append(error_msg)
-            audit[path] = {
-                "error": "type_mismatch",
-                "expected": schema.__name__,
-                "actual": type(data).__name__,
-            }
-            agent.logger.error(error_msg, extra={"context": tags})
-            agent.logger_manager.log_metric(
-                "type_mismatch_errors", 1, MetricType.COUNTER, tags=tags
-            )
-        else:
-            audit[path] = {
-                "value": data,
-                "expected": schema.__name__,
-                "type": type(data).__name__,
-            }
+        audit[path] = {
+            "value": data,
+            "expected": schema.__name__,
+            "type": type(data).__name__,
+        }
 
     return errors, audit
 
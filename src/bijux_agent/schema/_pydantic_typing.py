@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+from collections.abc import Mapping
+from typing import Any, Protocol, Self
 
 
 class ConfigDict(Protocol):
@@ -24,3 +25,8 @@ class BaseModel:  # pragma: no cover (type-only helper)
 
     def dict(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         return {}
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        return self
@@ -6,7 +6,7 @@ from collections.abc import Mapping
 from datetime import datetime
 from typing import Annotated, Any
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, TypeAdapter
 
 from bijux_agent.constants import CONTRACT_VERSION
 from bijux_agent.enums import (
@@ -83,6 +83,10 @@ class AgentOutput(TypedBaseModel):
             )
 
 
+# Shared list validator; building a TypeAdapter compiles a schema, so do it once.
+AGENT_OUTPUTS_ADAPTER: TypeAdapter[list[AgentOutput]] = TypeAdapter(list[AgentOutput])
+
+
 class AgentError(TypedBaseModel):
     model_config = ConfigDict(
         frozen=True,
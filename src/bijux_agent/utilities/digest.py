@@ -0,0 +1,51 @@
+"""Stable digests of structured values, used for cache keys and trace ids."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import orjson
+
+# Values orjson would otherwise encode lossily (dataclass and datetime fields,
+# str/int/dict subclasses) are passed through and, with no default, rejected.
+_STRICT_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+
+
+def canonical_bytes(value: Any) -> bytes:
+    """Serialize ``value`` independently of key insertion order.
+
+    Values orjson cannot encode even with ``default=str`` (e.g. integers beyond
+    64 bits, which never reach ``default``) fall back to their ``repr``.
+    """
+    try:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    except TypeError:  # includes orjson.JSONEncodeError
+        return repr(value).encode()
+
+
+def stable_digest(value: Any, digest_size: int = 32) -> str:
+    """Return a process-independent BLAKE2b hex digest of ``value``."""
+    return hashlib.blake2b(canonical_bytes(value), digest_size=digest_size).hexdigest()
+
+
+def strict_digest(value: Any, digest_size: int = 32) -> str | None:
+    """Digest ``value`` like ``stable_digest``, or ``None`` unless it is plain JSON.
+
+    Nothing is stringified, so distinct values never share a digest; use this
+    where a collision would hand back another input's cached result.
+    """
+    try:
+        encoded = orjson.dumps(value, option=_STRICT_OPTIONS)
+    except TypeError:  # includes orjson.JSONEncodeError
+        return None
+    return hashlib.blake2b(encoded, digest_size=digest_size).hexdigest()
@@ -37,6 +37,9 @@ class LLMResponse:
 class LLMBackend:
     """Base class for LLM backends."""
 
+    # Whether generate_batch submits prompts to the engine as one batch.
+    supports_batch: bool = False
+
     async def generate(
         self, prompt: str, max_tokens: int | None, session: ClientSession
     ) -> LLMResponse:
@@ -55,6 +58,35 @@ class LLMBackend:
         """
         raise NotImplementedError("Subclasses must implement the generate method")
 
+    async def generate_batch(
+        self, prompts: list[str], max_tokens: int | None, session: ClientSession
+    ) -> list[LLMResponse]:
+        """Generate responses for several prompts in one backend submission.
+
+        Backends fronting a batching engine (for example a continuous-batching
+        inference server) override this and set ``supports_batch``. The default
+        issues the prompts concurrently through ``generate``.
+
+        Args:
+            prompts: The input prompts for the LLM.
+            max_tokens: Maximum number of tokens to generate per prompt.
+            session: The aiohttp ClientSession for making requests.
+
+        Returns:
+            One LLMResponse per prompt, in prompt order; a prompt whose call
+            raised carries the exception message in ``error``.
+        """
+        responses = await asyncio.gather(
+            *(self.generate(prompt, max_tokens, session) for prompt in prompts),
+            return_exceptions=True,
+        )
+        return [
+            LLMResponse(content="", metadata={}, error=str(response))
+            if isinstance(response, BaseException)
+            else response
+            for response in responses
+        ]
+
 
 class DeepSeekBackend(LLMBackend):
     """Backend for interacting with the DeepSeek API."""
@@ -268,6 +300,35 @@ class LLMUtils:
         Raises:
             Exception: If all retries fail or the response is invalid.
         """
+        ok, content, error, cause = await self._generate_with_retries(
+            prompt, max_tokens
+        )
+        if not ok:
+            raise Exception(f"All retries failed: {error}") from cause
+        return content
+
+    async def generate_safe(
+        self, prompt: str, max_tokens: int | None = None
+    ) -> tuple[bool, str, str | None]:
+        """Generate a response, reporting failure as a value instead of raising.
+
+        Suited to fan-out callers where backend failures are routine (rate
+        limits) and raising per prompt would be wasted work.
+
+        Args:
+            prompt: The input prompt for the LLM.
+            max_tokens: Maximum number of tokens to generate.
+
+        Returns:
+            ``(ok, text, error)``: the generated text with ``error`` None on
+            success, or ``ok`` False, empty text and the last error message.
+        """
+        ok, content, error, _ = await self._generate_with_retries(prompt, max_tokens)
+        return ok, content, error
+
+    async def _generate_with_retries(
+        self, prompt: str, max_tokens: int | None
+    ) -> tuple[bool, str, str | None, BaseException | None]:
         context_id = hashlib.sha256(prompt.encode()).hexdigest()
         with self.logger.context(agent="LLMUtils", context_id=context_id):
             self.logger.info(
@@ -281,59 +342,16 @@ class LLMUtils:
                 },
             )
 
+        error: str | None = None
+        cause: BaseException | None = None
         for attempt in range(1, self.max_retries + 1):
+            if attempt > 1:
+                await asyncio.sleep(self.retry_delay * (2 ** (attempt - 2)))
             try:
                 async with aiohttp.ClientSession(timeout=self.timeout) as session:
                     start_time = time.time()
                     response = await self.backend.generate(prompt, max_tokens, session)
                     duration = time.time() - start_time
-
-                    self.logger_manager.log_metric(
-                        "llm_request_duration",
-                        duration,
-                        MetricType.HISTOGRAM,
-                        tags={"backend": self.backend_name, "attempt": str(attempt)},
-                    )
-                    self.logger_manager.log_metric(
-                        "llm_requests",
-                        1,
-                        MetricType.COUNTER,
-                        tags={"backend": self.backend_name, "status": "success"},
-                    )
-
-                    if response.error:
-                        self.logger.warning(
-                            f"LLM generation failed: {response.error}",
-                            extra={
-                                "context": {"attempt": attempt, "duration": duration}
-                            },
-                        )
-                        self.logger_manager.log_metric(
-                            "llm_request_errors",
-                            1,
-                            MetricType.COUNTER,
-                            tags={
-                                "backend": self.backend_name,
-                                "attempt": str(attempt),
-                            },
-                        )
-                        if attempt == self.max_retries:
-                            raise Exception(f"All retries failed: {response.error}")
-                        await asyncio.sleep(self.retry_delay * (2 ** (attempt - 1)))
-                        continue
-
-                    self.logger.info(
-                        "LLM generation completed",
-                        extra={
-                            "context": {
-                                "stage": "completion",
-                                "duration": duration,
-                                "response_length": len(response.content),
-                            }
-                        },
-                    )
-                    return response.content
-
             except Exception as e:
                 self.logger.error(
                     f"LLM generation failed on attempt {attempt}: {e!s}",
@@ -345,11 +363,52 @@ class LLMUtils:
                     MetricType.COUNTER,
                     tags={"backend": self.backend_name, "attempt": str(attempt)},
                 )
-                if attempt == self.max_retries:
-                    raise Exception(f"All retries failed: {e!s}") from e
-                await asyncio.sleep(self.retry_delay * (2 ** (attempt - 1)))
+                error, cause = str(e), e
+                continue
+
+            self.logger_manager.log_metric(
+                "llm_request_duration",
+                duration,
+                MetricType.HISTOGRAM,
+                tags={"backend": self.backend_name, "attempt": str(attempt)},
+            )
+            self.logger_manager.log_metric(
+                "llm_requests",
+                1,
+                MetricType.COUNTER,
+                tags={"backend": self.backend_name, "status": "success"},
+            )
 
-        raise Exception("Unexpected error: Retry loop exited without result")
+            if response.error:
+                self.logger.warning(
+                    f"LLM generation failed: {response.error}",
+                    extra={"context": {"attempt": attempt, "duration": duration}},
+                )
+                self.logger_manager.log_metric(
+                    "llm_request_errors",
+                    1,
+                    MetricType.COUNTER,
+                    tags={
+                        "backend": self.backend_name,
+                        "attempt": str(attempt),
+                    },
+                )
+                error, cause = response.error, None
+                continue
+
+            self.logger.info(
+                "LLM generation completed",
+                extra={
+                    "context": {
+                        "stage": "completion",
+                        "duration": duration,
+                        "response_length": len(response.content),
+                    }
+                },
+            )
+            return True, response.content, None, None
+
+        return False, "", error, cause
 
     async def batch_generate(
         self, prompts: list[str], max_tokens: int | None = None
@@ -413,6 +472,64 @@ class LLMUtils:
         )
         return responses
 
+    @property
+    def supports_batch(self) -> bool:
+        """Whether the configured backend accepts native batch submissions."""
+        return self.backend.supports_batch
+
+    async def generate_batch(
+        self, prompts: list[str], max_tokens: int | None = None
+    ) -> list[str | Exception]:
+        """Submit prompts to the backend as a single batch.
+
+        Unlike ``batch_generate`` this performs no per-prompt retries and does
+        not hide failures, so callers can handle them per prompt.
+
+        Args:
+            prompts: List of input prompts for the LLM.
+            max_tokens: Maximum number of tokens to generate for each prompt.
+
+        Returns:
+            One entry per prompt: the generated text, or an exception describing
+            why that prompt failed.
+        """
+        start_time = time.time()
+        try:
+            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+                responses = await self.backend.generate_batch(
+                    prompts, max_tokens, session
+                )
+        except Exception as e:
+            self.logger.error(
+                f"Batch submission failed: {e!s}",
+                extra={"context": {"backend": self.backend_name}},
+            )
+            return [e] * len(prompts)
+        self.logger_manager.log_metric(
+            "llm_batch_duration",
+            time.time() - start_time,
+            MetricType.HISTOGRAM,
+            tags={"backend": self.backend_name},
+        )
+        self.logger_manager.log_metric(
+            "llm_batch_requests",
+            len(prompts),
+            MetricType.COUNTER,
+            tags={"backend": self.backend_name},
+        )
+        results: list[str | Exception] = [
+            RuntimeError(response.error) if response.error else response.content
+            for response in responses[: len(prompts)]
+        ]
+        if len(responses) != len(prompts):
+            self.logger.error(
+                f"Batch returned {len(responses)} responses for {len(prompts)} prompts",
+                extra={"context": {"backend": self.backend_name}},
+            )
+            missing = RuntimeError("No response returned for prompt")
+            results.extend([missing] * (len(prompts) - len(results)))
+        return results
+
     async def get_telemetry(self) -> dict[str, Any]:
         """Retrieve telemetry metrics for the LLMUtils instance.
 
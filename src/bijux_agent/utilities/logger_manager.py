@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Iterator, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass
 import datetime
@@ -41,6 +41,10 @@ class MetricType(Enum):
     HISTOGRAM = "histogram"
 
 
+# (name, value, metric_type, tags) as accepted by LoggerManager.log_metric.
+MetricRecord = tuple[str, int | float, MetricType, Mapping[str, str] | None]
+
+
 @dataclass
 class LoggerConfig:
     """Configuration for LoggerManager with advanced settings."""
@@ -278,6 +282,10 @@ class CustomLogger:
         self.logger = logger
         self.manager = manager
 
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 - mirrors logging.Logger
+        """Return whether a record at ``level`` would be processed."""
+        return self.logger.isEnabledFor(level)
+
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a debug message."""
         self.logger.debug(msg, *args, **kwargs)
@@ -418,66 +426,88 @@ class LoggerManager:
         if not self.config.telemetry_enabled:
             return
 
-        tags_dict: dict[str, str] = dict(tags or {})
         with self._metrics_lock:
-            metric = self._telemetry_metrics[metric_name]
-            metric["type"] = metric_type.value
-            metric["tags"] = tags_dict
-
-            if metric_type == MetricType.COUNTER:
-                metric["value"] += value
-            elif metric_type == MetricType.GAUGE:
-                metric["value"] = value
-            elif metric_type == MetricType.HISTOGRAM and self.config.histogram_buckets:
-                metric["value"] += value
-                histogram = metric.get("histogram")
-                if isinstance(histogram, dict):
-                    for bucket in self.config.histogram_buckets:
-                        if value <= bucket:
-                            histogram[f"le_{bucket}"] = (
-                                histogram.get(f"le_{bucket}", 0) + 1
-                            )
-                            break
-
-            self._logger.debug(
-                f"Metric recorded: {metric_name} = {value}",
-                extra={
-                    "metric_name": metric_name,
-                    "metric_type": metric_type.value,
-                    "tags": tags_dict,
-                    "metrics": {
-                        metric_name: {"value": value, "type": metric_type.value}
-                    },
-                },
-            )
+            self._record_metric(metric_name, value, metric_type, dict(tags or {}))
 
-            if self.config.metric_export_callback:
-                metric_data = {
-                    "name": metric_name,
-                    "type": metric_type.value,
-                    "value": metric["value"],
-                    "tags": tags_dict,
-                    "histogram": (
-                        dict(metric["histogram"])
-                        if metric_type == MetricType.HISTOGRAM
-                        else None
-                    ),
-                    "timestamp": datetime.datetime.now().isoformat(),
-                }
-                try:
-                    task = asyncio.create_task(self._async_export_metric(metric_data))
-                    self._metric_tasks.append(task)
-                    self._metric_tasks = [t for t in self._metric_tasks if not t.done()]
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(self._async_export_metric(metric_data))
-                    loop.close()
-                except Exception as e:
-                    self._logger.error(
-                        f"Metric export failed: {e}",
-                        extra={"metric_name": metric_name, "error": str(e)},
-                    )
+    def log_metrics_batch(
+        self,
+        metrics: Iterable[MetricRecord],
+    ) -> None:
+        """Log several metrics while holding the metrics lock once.
+
+        Args:
+            metrics: ``(name, value, metric_type, tags)`` tuples, recorded in
+                order exactly as :meth:`log_metric` would record them.
+        """
+        if not self.config.telemetry_enabled:
+            return
+
+        with self._metrics_lock:
+            for metric_name, value, metric_type, tags in metrics:
+                self._record_metric(metric_name, value, metric_type, dict(tags or {}))
+
+    def _record_metric(
+        self,
+        metric_name: str,
+        value: int | float,
+        metric_type: MetricType,
+        tags_dict: dict[str, str],
+    ) -> None:
+        """Update one metric; callers must hold ``_metrics_lock``."""
+        metric = self._telemetry_metrics[metric_name]
+        metric["type"] = metric_type.value
+        metric["tags"] = tags_dict
+
+        if metric_type == MetricType.COUNTER:
+            metric["value"] += value
+        elif metric_type == MetricType.GAUGE:
+            metric["value"] = value
+        elif metric_type == MetricType.HISTOGRAM and self.config.histogram_buckets:
+            metric["value"] += value
+            histogram = metric.get("histogram")
+            if isinstance(histogram, dict):
+                for bucket in self.config.histogram_buckets:
+                    if value <= bucket:
+                        histogram[f"le_{bucket}"] = histogram.get(f"le_{bucket}", 0) + 1
+                        break
+
+        self._logger.debug(
+            f"Metric recorded: {metric_name} = {value}",
+            extra={
+                "metric_name": metric_name,
+                "metric_type": metric_type.value,
+                "tags": tags_dict,
+                "metrics": {metric_name: {"value": value, "type": metric_type.value}},
+            },
+        )
+
+        if self.config.metric_export_callback:
+            metric_data = {
+                "name": metric_name,
+                "type": metric_type.value,
+                "value": metric["value"],
+                "tags": tags_dict,
+                "histogram": (
+                    dict(metric["histogram"])
+                    if metric_type == MetricType.HISTOGRAM
+                    else None
+                ),
+                "timestamp": datetime.datetime.now().isoformat(),
+            }
+            try:
+                task = asyncio.create_task(self._async_export_metric(metric_data))
+                self._metric_tasks.append(task)
+                self._metric_tasks = [t for t in self._metric_tasks if not t.done()]
+            except RuntimeError:
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                loop.run_until_complete(self._async_export_metric(metric_data))
+                loop.close()
+            except Exception as e:
+                self._logger.error(
+                    f"Metric export failed: {e}",
+                    extra={"metric_name": metric_name, "error": str(e)},
+                )
 
     async def _async_export_metric(self, metric_data: dict[str, Any]) -> None:
         """Asynchronously export metric data."""
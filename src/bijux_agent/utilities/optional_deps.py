@@ -0,0 +1,12 @@
+"""Helpers for optional third-party dependencies."""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+
+def require_dependency(module: ModuleType | None, name: str) -> ModuleType:
+    """Return ``module``, raising if the optional dependency failed to import."""
+    if module is None:
+        raise RuntimeError(f"{name} dependency is required but not installed")
+    return module
@@ -0,0 +1,20 @@
+"""Second-precision UTC timestamps, formatted once per second per format."""
+
+from __future__ import annotations
+
+import time
+
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+AUDIT_UTC_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Last formatted second per format, reused until the wall clock ticks over.
+_last_formatted: dict[str, tuple[int, str]] = {}
+
+
+def utc_now_str(fmt: str = ISO_UTC_FORMAT) -> str:
+    """Return the current UTC time formatted with ``fmt``, at second precision."""
+    now = int(time.time())
+    last = _last_formatted.get(fmt)
+    if last is None or last[0] != now:
+        last = _last_formatted[fmt] = (now, time.strftime(fmt, time.gmtime(now)))
+    return last[1]
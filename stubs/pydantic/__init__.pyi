@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Mapping, Sequence
+from typing import Any, Dict, Generic, Iterable, Mapping, Sequence, TypeVar
 
 from .config import ConfigDict
 
@@ -39,5 +39,14 @@ class BaseModel:
     def json(self, *, indent: int | None = None) -> str: ...
 
 
+_T = TypeVar("_T")
+
+
+class TypeAdapter(Generic[_T]):
+    def __init__(self, type: Any) -> None: ...
+
+    def validate_python(self, object: Any) -> _T: ...
+
+
 Field: Any
-__all__ = ["BaseModel", "ConfigDict", "Field"]
+__all__ = ["BaseModel", "ConfigDict", "Field", "TypeAdapter"]
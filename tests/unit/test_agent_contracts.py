@@ -143,3 +143,55 @@ async def test_identical_input_produces_identical_plan(tmp_path):
     second_snapshot = second_plan.model_dump()
     assert first_snapshot["artifacts"]["plan"] == second_snapshot["artifacts"]["plan"]
     assert first_plan.artifacts == second_plan.artifacts
+
+
+def test_trusted_output_keeps_confidence_guard(tmp_path):
+    logger = make_logger(tmp_path)
+    agent = PlannerAgent({}, logger)
+    payload = {
+        "text": "ok",
+        "artifacts": {},
+        "scores": {"quality": 0.8},
+        "confidence": 0.5,
+        "metadata": {"contract_version": CONTRACT_VERSION},
+    }
+    assert agent.validate_output(payload, trusted=True).confidence == 0.5
+    with pytest.raises(ValueError, match="Confidence must be between 0 and 1"):
+        agent.validate_output({**payload, "confidence": 1.5}, trusted=True)
+
+
+def test_bulk_validate_outputs_validates_each_payload(tmp_path):
+    logger = make_logger(tmp_path)
+    agent = PlannerAgent({}, logger)
+    payloads = [
+        {
+            "text": f"ok-{index}",
+            "confidence": confidence,
+            "metadata": {"contract_version": CONTRACT_VERSION},
+        }
+        for index, confidence in enumerate((0.2, 0.9))
+    ]
+    outputs = agent.execution_kernel.bulk_validate_outputs(payloads)
+    assert [output.confidence for output in outputs] == [0.2, 0.9]
+    with pytest.raises(ValidationError):
+        agent.execution_kernel.bulk_validate_outputs(
+            [*payloads, {**payloads[0], "confidence": 1.5}]
+        )
+
+
+def test_run_scope_validates_without_extra_transitions(tmp_path):
+    logger = make_logger(tmp_path)
+    agent = PlannerAgent({}, logger)
+    with agent.execution_kernel.run_scope() as scope:
+        validated = scope.validate_context_nocheck(
+            {"task_goal": "scoped", "context_id": "unit-scope", "payload": {}}
+        )
+        output = scope.validate_output_nocheck(
+            {
+                "text": "ok",
+                "confidence": 0.4,
+                "metadata": {"contract_version": CONTRACT_VERSION},
+            }
+        )
+    assert validated.context_id == "unit-scope"
+    assert output.confidence == 0.4
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from bijux_agent.utilities.digest import canonical_bytes, stable_digest, strict_digest
+
+
+def test_stable_digest_ignores_key_order() -> None:
+    first = stable_digest({"text": "abc", "meta": {"b": 1, "a": 2}})
+    second = stable_digest({"meta": {"a": 2, "b": 1}, "text": "abc"})
+    assert first == second
+    assert first != stable_digest({"text": "abd", "meta": {"a": 2, "b": 1}})
+
+
+def test_unencodable_values_fall_back_to_repr() -> None:
+    value = {"n": {"type": int, "max": 2**64}}
+    assert canonical_bytes(value) == repr(value).encode()
+    assert stable_digest(value) == stable_digest({"n": {"type": int, "max": 2**64}})
+    assert len(stable_digest(value, digest_size=16)) == 32
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+def test_strict_digest_rejects_values_it_would_stringify() -> None:
+    assert strict_digest({"b": [1, 2.0], "a": None}) == strict_digest(
+        {"a": None, "b": [1, 2.0]}
+    )
+    assert strict_digest({"v": object()}) is None
+    assert strict_digest({"v": _Point(1)}) is None
+    assert strict_digest({"v": 2**64}) is None
@@ -74,3 +74,93 @@ async def test_execution_kernel_delegation_snapshot(tmp_path: Path) -> None:
         "error_result": _normalize_payload(error_result),
     }
     assert actual == snapshot
+
+
+@pytest.mark.asyncio
+async def test_error_result_logs_in_background(tmp_path: Path) -> None:
+    agent = KernelProbeAgent({}, make_logger(tmp_path))
+    logged: list[str] = []
+
+    async def record(level: str, message: str, context: Any = None) -> None:
+        logged.append(message)
+
+    agent.logger.async_log = record  # type: ignore[method-assign]
+    payload = await agent.execution_kernel.error_result(
+        "boom", {"context_id": "ctx-log"}, "unit"
+    )
+
+    assert payload["error"] == "boom"
+    await agent.shutdown()
+    assert logged == ["boom"]
+
+
+class DefaultReviseAgent(BaseAgent):
+    async def _run_payload(self, context: dict[str, Any]) -> dict[str, Any]:
+        return context
+
+
+@pytest.mark.asyncio
+async def test_revise_agent_input_matches_dict_path(tmp_path: Path) -> None:
+    agent = DefaultReviseAgent({}, make_logger(tmp_path))
+    context = AgentInput(
+        task_goal="unit-test",
+        payload={"alpha": 1},
+        context_id="ctx-revise",
+        metadata={"origin": "unit"},
+    )
+
+    await agent.run(context)
+    typed = await agent.revise(context, "tighten")
+    untyped = await agent.revise(
+        agent.execution_kernel.normalize_context(context), "tighten"
+    )
+
+    assert typed == untyped
+    assert typed["payload"] == {"alpha": 1, "feedback": {"message": "tighten"}}
+    assert context.payload == {"alpha": 1}
+
+
+class _Note(str):
+    pass
+
+
+class _Notes(list):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_revise_wraps_feedback_subclasses_like_their_base(
+    tmp_path: Path,
+) -> None:
+    agent = KernelProbeAgent({}, make_logger(tmp_path))
+    context = {"task_goal": "unit-test", "context_id": "ctx-sub"}
+
+    await agent.run(context)
+    note = await agent.revise(context, _Note("tighten"))
+    notes = await agent.revise(context, _Notes(["a", "b"]))
+
+    assert note["feedback"] == {"message": "tighten"}
+    assert notes["feedback"] == {"messages": ["a", "b"]}
+
+
+@pytest.mark.asyncio
+async def test_error_result_does_not_share_cached_input_dicts(tmp_path: Path) -> None:
+    agent = KernelProbeAgent({}, make_logger(tmp_path))
+    context = AgentInput(
+        task_goal="unit-test",
+        payload={"alpha": 1},
+        context_id="ctx-error",
+        metadata={"origin": "unit"},
+    )
+    kernel = agent.execution_kernel
+
+    result = await kernel.error_result("boom", context, "unit")
+    result["input"]["payload"]["alpha"] = 2
+    result["input"]["metadata"]["origin"] = "edited"
+
+    assert context.payload == {"alpha": 1}
+    assert context.metadata == {"origin": "unit"}
+
+    context.payload["alpha"] = 3
+    assert kernel.normalize_context_mutable(context)["alpha"] == 3
+    await agent.shutdown()
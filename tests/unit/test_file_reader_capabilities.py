@@ -37,6 +37,8 @@ async def test_structured_extractor_parses_json(tmp_path: Path) -> None:
     extractor = StructuredExtractor(create_file_audit=_audit_stub)
     result = await extractor.extract_json_file(path)
     assert result["parsed"] == {"alpha": 1}
+    assert result["structure"]["type"] == "object"
+    assert result["structure"]["keys"] == ["alpha"]
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from bijux_agent.agents import JudgeAgent
+from bijux_agent.agents.judge import agent as judge_module
+from bijux_agent.constants import CONTRACT_VERSION
+from bijux_agent.schema import AgentOutput
+from bijux_agent.utilities.logger_manager import LoggerConfig, LoggerManager
+
+
+def _output(confidence: float, scores: dict[str, float]) -> AgentOutput:
+    return AgentOutput(
+        text="candidate",
+        scores=scores,
+        confidence=confidence,
+        metadata={"contract_version": CONTRACT_VERSION},
+    )
+
+
+def _outputs() -> list[AgentOutput]:
+    return [
+        _output(0.5, {"quality": 0.8, "risk": 0.2}),
+        _output(1.0, {"quality": 0.2}),
+    ]
+
+
+def test_aggregate_scores_weights_by_confidence(tmp_path):
+    judge = JudgeAgent({}, LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")))
+    aggregated, total_weight = judge._aggregate_scores(_outputs())
+    assert total_weight == pytest.approx(1.5)
+    assert list(aggregated) == ["quality", "risk"]
+    assert aggregated["quality"] == pytest.approx(0.4)
+    assert aggregated["risk"] == pytest.approx(0.2 / 3)
+
+
+def test_vectorized_aggregation_matches_loop(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    judge = JudgeAgent({}, LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")))
+    expected, expected_weight = judge._aggregate_scores(_outputs())
+    monkeypatch.setattr(judge_module, "VECTORIZE_MIN_CELLS", 0)
+    vectorized, weight = judge._aggregate_scores(_outputs())
+    assert weight == pytest.approx(expected_weight)
+    assert list(vectorized) == list(expected)
+    for label, value in expected.items():
+        assert vectorized[label] == pytest.approx(value)
+
+
+@pytest.mark.asyncio
+async def test_judgment_confidence_is_mean_of_candidates(tmp_path):
+    judge = JudgeAgent({}, LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")))
+    result = await judge.run(
+        {
+            "task_goal": "judge candidates",
+            "context_id": "judge-unit",
+            "payload": {
+                "agent_outputs": [o.model_dump() for o in _outputs()],
+            },
+        }
+    )
+    assert result.confidence == pytest.approx(0.75)
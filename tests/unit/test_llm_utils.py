@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from bijux_agent.utilities.llm_utils import LLMBackend, LLMResponse, LLMUtils
+
+
+class _ScriptedBackend(LLMBackend):
+    def __init__(self, responses: list[LLMResponse]) -> None:
+        self.responses = responses
+        self.calls = 0
+
+    async def generate(
+        self, prompt: str, max_tokens: int | None, session: Any
+    ) -> LLMResponse:
+        response = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        return response
+
+
+def _llm(tmp_path, responses: list[LLMResponse]) -> LLMUtils:
+    llm = LLMUtils(
+        {"llms": {"deepseek": {"api_key": "test"}}, "log_dir": str(tmp_path)},
+        max_retries=2,
+        retry_delay=0.0,
+    )
+    llm.backend = _ScriptedBackend(responses)
+    return llm
+
+
+@pytest.mark.asyncio
+async def test_generate_safe_reports_failure_as_value(tmp_path):
+    llm = _llm(tmp_path, [LLMResponse(content="", metadata={}, error="rate limited")])
+    assert await llm.generate_safe("prompt") == (False, "", "rate limited")
+    with pytest.raises(Exception, match="All retries failed: rate limited"):
+        await llm.generate("prompt")
+
+
+@pytest.mark.asyncio
+async def test_generate_safe_retries_then_succeeds(tmp_path):
+    llm = _llm(
+        tmp_path,
+        [
+            LLMResponse(content="", metadata={}, error="busy"),
+            LLMResponse(content="done", metadata={}),
+        ],
+    )
+    assert await llm.generate_safe("prompt") == (True, "done", None)
+    assert llm.backend.calls == 2
+
+
+class _FlakyBackend(LLMBackend):
+    async def generate(
+        self, prompt: str, max_tokens: int | None, session: Any
+    ) -> LLMResponse:
+        if prompt == "bad":
+            raise ConnectionError("reset by peer")
+        return LLMResponse(content=prompt.upper(), metadata={})
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_isolates_failed_prompts(tmp_path):
+    llm = _llm(tmp_path, [])
+    llm.backend = _FlakyBackend()
+    results = await llm.generate_batch(["ok", "bad", "fine"])
+    assert results[0] == "OK"
+    assert isinstance(results[1], RuntimeError)
+    assert str(results[1]) == "reset by peer"
+    assert results[2] == "FINE"
+
+
+class _ShortBatchBackend(LLMBackend):
+    supports_batch = True
+
+    async def generate_batch(
+        self, prompts: list[str], max_tokens: int | None, session: Any
+    ) -> list[LLMResponse]:
+        return [LLMResponse(content=prompts[0], metadata={})]
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_pads_missing_responses(tmp_path):
+    llm = _llm(tmp_path, [])
+    llm.backend = _ShortBatchBackend()
+    results = await llm.generate_batch(["a", "b", "c"])
+    assert results[0] == "a"
+    assert len(results) == 3
+    assert all(isinstance(result, RuntimeError) for result in results[1:])
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import sys
+
+import pytest
+
+from bijux_agent.agents.summarizer import core as core_module
+from bijux_agent.agents.summarizer.core import (
+    SummarizerAgent,
+    _result_cache_key,
+)
+from bijux_agent.agents.summarizer.rules import abstractive, postprocessing
+from bijux_agent.utilities.logger_manager import LoggerConfig, LoggerManager
+
+
+class _FakeLLM:
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, prompt: str, max_tokens: int | None = None) -> str:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if self.fail_on is not None and self.fail_on in prompt:
+            raise RuntimeError("backend unavailable")
+        return prompt.split("manner:\n\n", 1)[1]
+
+
+def _agent(tmp_path, **config) -> SummarizerAgent:
+    return SummarizerAgent(
+        {"strategy": "abstractive", **config},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+    )
+
+
+def _sections(*contents: str) -> list[dict[str, object]]:
+    return [
+        {"heading": f"H{index}", "content": content, "relevance_score": 1.0}
+        for index, content in enumerate(contents)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_abstractive_chunks_run_concurrently_in_order(tmp_path):
+    agent = _agent(tmp_path, chunk_size=8, llm_concurrency=2)
+    agent.llm = _FakeLLM(fail_on="bbbb")
+    summary = await abstractive.generate_abstractive_summary(
+        agent, _sections("aaaa", "bbbb", "cccc"), "", "goal", []
+    )
+    assert agent.llm.max_in_flight == 2
+    assert summary == "H0\naaaa H1 H2\ncccc"
+
+
+def test_extract_keywords_counts_whole_alphabetic_words(tmp_path):
+    agent = _agent(tmp_path, top_keywords_count=4)
+    text = "Risk risk RISK budget abc123 under_score ab café café"
+    assert agent._extract_keywords(text, "do it") == ["risk", "café", "budget"]
+
+
+@pytest.mark.asyncio
+async def test_abstractive_identical_chunks_share_one_call(tmp_path):
+    agent = _agent(tmp_path, chunk_size=6)
+    agent.llm = _FakeLLM()
+    summary = await abstractive.generate_abstractive_summary(
+        agent, [{"heading": "", "content": "same\n\nsame\n\nsame"}], "", "goal", []
+    )
+    assert len(agent.llm.prompts) == 2
+    assert summary == "same same same"
+
+
+def test_chunk_spans_break_after_delimiters():
+    text = "One. Two? Three\nfour five six"
+    spans = abstractive.chunk_spans(text, 10)
+    assert [text[start:end] for start, end in spans] == [
+        "One. Two?",
+        " Three\n",
+        "four five ",
+        "six",
+    ]
+    assert abstractive.chunk_spans("short", 10) == [(0, 5)]
+
+
+@pytest.mark.asyncio
+async def test_extractive_run_caches_by_text_and_goal(tmp_path):
+    agent = _agent(tmp_path, strategy="extractive")
+    context = {"text": "Budget risk is high. Timeline is fine.", "task_goal": "risk"}
+    first = await agent._run_payload(context)
+    second = await agent._run_payload(dict(context))
+    assert second is first
+    assert first["summary"]["executive_summary"]
+
+
+def test_extract_keywords_reuses_cached_result(tmp_path, monkeypatch):
+    agent = _agent(tmp_path)
+    first = agent._extract_keywords("alpha beta alpha", "goal")
+    monkeypatch.setattr(agent, "_keyword_pattern", None)
+    second = agent._extract_keywords("alpha beta alpha", "goal")
+    assert second == first == ["goal", "alpha", "beta"]
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_abstractive_cache_skips_unchanged_prompts(tmp_path):
+    agent = _agent(tmp_path, chunk_size=8)
+    agent.llm = _FakeLLM()
+    sections = _sections("aaaa", "bbbb")
+    first = await abstractive.generate_abstractive_summary(
+        agent, sections, "", "goal", []
+    )
+    calls = len(agent.llm.prompts)
+    again = await abstractive.generate_abstractive_summary(
+        agent, sections, "", "goal", []
+    )
+    assert again == first
+    assert len(agent.llm.prompts) == calls
+    await abstractive.generate_abstractive_summary(
+        agent, sections, "Revise: ", "goal", []
+    )
+    assert len(agent.llm.prompts) == 2 * calls
+
+
+class _ShorteningLLM(_FakeLLM):
+    async def generate(self, prompt: str, max_tokens: int | None = None) -> str:
+        text = await super().generate(prompt, max_tokens)
+        return text.strip()[: max(1, len(text.strip()) // 2)]
+
+
+@pytest.mark.asyncio
+async def test_abstractive_reduces_long_summaries_iteratively(tmp_path):
+    agent = _agent(tmp_path, chunk_size=8, max_length=6)
+    agent.llm = _ShorteningLLM()
+    summary = await abstractive.generate_abstractive_summary(
+        agent, _sections("aaaaaaa.", "bbbbbbb.", "ccccccc.", "ddddddd."), "", "g", []
+    )
+    assert len(summary) <= 6
+    assert len(agent.llm.prompts) > 8
+
+
+def test_group_summaries_always_pairs_up():
+    groups = abstractive._group_summaries(["aaaa", "bbbb", "cccc"], 4)
+    assert groups == [["aaaa", "bbbb", "cccc"]]
+    groups = abstractive._group_summaries(["aa", "bb", "cc", "dd", "ee"], 6)
+    assert groups == [["aa", "bb"], ["cc", "dd", "ee"]]
+
+
+class _BatchLLM(_FakeLLM):
+    supports_batch = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+
+    async def generate_batch(
+        self, prompts: list[str], max_tokens: int | None = None
+    ) -> list[str | Exception]:
+        self.batches.append(len(prompts))
+        return [await self.generate(prompt, max_tokens) for prompt in prompts]
+
+
+class _BrokenBatchLLM(_BatchLLM):
+    async def generate_batch(
+        self, prompts: list[str], max_tokens: int | None = None
+    ) -> list[str | Exception]:
+        raise ConnectionError("session closed")
+
+
+class _ShortBatchLLM(_BatchLLM):
+    async def generate_batch(
+        self, prompts: list[str], max_tokens: int | None = None
+    ) -> list[str | Exception]:
+        return (await super().generate_batch(prompts, max_tokens))[:1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("llm_type", [_BrokenBatchLLM, _ShortBatchLLM])
+async def test_abstractive_batch_failure_degrades_per_chunk(tmp_path, llm_type):
+    manager = LoggerManager(
+        LoggerConfig(log_dir=tmp_path / "logs", telemetry_enabled=True)
+    )
+    agent = SummarizerAgent({"strategy": "abstractive", "chunk_size": 8}, manager)
+    agent.llm = llm_type()
+    summary = await abstractive.generate_abstractive_summary(
+        agent, _sections("aaaa", "bbbb"), "", "goal", []
+    )
+    assert summary == ""
+    assert manager.get_metrics()["abstractive_summary_errors"]["value"] == 2
+
+
+@pytest.mark.asyncio
+async def test_abstractive_uses_native_batching_when_available(tmp_path):
+    agent = _agent(tmp_path, chunk_size=8)
+    agent.llm = _BatchLLM()
+    summary = await abstractive.generate_abstractive_summary(
+        agent, _sections("aaaa", "bbbb", "cccc"), "", "goal", []
+    )
+    assert agent.llm.batches == [len(agent.llm.prompts)]
+    assert "bbbb" in summary
+
+
+@pytest.mark.asyncio
+async def test_large_inputs_prepare_keywords_and_cache_key_in_parallel(tmp_path):
+    agent = _agent(tmp_path, strategy="extractive")
+    text = "Budget risk is high. " * 4000
+    result = await agent._run_payload({"text": text, "task_goal": "risk"})
+    assert result["input_length"] == len(text)
+    assert agent._extract_keywords(text, "risk")[:2] == ["risk", "budget"]
+
+
+@pytest.mark.asyncio
+async def test_result_cache_evicts_least_recently_used(tmp_path):
+    agent = _agent(tmp_path, strategy="extractive", cache_max_entries=2)
+    contexts = [{"text": f"Entry {name} text.", "task_goal": "x"} for name in "abc"]
+    first = await agent._run_payload(contexts[0])
+    await agent._run_payload(contexts[1])
+    assert await agent._run_payload(contexts[0]) is first
+    await agent._run_payload(contexts[2])
+    assert agent._cache is not None
+    assert list(agent._cache) == [
+        _result_cache_key(contexts[0]["text"], "x"),
+        _result_cache_key(contexts[2]["text"], "x"),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 10, 64])
+def test_iter_chunks_matches_chunk_spans_on_joined_text(chunk_size):
+    pieces = ["Intro", "\n", "One. Two? Three", "\n\n", "", "Four five six.", "x"]
+    text = "".join(pieces)
+    expected = [
+        text[start:end] for start, end in abstractive.chunk_spans(text, chunk_size)
+    ]
+    assert list(abstractive.iter_chunks(pieces, chunk_size)) == expected
+
+
+class _SafeLLM(_FakeLLM):
+    async def generate_safe(
+        self, prompt: str, max_tokens: int | None = None
+    ) -> tuple[bool, str, str | None]:
+        if "bbbb" in prompt:
+            return False, "", "rate limited"
+        return True, await self.generate(prompt, max_tokens), None
+
+
+@pytest.mark.asyncio
+async def test_abstractive_prefers_non_raising_generation(tmp_path):
+    agent = _agent(tmp_path, chunk_size=8)
+    agent.llm = _SafeLLM()
+    summary = await abstractive.generate_abstractive_summary(
+        agent, _sections("aaaa", "bbbb", "cccc"), "", "goal", []
+    )
+    assert summary == "H0\naaaa H1 H2\ncccc"
+
+
+def test_vectorized_repeated_chars_match_counter(monkeypatch):
+    pytest.importorskip("numpy")
+    text = "zebra " * 3 + "x" * 12 + "abracadabra " * 4
+    expected = postprocessing._repeated_chars(text)
+    monkeypatch.setattr(postprocessing, "VECTORIZE_MIN_CHARS", 0)
+    assert postprocessing._repeated_chars(text) == expected
+    assert expected == ["b", "r", "a", "x"]
+
+
+def test_keyword_cache_survives_concurrent_eviction(tmp_path, monkeypatch):
+    monkeypatch.setattr(core_module, "KEYWORD_CACHE_SIZE", 1)
+    agent = _agent(tmp_path)
+    texts = ("alpha " * 5, "beta " * 5)
+
+    def extract(stride: int) -> None:
+        for step in range(10_000):
+            agent._extract_keywords(texts[step // stride % 2], "goal")
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(extract, stride) for stride in range(1, 9)]
+            for future in futures:
+                future.result()
+    finally:
+        sys.setswitchinterval(interval)
+    assert len(agent._keyword_cache) == 1
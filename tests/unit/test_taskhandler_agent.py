@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from bijux_agent.agents.taskhandler.agent import TaskHandlerAgent
+from bijux_agent.utilities.logger_manager import LoggerConfig, LoggerManager
+
+
+class _EchoAgent:
+    def __init__(self, output: dict[str, Any]) -> None:
+        self.output = output
+        self.seen: dict[str, Any] | None = None
+
+    async def run(self, context: Mapping[str, Any]) -> dict[str, Any]:
+        self.seen = dict(context)
+        return dict(self.output)
+
+
+def _handler(tmp_path) -> TaskHandlerAgent:
+    return TaskHandlerAgent({}, LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")))
+
+
+def _context() -> dict[str, Any]:
+    return {"task_goal": "goal", "context_id": "th-unit", "file_path": "doc.txt"}
+
+
+@pytest.mark.asyncio
+async def test_stage_inputs_layer_dependencies_under_context(tmp_path):
+    handler = _handler(tmp_path)
+    first = _EchoAgent({"shared": "first", "only_first": 1})
+    second = _EchoAgent({"shared": "second"})
+    consumer = _EchoAgent({"done": True})
+    handler.set_stages(
+        [
+            {"name": "first", "agent": first},
+            {"name": "second", "agent": second},
+            {
+                "name": "consumer",
+                "agent": consumer,
+                "dependencies": ["first", "second"],
+            },
+        ]
+    )
+    result = await handler.run({**_context(), "only_first": 0})
+
+    assert result["final_status"]["stages_processed"] == ["first", "second", "consumer"]
+    assert consumer.seen is not None
+    assert consumer.seen["shared"] == "second"
+    assert consumer.seen["only_first"] == 0
+    assert consumer.seen["first"] == {"shared": "first", "only_first": 1}
+
+
+class _GateAgent(_EchoAgent):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def run(self, context: Mapping[str, Any]) -> dict[str, Any]:
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        return await super().run(context)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stages_run_independent_levels_together(tmp_path):
+    handler = TaskHandlerAgent(
+        {"concurrent_stages": True},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+    )
+    left, right = _GateAgent({"side": "left"}), _GateAgent({"side": "right"})
+    join = _EchoAgent({"joined": True})
+    handler.set_stages(
+        [
+            {"name": "left", "agent": left},
+            {"name": "join", "agent": join, "dependencies": ["left", "right"]},
+            {"name": "right", "agent": right},
+        ]
+    )
+    result = await handler.run(_context())
+
+    assert _GateAgent.max_in_flight == 2
+    assert result["final_status"]["stages_processed"] == ["left", "right", "join"]
+    assert join.seen is not None
+    assert join.seen["side"] == "right"
+
+
+def test_concurrent_stages_reject_dependency_cycles(tmp_path):
+    handler = TaskHandlerAgent(
+        {"concurrent_stages": True},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+    )
+    stages = [
+        {"name": "a", "agent": _EchoAgent({}), "dependencies": ["b"]},
+        {"name": "b", "agent": _EchoAgent({}), "dependencies": ["a"]},
+    ]
+    with pytest.raises(ValueError, match="cycle"):
+        handler.set_stages(stages)
+
+
+class _CountingAgent(_EchoAgent):
+    def __init__(self, output: dict[str, Any]) -> None:
+        super().__init__(output)
+        self.calls = 0
+
+    async def run(self, context: Mapping[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        return await super().run(context)
+
+
+@pytest.mark.asyncio
+async def test_stages_with_cache_keys_are_memoized(tmp_path):
+    handler = _handler(tmp_path)
+    cached = _CountingAgent({"value": 1})
+    uncached = _CountingAgent({"value": 2})
+    handler.set_stages(
+        [
+            {"name": "cached", "agent": cached, "cache_keys": ("file_path",)},
+            {"name": "uncached", "agent": uncached},
+        ]
+    )
+    await handler.run(_context())
+    await handler.run({**_context(), "task_goal": "other goal"})
+    await handler.run({**_context(), "file_path": "other.txt"})
+
+    assert cached.calls == 2
+    assert uncached.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_stage_metrics_are_recorded_in_one_batch(tmp_path):
+    manager = LoggerManager(
+        LoggerConfig(log_dir=tmp_path / "logs", telemetry_enabled=True)
+    )
+    handler = TaskHandlerAgent({}, manager)
+    handler.set_stages(
+        [
+            {"name": "ok", "agent": _EchoAgent({"value": 1})},
+            {"name": "bad", "agent": _EchoAgent({"error": "boom"})},
+        ]
+    )
+    await handler.run(_context())
+
+    metrics = manager.get_metrics()
+    assert metrics["stage_errors"]["value"] == 1
+    assert metrics["stage_errors"]["tags"] == {"stage": "bad"}
+    assert metrics["stage_duration"]["type"] == "histogram"
+
+
+class _WritingAgent(_EchoAgent):
+    async def run(self, context: Mapping[str, Any]) -> dict[str, Any]:
+        self.received_dict = isinstance(context, dict)
+        context["scratch"] = "leaked"  # type: ignore[index]
+        return await super().run(context)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrent", [False, True])
+async def test_stage_input_writes_do_not_leak(tmp_path, concurrent):
+    handler = TaskHandlerAgent(
+        {"concurrent_stages": concurrent},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+    )
+    writer = _WritingAgent({"value": 1})
+    sibling, later = _EchoAgent({}), _EchoAgent({})
+    handler.set_stages(
+        [
+            {"name": "writer", "agent": writer},
+            {"name": "sibling", "agent": sibling},
+            {"name": "later", "agent": later, "dependencies": ["writer"]},
+        ]
+    )
+    await handler.run(_context())
+
+    assert writer.seen is not None
+    assert writer.seen["scratch"] == "leaked"
+    assert writer.received_dict
+    assert sibling.seen is not None
+    assert later.seen is not None
+    assert "scratch" not in sibling.seen
+    assert "scratch" not in later.seen
+
+
+class _Opaque:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        return "opaque"
+
+
+@pytest.mark.asyncio
+async def test_stage_cache_skips_values_it_cannot_key_exactly(tmp_path):
+    handler = _handler(tmp_path)
+    cached = _CountingAgent({"value": 1})
+    handler.set_stages([{"name": "cached", "agent": cached, "cache_keys": ["blob"]}])
+
+    await handler.run({**_context(), "blob": _Opaque(1)})
+    await handler.run({**_context(), "blob": _Opaque(2)})
+    assert cached.calls == 2
+    assert not handler._cache
+
+    await handler.run({**_context(), "blob": [1, 2]})
+    await handler.run({**_context(), "blob": [1, 2]})
+    assert cached.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_stage_cache_is_bounded_and_isolated_from_callers(tmp_path):
+    handler = TaskHandlerAgent(
+        {"cache_max_entries": 2},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+    )
+    cached = _CountingAgent({"nested": {"value": 1}})
+    handler.set_stages(
+        [{"name": "cached", "agent": cached, "cache_keys": ["file_path"]}]
+    )
+
+    first = await handler.run(_context())
+    first["stages"]["cached"]["nested"]["value"] = 99
+    second = await handler.run(_context())
+    second["stages"]["cached"]["nested"]["value"] = 42
+    third = await handler.run(_context())
+    assert cached.calls == 1
+    assert third["stages"]["cached"]["nested"] == {"value": 1}
+
+    for path in ("b.txt", "c.txt", "doc.txt"):
+        await handler.run({**_context(), "file_path": path})
+    assert cached.calls == 4
+    assert handler._cache is not None
+    assert len(handler._cache) == 2
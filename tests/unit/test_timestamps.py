@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import time
+
+from bijux_agent.utilities import timestamps
+
+
+def test_formats_are_cached_independently(monkeypatch):
+    clock = iter([0.0, 0.5, 0.9, 1.0])
+    monkeypatch.setattr(timestamps.time, "time", lambda: next(clock))
+    monkeypatch.setattr(timestamps, "_last_formatted", {})
+    calls: list[str] = []
+    strftime = time.strftime
+
+    def counting_strftime(fmt, value):
+        calls.append(fmt)
+        return strftime(fmt, value)
+
+    monkeypatch.setattr(timestamps.time, "strftime", counting_strftime)
+
+    assert timestamps.utc_now_str() == "1970-01-01T00:00:00Z"
+    assert timestamps.utc_now_str(timestamps.AUDIT_UTC_FORMAT) == (
+        "1970-01-01 00:00:00 UTC"
+    )
+    assert timestamps.utc_now_str() == "1970-01-01T00:00:00Z"
+    assert timestamps.utc_now_str() == "1970-01-01T00:00:01Z"
+    assert calls == [
+        timestamps.ISO_UTC_FORMAT,
+        timestamps.AUDIT_UTC_FORMAT,
+        timestamps.ISO_UTC_FORMAT,
+    ]
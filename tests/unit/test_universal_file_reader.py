@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from bijux_agent.agents.file_reader.capabilities.universal_file_reader_core import (
+    UniversalFileReader,
+)
+
+
+@pytest.mark.asyncio
+async def test_read_files_preserves_input_order(tmp_path: Path) -> None:
+    first = tmp_path / "first.txt"
+    first.write_text("alpha", encoding="utf-8")
+    second = tmp_path / "second.md"
+    second.write_text("# beta", encoding="utf-8")
+    missing = tmp_path / "missing.txt"
+
+    reader = UniversalFileReader({})
+    results = await reader.read_files([first, missing, second], concurrency=2)
+
+    assert len(results) == 3
+    assert isinstance(results[0], dict)
+    assert results[0]["text"] == "alpha"
+    assert isinstance(results[1], dict)
+    assert results[1]["error"].startswith("File not found")
+    assert isinstance(results[2], dict)
+    assert results[2]["structure_preview"]["format"] == "md"
+
+
+@pytest.mark.asyncio
+async def test_read_file_rejects_directories_and_oversized_files(
+    tmp_path: Path,
+) -> None:
+    reader = UniversalFileReader({"max_file_bytes": 4})
+
+    directory = await reader.read_file(tmp_path)
+    assert directory["error"].startswith("Path is not a file")
+
+    large = tmp_path / "large.txt"
+    large.write_text("too large", encoding="utf-8")
+    oversized = await reader.read_file(large)
+    assert oversized["error"].startswith("File too large: 9 bytes")
+    assert oversized["file_info"]["file_size_bytes"] == 9
+
+
+@pytest.mark.asyncio
+async def test_compute_file_hash_matches_hashlib(tmp_path: Path) -> None:
+    payload = bytes(range(256)) * 4096
+    path = tmp_path / "blob.bin"
+    path.write_bytes(payload)
+
+    expected = hashlib.sha256(payload).hexdigest()
+
+    chunked = UniversalFileReader({"chunk_size": 1024, "mmap_threshold": 0})
+    assert chunked._hash_buffer_size(path.stat()) >= 1024
+    assert await chunked._compute_file_hash(path) == expected
+
+    mapped = UniversalFileReader({})
+    assert await mapped._compute_file_hash(path) == expected
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert await mapped._compute_file_hash(empty) == hashlib.sha256().hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_read_file_can_skip_structure_preview(tmp_path: Path) -> None:
+    path = tmp_path / "notes.md"
+    path.write_text("# heading\nbody", encoding="utf-8")
+    reader = UniversalFileReader({})
+
+    full = await reader.read_file(path)
+    assert full["structure_preview"]["section_count"] == 1
+
+    lean = await reader.read_file(path, include_preview=False)
+    assert lean["structure_preview"] == {"format": "md"}
+    assert lean["text"] == full["text"]
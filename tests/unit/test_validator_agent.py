@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import operator
+import threading
+from typing import Any
+
+import pytest
+
+from bijux_agent.agents.validator import ValidatorAgent
+from bijux_agent.agents.validator import agent as validator_module
+from bijux_agent.agents.validator.rules import reporting
+from bijux_agent.agents.validator.rules import schema as schema_rules
+from bijux_agent.utilities.logger_manager import LoggerConfig, LoggerManager
+
+_SCHEMA: dict[str, Any] = {
+    "name": {"type": str},
+    "age": {"type": int, "min": 0},
+    "tags": {"type": list, "required": False},
+}
+
+
+def _validator(tmp_path, schema: dict[str, Any] | None = None, **config: Any):
+    return ValidatorAgent(
+        config,
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+        schema=schema or _SCHEMA,
+    )
+
+
+def _context(data: Any) -> dict[str, Any]:
+    return {"task_goal": "validate", "context_id": "validator-unit", "data": data}
+
+
+@pytest.mark.asyncio
+async def test_validation_casts_and_reports_range_errors(tmp_path):
+    validator = _validator(tmp_path)
+    valid = await validator.run(_context({"name": "ada", "age": "36"}))
+    assert valid["valid"] is True
+    assert valid["audit"]["age"]["value"] == 36
+
+    invalid = await validator.run(_context({"name": "ada", "age": -1}))
+    assert invalid["valid"] is False
+    assert invalid["errors"] == ["age: Value -1 is below minimum 0"]
+    assert "schema" not in invalid
+    assert invalid["schema_hash"] == validator.get_schema_hash()
+    assert validator.get_schema() is _SCHEMA
+
+
+@pytest.mark.asyncio
+async def test_schema_is_hashed_once_until_rebound(tmp_path, monkeypatch):
+    validator = _validator(tmp_path)
+    calls: list[dict[str, Any]] = []
+    digest = validator_module.stable_digest
+
+    def counting(value: dict[str, Any], digest_size: int = 32) -> str:
+        calls.append(value)
+        return digest(value, digest_size)
+
+    monkeypatch.setattr(validator_module, "stable_digest", counting)
+    for _ in range(3):
+        await validator.run(_context({"name": "ada", "age": 1}))
+    assert calls == [_SCHEMA]
+
+    validator.schema = {"name": {"type": str}}
+    await validator.run(_context({"name": "ada"}))
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_strict_mode_reports_extra_keys(tmp_path):
+    validator = _validator(tmp_path, strict=True, soft_failure=True)
+    result = await validator.run(_context({"name": "ada", "age": 1, "nick": "a"}))
+    assert result["warnings"] == ["Unexpected extra keys: ['nick']"]
+    assert validator._schema_keys_cache == {"name", "age", "tags"}
+
+    nested = await validator.run(
+        _context({"name": "ada", "age": 1, "tags": [], "meta": {"source": "x"}})
+    )
+    assert nested["warnings"] == ["Unexpected extra keys: ['meta', 'meta.source']"]
+
+
+@pytest.mark.asyncio
+async def test_validation_counters_are_flushed_at_completion(tmp_path):
+    manager = LoggerManager(
+        LoggerConfig(log_dir=tmp_path / "logs", telemetry_enabled=True)
+    )
+    validator = ValidatorAgent({}, manager, schema=_SCHEMA)
+    validator._validation_plugins.append(lambda data, schema, path: ([], {}))
+    await validator.run(_context({"name": "ada", "age": 1}))
+    await validator.run(_context({"name": "ada", "age": 2}))
+
+    metrics = manager.get_metrics()
+    assert metrics["schema_cache_miss"]["value"] == 1
+    assert metrics["schema_cache_hit"]["value"] == 1
+    assert metrics["validation_plugin_runs"]["value"] == 2
+    assert metrics["validation_errors"]["value"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("inline", [False, True])
+async def test_sync_custom_validator_runs_inline_when_configured(tmp_path, inline):
+    threads: list[int] = []
+
+    def check(data: dict[str, Any], config: dict[str, Any]) -> dict[str, Any]:
+        threads.append(threading.get_ident())
+        return {"warnings": ["checked"]}
+
+    validator = ValidatorAgent(
+        {"custom_validator_inline": inline, "soft_failure": True},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+        schema=_SCHEMA,
+        custom_validator=check,
+    )
+    result = await validator.run(_context({"name": "ada", "age": 1}))
+
+    assert result["warnings"] == ["checked"]
+    assert (threads == [threading.get_ident()]) is inline
+
+
+@pytest.mark.asyncio
+async def test_parallel_validators_overlap_custom_validator_and_plugins(tmp_path):
+    order: list[str] = []
+
+    async def check(data: dict[str, Any], config: dict[str, Any]) -> dict[str, Any]:
+        order.append("custom:start")
+        await asyncio.sleep(0)
+        order.append("custom:end")
+        return {"errors": ["custom"], "details": {"ok": False}}
+
+    def audit_plugin(data: Any, schema: dict[str, Any], path: str):
+        order.append("plugin")
+        return ["plugin"], {"seen": True}
+
+    validator = ValidatorAgent(
+        {"parallel_validators": True},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+        schema=_SCHEMA,
+        custom_validator=check,
+    )
+    validator._validation_plugins.append(audit_plugin)
+    result = await validator.run(_context({"name": "ada", "age": 1}))
+
+    assert order == ["custom:start", "plugin", "custom:end"]
+    assert result["errors"] == ["custom", "plugin"]
+    assert result["audit"]["custom_validator"] == {"ok": False}
+    assert result["audit"]["plugin_audit_plugin"] == {"seen": True}
+
+
+@pytest.mark.asyncio
+async def test_custom_validator_is_skipped_for_non_dict_data(tmp_path):
+    calls: list[Any] = []
+
+    def check(data: dict[str, Any], config: dict[str, Any]) -> dict[str, Any]:
+        calls.append(data)
+        return {}
+
+    validator = ValidatorAgent(
+        {"soft_failure": True},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+        schema={},
+        custom_validator=check,
+    )
+    result = await validator.run(_context(["not", "a", "dict"]))
+
+    assert calls == []
+    assert result["warnings"] == ["Custom validator skipped: data is not a dict"]
+
+
+@pytest.mark.asyncio
+async def test_schema_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(validator_module, "_MAX_SCHEMA_CACHE", 2)
+    validator = _validator(tmp_path)
+    first, second, third = ({field: {"type": str}} for field in ("a", "b", "c"))
+
+    for schema in (first, second, first, third):
+        validator.schema = schema
+        await validator.run(_context({}))
+
+    cached = list(validator._schema_cache.values())
+    assert cached == [first, third]
+
+
+@pytest.mark.asyncio
+async def test_dict_schema_is_compiled_once_until_rebound(tmp_path, monkeypatch):
+    validator = _validator(tmp_path)
+    compiled: list[dict[str, Any]] = []
+    compile_schema = validator_module.schema_walker.compile_schema
+
+    def counting(schema: dict[str, Any], path: str = ""):
+        if not path:
+            compiled.append(schema)
+        return compile_schema(schema, path)
+
+    monkeypatch.setattr(validator_module.schema_walker, "compile_schema", counting)
+    for age in (1, 2):
+        await validator.run(_context({"name": "ada", "age": age}))
+    assert compiled == [_SCHEMA]
+
+    nested = {"user": {"type": dict, "schema": {"id": {"type": int}}}}
+    validator.schema = nested
+    result = await validator.run(_context({"user": {"id": "x"}}))
+    assert compiled == [_SCHEMA, nested]
+    assert result["errors"] == [
+        "user.id: Type cast failed (could not convert string to float: 'x')"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_item_schemas_are_compiled_once(tmp_path, monkeypatch):
+    schema = {"records": {"type": list, "schema": [{"id": {"type": int, "min": 0}}]}}
+    validator = _validator(tmp_path, schema=schema)
+    compiled: list[str] = []
+    compile_schema = validator_module.schema_walker.compile_schema
+
+    def counting(schema: dict[str, Any], path: str = ""):
+        compiled.append(path)
+        return compile_schema(schema, path)
+
+    monkeypatch.setattr(validator_module.schema_walker, "compile_schema", counting)
+    records = [{"id": 1}, {"id": -1}, {"id": 2}]
+    first = await validator.run(_context({"records": records}))
+    second = await validator.run(_context({"records": records}))
+
+    assert compiled == ["", ""]
+    assert first["errors"] == ["records[1].id: Value -1 is below minimum 0"]
+    assert second["audit"]["records"]["records[2]"]["records[2].id"]["value"] == 2
+    nested = validator._compiled_schema.rules[0].nested
+    assert isinstance(nested, schema_rules.CompiledListSchema)
+
+
+@pytest.mark.asyncio
+async def test_custom_validator_kind_is_refreshed_when_rebound(tmp_path):
+    def sync_check(data: dict[str, Any], config: dict[str, Any]) -> dict[str, Any]:
+        return {"warnings": ["sync"]}
+
+    async def async_check(
+        data: dict[str, Any], config: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {"warnings": ["async"]}
+
+    validator = ValidatorAgent(
+        {"soft_failure": True},
+        LoggerManager(LoggerConfig(log_dir=tmp_path / "logs")),
+        schema=_SCHEMA,
+        custom_validator=sync_check,
+    )
+    first = await validator.run(_context({"name": "ada", "age": 1}))
+    validator.custom_validator = async_check
+    second = await validator.run(_context({"name": "ada", "age": 1}))
+
+    assert first["warnings"] == ["sync"]
+    assert second["warnings"] == ["async"]
+    assert validator._custom_validator_kind == (async_check, True)
+
+
+@pytest.mark.asyncio
+async def test_audit_timestamps_come_from_the_shared_helper(tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "utc_timestamp", lambda: "2024-01-02 03:04:05 UTC")
+
+    def failing_hook(data: dict[str, Any]) -> dict[str, Any]:
+        raise RuntimeError("boom")
+
+    validator = _validator(tmp_path)
+    result = await validator.run(_context({"name": "ada", "age": 1}))
+    validator.pre_hook = failing_hook
+    failed = await validator.run(_context({"name": "ada", "age": 1}))
+
+    assert result["audit"]["timestamp"] == "2024-01-02 03:04:05 UTC"
+    assert failed["audit"]["timestamp"] == "2024-01-02 03:04:05 UTC"
+
+
+@pytest.mark.asyncio
+async def test_patterns_are_compiled_once_and_invalid_ones_still_fail(tmp_path):
+    schema = {"code": {"type": str, "pattern": r"^[A-Z]{3}$"}}
+    first = schema_rules.compile_schema(schema).rules[0].matcher
+    assert first is schema_rules.compile_schema(dict(schema)).rules[0].matcher
+
+    validator = _validator(tmp_path, schema={"code": {"type": str, "pattern": "("}})
+    result = await validator.run(_context({"code": "ABC"}))
+    assert result["errors"] == [
+        "code: Type cast failed (missing ), unterminated subpattern at position 0)"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_allowed_values_use_a_precomputed_set(tmp_path):
+    schema = {"kind": {"type": list, "allowed": [["a"], ["b"]]}}
+    rule = schema_rules.compile_schema({"mode": {"allowed": ["a", "b"]}}).rules[0]
+    assert rule.allowed_set == frozenset({"a", "b"})
+    assert not rule.check_pattern
+    assert not rule.check_range
+    age = schema_rules.compile_schema(_SCHEMA).rules[1]
+    assert age.check_range
+    assert not age.check_pattern
+    assert schema_rules.compile_schema(schema).rules[0].allowed_set is None
+
+    validator = _validator(tmp_path, schema={"mode": {"type": str, "allowed": "ab"}})
+    substring = await validator.run(_context({"mode": "a"}))
+    assert substring["valid"] is True
+
+    validator.schema = {"mode": {"type": str, "allowed": ("a", "b")}}
+    rejected = await validator.run(_context({"mode": "c"}))
+    assert rejected["errors"] == ["mode: Value 'c' not in allowed set ('a', 'b')"]
+
+
+@pytest.mark.asyncio
+async def test_schema_with_oversized_int_still_validates(tmp_path):
+    validator = _validator(tmp_path, schema={"n": {"type": int, "max": 2**64}})
+    result = await validator.run(_context({"n": 1}))
+    assert result["valid"] is True
+    assert len(result["schema_hash"]) == 32
+
+
+@pytest.mark.asyncio
+async def test_in_place_schema_edits_are_picked_up_after_invalidation(tmp_path):
+    schema: dict[str, Any] = {"name": {"type": str}}
+    validator = _validator(tmp_path, schema=schema, strict=True, soft_failure=True)
+    first = await validator.run(_context({"name": "ada", "m": 1}))
+    assert first["valid"] is True
+    assert first["warnings"] == ["Unexpected extra keys: ['m']"]
+
+    schema["m"] = {"type": int}
+    schema["name"]["pattern"] = r"^[A-Z]"
+    validator.invalidate_schema_cache()
+    second = await validator.run(_context({"name": "ada"}))
+    assert second["errors"] == [
+        "name: Value 'ada' does not match pattern ^[A-Z]",
+        "m: Missing required key.",
+    ]
+    assert second["schema_hash"] != first["schema_hash"]
+    third = await validator.run(_context({"name": "Ada", "m": 1}))
+    assert third["warnings"] == []
+
+
+@pytest.mark.asyncio
+async def test_uncomparable_predicates_do_not_force_recompiles(tmp_path, monkeypatch):
+    schema = {"age": {"type": int, "predicate": functools.partial(operator.le, 0)}}
+    validator = _validator(tmp_path, schema=schema)
+    compiled: list[dict[str, Any]] = []
+    compile_schema = validator_module.schema_walker.compile_schema
+
+    def counting(schema: dict[str, Any], path: str = ""):
+        compiled.append(schema)
+        return compile_schema(schema, path)
+
+    monkeypatch.setattr(validator_module.schema_walker, "compile_schema", counting)
+    results = [await validator.run(_context({"age": age})) for age in (1, 2, -1)]
+
+    assert compiled == [schema]
+    assert [result["valid"] for result in results] == [True, True, False]
+    assert {result["schema_hash"] for result in results} == {
+        validator.get_schema_hash()
+    }